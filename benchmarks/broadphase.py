@@ -0,0 +1,146 @@
+"""Compare the broadphases on the game scene layouts.
+
+    python -m benchmarks.broadphase [--slimes 200 1000 3000] [--frames 120]
+"""
+import argparse
+import random
+import time
+from typing import Callable
+
+from systems.physics.broadphase import Broadphase
+from systems.physics.broadphase.spatial_hash import SpatialHashBroadphase
+from systems.physics.broadphase.sweep_and_prune import SweepAndPruneBroadphase
+from systems.physics.entity import PhysicEntity
+from systems.physics.manager import PhysicSystemManager
+from systems.physics.system.primitive_2d import Primitive2DPhysicsSystem
+from utils.math.primitive_surface import CirclePrimitiveSurface, RectPrimitiveSurface
+from utils.math.vector import Vector
+import settings
+
+
+BROADPHASES: dict[str, Callable[[], Broadphase]] = {
+    "spatial_hash": SpatialHashBroadphase,
+    "sweep_and_prune": SweepAndPruneBroadphase,
+}
+
+
+class TimedBroadphase(Broadphase):
+    """Wraps a broadphase to accumulate the time spent in it."""
+
+    def __init__(self, broadphase: Broadphase):
+        self.broadphase = broadphase
+        self.elapsed = 0.0
+        self.pair_count = 0
+
+    def add_entity(self, entity: PhysicEntity) -> None:
+        self.broadphase.add_entity(entity)
+
+    def remove_entity(self, entity: PhysicEntity) -> None:
+        self.broadphase.remove_entity(entity)
+
+    def update(self) -> None:
+        start = time.perf_counter()
+        self.broadphase.update()
+        self.elapsed += time.perf_counter() - start
+
+    def find_potential_pairs(self) -> list[tuple[PhysicEntity, PhysicEntity]]:
+        start = time.perf_counter()
+        pairs = self.broadphase.find_potential_pairs()
+        self.elapsed += time.perf_counter() - start
+        self.pair_count = len(pairs)
+        return pairs
+
+
+def create_solids() -> list[PhysicEntity]:
+    """Same solids as GameScene: the scene frame, a wall and a circle."""
+    rects = [
+        (settings.WINDOW_WIDTH // 2, -25, settings.WINDOW_WIDTH + 100, 50),
+        (settings.WINDOW_WIDTH // 2, settings.WINDOW_HEIGHT + 25, settings.WINDOW_WIDTH + 100, 50),
+        (-25, settings.WINDOW_HEIGHT // 2, 50, settings.WINDOW_HEIGHT + 100),
+        (settings.WINDOW_WIDTH + 25, settings.WINDOW_HEIGHT // 2, 50, settings.WINDOW_HEIGHT + 100),
+        (400, 300, 300, 50),
+    ]
+    solids = [
+        PhysicEntity(position=Vector(x, y), surface=RectPrimitiveSurface(width=width, height=height), fixed=True)
+        for x, y, width, height in rects
+    ]
+    solids.append(PhysicEntity(position=Vector(500, 500), surface=CirclePrimitiveSurface(radius=10)))
+    return solids
+
+
+def spread_layout(rng: random.Random, count: int) -> list[Vector]:
+    return [Vector(rng.uniform(0, settings.WINDOW_WIDTH), rng.uniform(0, settings.WINDOW_HEIGHT)) for _ in range(count)]
+
+
+def edge_layout(rng: random.Random, count: int) -> list[Vector]:
+    """Slimes hugging the scene frame, the worst case for the grid."""
+    positions = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            x = rng.uniform(0, settings.WINDOW_WIDTH)
+            y = rng.choice((rng.uniform(0, 20), rng.uniform(settings.WINDOW_HEIGHT - 20, settings.WINDOW_HEIGHT)))
+        else:
+            x = rng.choice((rng.uniform(0, 20), rng.uniform(settings.WINDOW_WIDTH - 20, settings.WINDOW_WIDTH)))
+            y = rng.uniform(0, settings.WINDOW_HEIGHT)
+        positions.append(Vector(x, y))
+    return positions
+
+
+def cluster_layout(rng: random.Random, count: int) -> list[Vector]:
+    """GameScene spawn: every slime around the same point."""
+    return [Vector(600, 350) + Vector.random_vector(0, 60) for _ in range(count)]
+
+
+LAYOUTS: dict[str, Callable[[random.Random, int], list[Vector]]] = {
+    "spread": spread_layout,
+    "edge": edge_layout,
+    "cluster": cluster_layout,
+}
+
+
+def run(broadphase_factory: Callable[[], Broadphase], layout: str, slimes: int, frames: int, seed: int) -> tuple[float, float, int]:
+    """Returns (mean ms per broadphase frame, mean ms per physics frame, mean pair count)."""
+    rng = random.Random(seed)
+    random.seed(seed)
+    broadphase = TimedBroadphase(broadphase_factory())
+    manager = PhysicSystemManager(Primitive2DPhysicsSystem(broadphase))
+    manager.add_entities(create_solids())
+    bodies = [
+        PhysicEntity(position=position, surface=CirclePrimitiveSurface(radius=settings.ENTITY_RADIUS), fixed=False)
+        for position in LAYOUTS[layout](rng, slimes)
+    ]
+    manager.add_entities(bodies)
+    manager.step(1 / settings.FPS)
+    broadphase.elapsed = 0.0
+
+    physics_time = 0.0
+    pair_count = 0
+    for _ in range(frames):
+        for body in bodies:
+            body.acc = Vector.random_unit_vector() * settings.ENTITY_ACCELERATION
+
+        start = time.perf_counter()
+        manager.step(1 / settings.FPS)
+        physics_time += time.perf_counter() - start
+        pair_count += broadphase.pair_count
+
+    return broadphase.elapsed / frames * 1000, physics_time / frames * 1000, pair_count // frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slimes", type=int, nargs="+", default=[200, 1000])
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'layout':<8} {'slimes':>6} {'broadphase':<16} {'broadphase ms':>13} {'physics ms':>10} {'pairs':>7}")
+    for layout in LAYOUTS:
+        for slimes in args.slimes:
+            for name, factory in BROADPHASES.items():
+                broadphase_ms, physics_ms, pairs = run(factory, layout, slimes, args.frames, args.seed)
+                print(f"{layout:<8} {slimes:>6} {name:<16} {broadphase_ms:>13.2f} {physics_ms:>10.2f} {pairs:>7}")
+
+
+if __name__ == "__main__":
+    main()
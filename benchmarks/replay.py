@@ -0,0 +1,84 @@
+"""Replay a recorded session headless and report its frame times.
+
+    python -m benchmarks.replay session.rec [--runs 5] [--draw]
+
+Record a session with: python main.py --record session.rec [--seed 7]
+"""
+import argparse
+import math
+import os
+import statistics
+import time
+
+# no window and no audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from scenes.scene import SceneManager
+from systems.event_bus import EventBus
+from systems.inputs.recording import InputRecording
+from utils.seeding import seed_all
+import settings
+
+
+def configure_deterministic() -> None:
+    """Settings a replay needs to take the same decisions on every run and machine."""
+    settings.AUDIO_OUTPUT = False
+    # the physics thread steps on its own schedule
+    settings.PHYSICS_THREADED = False
+    # a time budget would make the AI decisions depend on the machine speed
+    settings.AI_FRAME_BUDGET_MS = math.inf
+
+
+def replay(recording: InputRecording, scene: str = "game", draw: bool = False) -> tuple[SceneManager, list[float]]:
+    """Feed the recording to a fresh scene, returns the scene manager and the frame times in seconds."""
+    # scenes register themselves on import
+    import scenes.scenes.game_scene  # noqa: F401
+
+    seed_all(recording.seed)
+    scene_manager = SceneManager()
+    scene_manager.switch_scene(scene)
+    scene_manager.start_active_scene()
+    screen = pygame.Surface((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT)) if draw else None
+
+    frame_times = []
+    try:
+        for frame in recording:
+            start = time.perf_counter()
+            scene_manager.handle_events(frame.raw_input)
+            scene_manager.update(frame.dt)
+            if screen is not None:
+                scene_manager.draw(screen)
+            EventBus.active().end_frame()
+            frame_times.append(time.perf_counter() - start)
+            if any(event.type == pygame.QUIT for event in frame.raw_input.events):
+                break
+    finally:
+        scene_manager.active_scene.quit()
+    return scene_manager, frame_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording")
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--scene", default="game")
+    parser.add_argument("--draw", action="store_true", help="also render every frame to an offscreen surface")
+    args = parser.parse_args()
+
+    pygame.init()
+    configure_deterministic()
+    recording = InputRecording(args.recording)
+    print(f"{'run':>4} {'frames':>7} {'mean ms':>8} {'p50 ms':>7} {'p95 ms':>7} {'max ms':>7}")
+    for run in range(args.runs):
+        _, frame_times = replay(recording, args.scene, args.draw)
+        times = sorted(frame_time * 1000 for frame_time in frame_times)
+        print(
+            f"{run:>4} {len(times):>7} {statistics.fmean(times):>8.2f} {times[len(times) // 2]:>7.2f}"
+            f" {times[int(len(times) * 0.95)]:>7.2f} {times[-1]:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Time the `position += vel * dt` pattern with Vector and with MutableVector.
+
+    python -m benchmarks.vector [--steps 20000] [--repeat 5]
+"""
+import argparse
+import timeit
+
+from utils.math.vector import Vector, MutableVector
+
+
+def accumulate_vector(steps: int) -> Vector:
+    position = Vector(0, 0)
+    vel = Vector(1, 2)
+    for _ in range(steps):
+        position += vel * 0.016
+    return position
+
+
+def accumulate_mutable_vector(steps: int) -> MutableVector:
+    position = MutableVector(0, 0)
+    vel = Vector(1, 2)
+    for _ in range(steps):
+        position.add_scaled(vel, 0.016)
+    return position
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    vector_time = min(timeit.repeat(lambda: accumulate_vector(args.steps), number=1, repeat=args.repeat))
+    mutable_time = min(timeit.repeat(lambda: accumulate_mutable_vector(args.steps), number=1, repeat=args.repeat))
+    print(
+        f"{args.steps} steps: Vector {vector_time * 1000:.2f} ms, "
+        f"MutableVector {mutable_time * 1000:.2f} ms ({vector_time / mutable_time:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
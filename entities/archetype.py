@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from typing import Any
+
+from entities.entity import Entity
+
+
+Signature = frozenset[type]
+
+
+def components_of(entity: Entity) -> dict[type, Any]:
+    """Components of an entity keyed by their type.
+
+    The data storage and the action controller count as components so that
+    systems can select e.g. every entity with an AliveDataStorage.
+    """
+    components = {}
+    for component in (
+        entity.physics_entity,
+        entity.graphic_entity,
+        entity.audio_entity,
+        entity.action_entity,
+        entity.data_entity,
+    ):
+        if component is not None:
+            components[type(component)] = component
+    if entity.data_entity is not None and entity.data_entity.data_storage is not None:
+        components[type(entity.data_entity.data_storage)] = entity.data_entity.data_storage
+    if entity.action_entity is not None and entity.action_entity.controller is not None:
+        components[type(entity.action_entity.controller)] = entity.action_entity.controller
+    return components
+
+
+def signature_of(entity: Entity) -> Signature:
+    return frozenset(components_of(entity))
+
+
+class Archetype:
+    """Table of the entities sharing one signature, one dense column per component type."""
+
+    def __init__(self, signature: Signature):
+        self.signature = signature
+        self.entities: list[Entity] = []
+        self.columns: dict[type, list] = {component_type: [] for component_type in signature}
+        self.rows: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def column(self, component_type: type) -> list:
+        """Column of the signature type that is (a subclass of) component_type."""
+        column = self.columns.get(component_type)
+        if column is not None:
+            return column
+        for signature_type, column in self.columns.items():
+            if issubclass(signature_type, component_type):
+                return column
+        raise KeyError(component_type)
+
+    def matches(self, component_types: tuple[type, ...]) -> bool:
+        return all(
+            any(issubclass(signature_type, component_type) for signature_type in self.signature)
+            for component_type in component_types
+        )
+
+    def append(self, entity: Entity, components: dict[type, Any]) -> None:
+        self.rows[entity.id] = len(self.entities)
+        self.entities.append(entity)
+        for component_type, component in components.items():
+            self.columns[component_type].append(component)
+
+    def remove(self, entity: Entity) -> None:
+        # swap the last row into the hole
+        row = self.rows.pop(entity.id)
+        last = len(self.entities) - 1
+        if row != last:
+            moved = self.entities[last]
+            self.entities[row] = moved
+            for column in self.columns.values():
+                column[row] = column[last]
+            self.rows[moved.id] = row
+        self.entities.pop()
+        for column in self.columns.values():
+            column.pop()
+
+
+class ArchetypeStore:
+    def __init__(self):
+        self.archetypes: dict[Signature, Archetype] = {}
+        self.archetype_of: dict[int, Archetype] = {}
+        self._query_cache: dict[tuple[type, ...], list[Archetype]] = {}
+        self._id_counter: int = 0
+
+    def __len__(self) -> int:
+        return len(self.archetype_of)
+
+    def __contains__(self, entity: Entity) -> bool:
+        return entity.id is not None and entity.id in self.archetype_of
+
+    def add(self, entity: Entity) -> None:
+        if entity.id is None:
+            self._id_counter += 1
+            entity.id = self._id_counter
+        elif entity.id in self.archetype_of:
+            raise ValueError(f"Entity {entity.id} is already stored")
+        self._insert(entity)
+
+    def remove(self, entity: Entity) -> None:
+        archetype = self.archetype_of.pop(entity.id, None)
+        if archetype is not None:
+            archetype.remove(entity)
+
+    def refresh(self, entity: Entity) -> None:
+        """Move an entity whose components changed to its new archetype."""
+        self.archetype_of[entity.id].remove(entity)
+        self._insert(entity)
+
+    def query(self, *component_types: type) -> list[Archetype]:
+        """Archetypes holding every requested component type (subclasses match)."""
+        archetypes = self._query_cache.get(component_types)
+        if archetypes is None:
+            archetypes = [a for a in self.archetypes.values() if a.matches(component_types)]
+            self._query_cache[component_types] = archetypes
+        return archetypes
+
+    def _insert(self, entity: Entity) -> None:
+        components = components_of(entity)
+        signature = frozenset(components)
+        archetype = self.archetypes.get(signature)
+        if archetype is None:
+            archetype = self.archetypes[signature] = Archetype(signature)
+            self._query_cache.clear()
+        archetype.append(entity, components)
+        self.archetype_of[entity.id] = archetype
@@ -0,0 +1,50 @@
+from dataclasses import dataclass, field
+from enum import Enum, auto
+from typing import Any
+
+from entities.entity import Entity
+
+
+COMPONENT_NAMES = ("physics_entity", "graphic_entity", "audio_entity", "action_entity", "data_entity")
+
+
+class CommandKind(Enum):
+    SPAWN = auto()
+    DESPAWN = auto()
+    SET_COMPONENTS = auto()
+
+
+@dataclass(slots=True)
+class EntityCommand:
+    kind: CommandKind
+    entity: Entity
+    components: dict[str, Any] = field(default_factory=dict)
+    recycle: bool = False
+
+
+class CommandBuffer:
+    """Structural entity changes recorded during a frame, applied later in one batch."""
+
+    def __init__(self):
+        self.commands: list[EntityCommand] = []
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def spawn(self, entity: Entity) -> None:
+        self.commands.append(EntityCommand(CommandKind.SPAWN, entity))
+
+    def despawn(self, entity: Entity, recycle: bool = False) -> None:
+        """recycle hands the entity back to the entity pool once removed."""
+        self.commands.append(EntityCommand(CommandKind.DESPAWN, entity, recycle=recycle))
+
+    def set_components(self, entity: Entity, **components: Any) -> None:
+        """Add (or with None, drop) components, e.g. set_components(entity, graphic_entity=None)."""
+        for name in components:
+            if name not in COMPONENT_NAMES:
+                raise ValueError(f"Unknown entity component '{name}'")
+        self.commands.append(EntityCommand(CommandKind.SET_COMPONENTS, entity, components))
+
+    def drain(self) -> list[EntityCommand]:
+        commands, self.commands = self.commands, []
+        return commands
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     # from systems.items import InventoryComponent
     from systems.actions.action_entity import ActionEntity
     from systems.data.entity import DataEntity
+    from utils.math.vector import Vector
 
 
 class Entity:
@@ -32,10 +33,23 @@ class Entity:
         self.entity_type = entity_type
         self.action_entity = action_entity
         self.data_entity = data_entity
+        self.id: int | None = None
+
+    def reset(self, position: Vector, active_surface: str = None) -> None:
+        """Bring a recycled entity back to its spawn state at position."""
+        if self.physics_entity is not None:
+            self.physics_entity.reset(position)
+        if self.graphic_entity is not None:
+            self.graphic_entity.reset(position, active_surface or self.graphic_entity.active_surface)
+        if self.action_entity is not None:
+            self.action_entity.reset()
+        if self.data_entity is not None and self.data_entity.data_storage is not None:
+            self.data_entity.data_storage.reset()
 
     def __repr__(self):
         return (
             "Entity(\n"
+            f"  id={self.id},\n"
             f"  physics_entity={self.physics_entity},\n"
             f"  graphic_entity={self.graphic_entity},\n"
             f"  audio_entity={self.audio_entity},\n"
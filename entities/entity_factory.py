@@ -1,3 +1,5 @@
+from functools import partial
+
 from entities.entity import Entity
 from utils.math.vector import Vector
 from utils.math.primitive_surface import (
@@ -6,108 +8,71 @@ from utils.math.primitive_surface import (
     RotatedRectPrimitiveSurface,
 )
 from systems.physics.entity import PhysicEntity
+from systems.physics.collision_layer import CollisionLayer
 from systems.graphics.entity import GraphicEntity
 from systems.graphics.system import RenderSystemID
 from systems.actions.controller.player import PlayerActionController
 from systems.actions.system.alive import AliveActionSystem
 from systems.actions.controller.ia import AIActionController
 from entities.entity_type import EntityType
+from entities.entity_template import (
+    TemplateRegistry,
+    EntityTemplate,
+    PhysicsTemplate,
+    GraphicTemplate,
+    ActionTemplate,
+)
 from systems.ia_components.slime_ia import SlimeIA
-from systems.audio.entity import AudioEntity
 from systems.audio.synth.sound import SynthSound
 from systems.audio.play_policy import PlayPolicy
 from systems.audio.synth.wave_type import WaveType
-from systems.actions.action_entity import ActionEntity, ActionControllerID, ActionSystemID
-from systems.data.entity import DataEntity
+from systems.actions.action_entity import ActionControllerID, ActionSystemID
 from systems.data.storage.alive import AliveDataStorage
 from systems.graphics.surface import CircleGraphicSurface, RectGraphicSurface
 import settings
 
 
+_ALIVE_SURFACES = {
+    "walk": CircleGraphicSurface(radius=settings.ENTITY_RADIUS, color=(0, 255, 0)),
+    "static": CircleGraphicSurface(radius=settings.ENTITY_RADIUS, color=(125, 125, 125)),
+    "dead": CircleGraphicSurface(radius=settings.ENTITY_RADIUS, color=(255, 0, 0)),
+    "attaque": CircleGraphicSurface(radius=settings.ENTITY_RADIUS, color=(0, 0, 255)),
+}
+
+TEMPLATES = TemplateRegistry()
+TEMPLATES.register("player", EntityTemplate(
+    entity_type=EntityType.PLAYER,
+    physics=PhysicsTemplate(surface=CirclePrimitiveSurface(radius=settings.ENTITY_RADIUS), fixed=False, mass=40, category=CollisionLayer.ALIVE),
+    graphic=GraphicTemplate(surfaces=_ALIVE_SURFACES, active_surface="static", z_index=100, system_id=RenderSystemID.WORLD),
+    sounds={
+        "walk": SynthSound(freq=440, amp=1, duration=0.2, wave_type=WaveType.SIN, play_policy=PlayPolicy.RESTART)
+    },
+    action=ActionTemplate(controller_id=ActionControllerID.PLAYER, system_id=ActionSystemID.ALIVE),
+    data_storage=partial(AliveDataStorage, max_life=100),
+))
+TEMPLATES.register("slime", EntityTemplate(
+    entity_type=EntityType.SLIME,
+    physics=PhysicsTemplate(surface=CirclePrimitiveSurface(radius=settings.ENTITY_RADIUS), fixed=False, mass=1, category=CollisionLayer.ALIVE),
+    graphic=GraphicTemplate(surfaces=_ALIVE_SURFACES, active_surface="static", z_index=100, system_id=RenderSystemID.WORLD),
+    action=ActionTemplate(controller_id=ActionControllerID.AI_SLIME, system_id=ActionSystemID.ALIVE),
+    data_storage=partial(AliveDataStorage, max_life=50),
+))
+
+
 class EntityFactory:
     # ======= PLAYER ENTITIES =======
     @staticmethod
     def create_player(x: float, y: float) -> Entity:
-        return Entity(
-            physics_entity=PhysicEntity(position=Vector(x, y), surface=CirclePrimitiveSurface(radius=settings.ENTITY_RADIUS), fixed=False, mass=40),
-
-            graphic_entity=GraphicEntity(
-                position=Vector(x, y),
-                system_id=RenderSystemID.WORLD,
-                visible=True,
-                z_index=100,
-                active_surface="static",
-                surfaces={
-                    "walk": CircleGraphicSurface(
-                        radius=settings.ENTITY_RADIUS,
-                        color=(0, 255, 0),
-                    ),
-                    "static": CircleGraphicSurface(
-                        radius=settings.ENTITY_RADIUS,
-                        color=(125, 125, 125),
-                    ),
-                    "dead": CircleGraphicSurface(
-                        radius=settings.ENTITY_RADIUS,
-                        color=(255, 0, 0),
-                    ),
-                    "attaque": CircleGraphicSurface(
-                        radius=settings.ENTITY_RADIUS,
-                        color=(0, 0, 255),
-                    ),
-                }
-            ),
-            audio_entity=AudioEntity({
-                "walk": SynthSound(freq=440, amp=1, duration=0.2, wave_type=WaveType.SIN, play_policy=PlayPolicy.RESTART)
-            }),
-            action_entity=ActionEntity(
-                controller_id=ActionControllerID.PLAYER,
-                system_id=ActionSystemID.ALIVE,
-            ),
-            data_entity=DataEntity(
-                data_storage=AliveDataStorage(max_life=100)
-            ),
-            entity_type=EntityType.PLAYER
-        )
+        return TEMPLATES.create("player", x, y)
 
     # ======= IA ENTITIES =======
     @staticmethod
     def create_slime(x: float, y: float) -> Entity:
-        return Entity(
-            physics_entity=PhysicEntity(position=Vector(x, y), surface=CirclePrimitiveSurface(radius=settings.ENTITY_RADIUS), fixed=False, mass=1),
-            action_entity=ActionEntity(
-                controller_id=ActionControllerID.AI_SLIME,
-                system_id=ActionSystemID.ALIVE,
-            ),
-            data_entity=DataEntity(
-                data_storage=AliveDataStorage(max_life=50)
-            ),
-            graphic_entity=GraphicEntity(
-                position=Vector(x, y),
-                system_id=RenderSystemID.WORLD,
-                visible=True,
-                z_index=100,
-                active_surface="static",
-                surfaces={
-                    "walk": CircleGraphicSurface(
-                        radius=settings.ENTITY_RADIUS,
-                        color=(0, 255, 0),
-                    ),
-                    "static": CircleGraphicSurface(
-                        radius=settings.ENTITY_RADIUS,
-                        color=(125, 125, 125),
-                    ),
-                    "dead": CircleGraphicSurface(
-                        radius=settings.ENTITY_RADIUS,
-                        color=(255, 0, 0),
-                    ),
-                    "attaque": CircleGraphicSurface(
-                        radius=settings.ENTITY_RADIUS,
-                        color=(0, 0, 255),
-                    ),
-                }
-            ),
-            entity_type=EntityType.SLIME
-        )
+        return TEMPLATES.create("slime", x, y)
+
+    @staticmethod
+    def create_slimes(positions: list[tuple[float, float]]) -> list[Entity]:
+        return TEMPLATES.create_many("slime", positions)
 
 
     # ======= VISUAL ENTITIES =======
@@ -125,11 +90,28 @@ class EntityFactory:
             entity_type=EntityType.VISUAL
         )
 
+    @staticmethod
+    def create_visual_trigger(x: float, y: float, radius: float = 10) -> Entity:
+        return Entity(
+            physics_entity=PhysicEntity(position=Vector(x, y), surface=CirclePrimitiveSurface(radius=radius), fixed=True, category=CollisionLayer.TRIGGER, mask=CollisionLayer.ALIVE, sensor=True),
+            graphic_entity=GraphicEntity(position=Vector(x, y), surfaces={"static": CircleGraphicSurface(radius=radius, color=(0, 0, 255))}, active_surface="static", z_index=85),
+            entity_type=EntityType.VISUAL
+        )
+
+    # ======= ITEM ENTITIES =======
+    @staticmethod
+    def create_item(x: float, y: float, radius: float = 2) -> Entity:
+        return Entity(
+            physics_entity=PhysicEntity(position=Vector(x, y), surface=CirclePrimitiveSurface(radius=radius), fixed=True, category=CollisionLayer.ITEM, mask=CollisionLayer.ALIVE, sensor=True),
+            graphic_entity=GraphicEntity(position=Vector(x, y), surfaces={"static": CircleGraphicSurface(radius=radius, color=(255, 255, 0))}, active_surface="static", z_index=90),
+            entity_type=EntityType.ITEM
+        )
+
     # ======= SOLID ENTITIES =======
     @staticmethod
     def create_solid_rect(x: float, y: float, width: float = 10, height: float = 10) -> Entity:
         return Entity(
-            physics_entity=PhysicEntity(position=Vector(x, y), surface=RectPrimitiveSurface(width=width, height=height), fixed=True),
+            physics_entity=PhysicEntity(position=Vector(x, y), surface=RectPrimitiveSurface(width=width, height=height), fixed=True, category=CollisionLayer.SOLID),
             graphic_entity=GraphicEntity(position=Vector(x, y), surfaces={"static": RectGraphicSurface(width=width, height=height, color=(255, 0, 255))}, active_surface="static"),
             entity_type=EntityType.SOLID
         )
@@ -138,14 +120,14 @@ class EntityFactory:
     @staticmethod
     def create_solid_rotated_rect_list(x: float, y: float, width: float = 10, height: float = 10, rotation: float = 45) -> Entity:
         return Entity(
-            physics_entity=PhysicEntity(position=Vector(x, y), surface=RotatedRectPrimitiveSurface(width=width, height=height, rotation=rotation), fixed=True),
+            physics_entity=PhysicEntity(position=Vector(x, y), surface=RotatedRectPrimitiveSurface(width=width, height=height, rotation=rotation), fixed=True, category=CollisionLayer.SOLID),
             entity_type=EntityType.SOLID
         )
 
     @staticmethod
     def create_solid_circle(x: float, y: float, radius: float = 10) -> Entity:
         return Entity(
-            physics_entity=PhysicEntity(position=Vector(x, y), surface=CirclePrimitiveSurface(radius=radius), fixed=False),
+            physics_entity=PhysicEntity(position=Vector(x, y), surface=CirclePrimitiveSurface(radius=radius), fixed=False, category=CollisionLayer.SOLID),
             graphic_entity=GraphicEntity(position=Vector(x, y), surfaces={"static": CircleGraphicSurface(radius=radius, color=(0, 0, 255))}, active_surface="static"),
             entity_type=EntityType.SOLID
         )
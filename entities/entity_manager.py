@@ -1,78 +1,172 @@
 from entities.entity import Entity
+from entities.archetype import ArchetypeStore
+from entities.entity_pool import EntityPool
+from entities.command_buffer import CommandBuffer, CommandKind
+from utils.containers import DenseList
 from systems.graphics.entity import GraphicEntity
 from systems.physics.manager import PhysicSystemManager
 from systems.physics.entity import PhysicEntity
 from systems.graphics.manager import GraphicSystemManager
 from systems.actions.manager import ActionSystemManager
 from systems.actions.action_entity import ActionEntity
-from systems.actions.controller.ia import AIActionController, EntityPerception, EntityInfo
+from systems.actions.controller.ia import AIActionController, BatchAIActionController, EntityPerception, EntityInfo
+from systems.ia_components.ia_component import BatchIAComponent
 from systems.actions.action_entity import ActionControllerID
 from systems.data.storage.alive import AliveDataStorage
 
 
 class EntityManager:
-    def __init__(self, physics_system_manager: PhysicSystemManager, graphic_system_manager: GraphicSystemManager, action_system_manager: ActionSystemManager):
-        self.entities: list[Entity] = []
+    def __init__(self, physics_system_manager: PhysicSystemManager, graphic_system_manager: GraphicSystemManager, action_system_manager: ActionSystemManager, entity_pool: EntityPool = None):
+        self.entities = DenseList[Entity]()
         self.physics_system_manager = physics_system_manager
         self.graphic_system_manager = graphic_system_manager
         self.action_system_manager = action_system_manager
+        self.entities_by_physics_id: dict[int, Entity] = {}
+        self.archetypes = ArchetypeStore()
+        # despawned entities go back to the pool when one is given
+        self.entity_pool = entity_pool
+        # structural changes requested during a frame, applied by flush()
+        self.commands = CommandBuffer()
+        # batched IAs found on the registered controllers, evaluated once per frame
+        self.ia_batches: dict[int, BatchIAComponent] = {}
 
     def add_entity(self, entity: Entity) -> None:
-        self.entities.append(entity)
-        if entity.physics_entity and isinstance(entity.physics_entity, PhysicEntity):
-            self.physics_system_manager.add_entity(entity.physics_entity)
-        if entity.graphic_entity and isinstance(entity.graphic_entity, GraphicEntity):
-            self.graphic_system_manager.add_entity(entity.graphic_entity)
-        if entity.action_entity and isinstance(entity.action_entity, ActionEntity):
-            self.action_system_manager.add_entity(entity)
+        self.add_entities([entity])
 
     def add_entities(self, entities: list[Entity]) -> None:
         self.entities.extend(entities)
+        # each manager registers its part in one batch (one sort for the ordered ones)
+        physics_entities = [
+            entity.physics_entity for entity in entities
+            if entity.physics_entity and isinstance(entity.physics_entity, PhysicEntity)
+        ]
+        self.physics_system_manager.add_entities(physics_entities)
+        self.graphic_system_manager.add_entities([
+            entity.graphic_entity for entity in entities
+            if entity.graphic_entity and isinstance(entity.graphic_entity, GraphicEntity)
+        ])
+        self.action_system_manager.add_entities([
+            entity for entity in entities
+            if entity.action_entity and isinstance(entity.action_entity, ActionEntity)
+        ])
         for entity in entities:
             if entity.physics_entity and isinstance(entity.physics_entity, PhysicEntity):
-                self.physics_system_manager.add_entity(entity.physics_entity)
-            if entity.graphic_entity and isinstance(entity.graphic_entity, GraphicEntity):
-                self.graphic_system_manager.add_entity(entity.graphic_entity)
-            if entity.action_entity and isinstance(entity.action_entity, ActionEntity):
-                self.action_system_manager.add_entity(entity)
+                self.entities_by_physics_id[entity.physics_entity.id] = entity
+            self.archetypes.add(entity)
+            batch = _batch_of(entity)
+            if batch is not None:
+                self.ia_batches.setdefault(id(batch), batch).add(entity)
 
     def remove_entity(self, entity: Entity) -> None:
         self.entities.remove(entity)
+        self.archetypes.remove(entity)
         if entity.physics_entity and isinstance(entity.physics_entity, PhysicEntity):
             self.physics_system_manager.remove_entity(entity.physics_entity)
+            self.entities_by_physics_id.pop(entity.physics_entity.id, None)
         if entity.graphic_entity and isinstance(entity.graphic_entity, GraphicEntity):
             self.graphic_system_manager.remove_entity(entity.graphic_entity)
         if entity.action_entity and isinstance(entity.action_entity, ActionEntity):
             self.action_system_manager.remove_entity(entity)
+            batch = _batch_of(entity)
+            if batch is not None:
+                batch.remove(entity)
 
     def update_all(self, dt: float) -> None:
-        entities_to_remove = []
-        
-        for entity in self.entities:
-            if entity.data_entity and isinstance(entity.data_entity.data_storage, AliveDataStorage):
-                data = entity.data_entity.data_storage
+        archetypes = self.archetypes
+        for archetype in archetypes.query(AliveDataStorage):
+            for entity, data in zip(archetype.entities, archetype.column(AliveDataStorage)):
                 if data.dead and data.time_before_delete < 0:
-                    entities_to_remove.append(entity)
-                    continue
-            
-            if entity.action_entity and entity.action_entity.controller and isinstance(entity.action_entity.controller, AIActionController):
-                entity.action_entity.controller.update_perception(EntityPerception(
-                    entities=[
-                        EntityInfo(
-                            type=e.entity_type,
-                            distance=e.physics_entity.position - entity.physics_entity.position,
-                            entity=e
-                        )
-                        for e in self.entities
-                        if e.physics_entity and isinstance(e.physics_entity, PhysicEntity) and e != entity
-                    ]
-                ))
-            if entity.physics_entity and isinstance(entity.physics_entity, PhysicEntity):
-                entity.graphic_entity.position = entity.physics_entity.position
-        
-        for entity in entities_to_remove:
-            self.remove_entity(entity)
+                    self.commands.despawn(entity, recycle=True)
+
+        # with a scheduler, only the entities deciding this frame need to perceive
+        scheduler = self.action_system_manager.scheduler
+        for archetype in archetypes.query(AIActionController, PhysicEntity):
+            for entity, controller in zip(archetype.entities, archetype.column(AIActionController)):
+                if scheduler is None or scheduler.is_due(entity):
+                    controller.update_perception(self._perceive(entity, controller))
+        for batch in self.ia_batches.values():
+            batch.evaluate(self.physics_system_manager.position_of)
+
+        interpolated_position = self.physics_system_manager.interpolated_position
+        for archetype in archetypes.query(PhysicEntity, GraphicEntity):
+            for physics_entity, graphic_entity in zip(archetype.column(PhysicEntity), archetype.column(GraphicEntity)):
+                graphic_entity.position = interpolated_position(physics_entity)
+
+    def flush(self) -> None:
+        """Apply the queued commands: removals first, then component changes, then one batched add."""
+        commands = self.commands.drain()
+        if not commands:
+            return
+
+        # last spawn/despawn wins, an entity despawned then spawned again is re-registered
+        final_kind: dict[int, CommandKind] = {}
+        touched: dict[int, Entity] = {}
+        recycled: dict[int, Entity] = {}
+        for command in commands:
+            key = id(command.entity)
+            touched[key] = command.entity
+            if command.kind == CommandKind.SET_COMPONENTS:
+                final_kind.setdefault(key, CommandKind.SPAWN if command.entity in self.entities else CommandKind.DESPAWN)
+            else:
+                final_kind[key] = command.kind
+                if command.kind == CommandKind.DESPAWN and command.recycle:
+                    recycled[key] = command.entity
+                else:
+                    recycled.pop(key, None)
+
+        for entity in touched.values():
+            if entity in self.entities:
+                self.remove_entity(entity)
+        for command in commands:
+            if command.kind == CommandKind.SET_COMPONENTS:
+                for name, component in command.components.items():
+                    setattr(command.entity, name, component)
+        self.add_entities([entity for key, entity in touched.items() if final_kind[key] == CommandKind.SPAWN])
+
+        if self.entity_pool is not None:
+            for entity in recycled.values():
+                self.entity_pool.release(entity)
+
+    def _perceive(self, entity: Entity, controller: AIActionController) -> EntityPerception:
+        """Neighbours within the controller's perception radius, optionally filtered by type."""
+        position_of = self.physics_system_manager.position_of
+        position = position_of(entity.physics_entity)
+        radius = controller.perception_radius
+        types = controller.perception_types
+
+        if radius is None:
+            candidates = [e for archetype in self.archetypes.query(PhysicEntity) for e in archetype.entities]
+        else:
+            entities_by_physics_id = self.entities_by_physics_id
+            candidates = [
+                entities_by_physics_id[physics_entity.id]
+                for physics_entity in self.physics_system_manager.query_radius(position, radius)
+                if physics_entity.id in entities_by_physics_id
+            ]
+        # ids follow registration order, perception lists keep it
+        candidates.sort(key=_entity_id)
+
+        perceived = []
+        for e in candidates:
+            if e is entity or (types is not None and e.entity_type not in types):
+                continue
+            distance = position_of(e.physics_entity) - position
+            # the query ran on the live bodies, position_of may read a snapshot
+            if radius is not None and distance.length_squared > radius * radius:
+                continue
+            perceived.append(EntityInfo(type=e.entity_type, distance=distance, entity=e))
+        return EntityPerception(entities=perceived)
 
     def cleanup(self) -> None:
         pass
 
+
+def _entity_id(entity: Entity) -> int:
+    return entity.id
+
+
+def _batch_of(entity: Entity) -> BatchIAComponent | None:
+    action_entity = entity.action_entity
+    if action_entity and isinstance(action_entity.controller, BatchAIActionController):
+        return action_entity.controller.batch
+    return None
@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from typing import Callable
+
+from entities.entity import Entity
+from entities.entity_type import EntityType
+from utils.math.vector import Vector
+import settings
+
+
+EntityConstructor = Callable[[float, float], Entity]
+
+
+@dataclass(slots=True)
+class PoolStats:
+    hits: int = 0
+    misses: int = 0
+    released: int = 0
+    discarded: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+
+class EntityPool:
+    """Recycles despawned entities of the registered types.
+
+    acquire hands back a released entity reset to its spawn state, or builds a
+    new one with the registered constructor when the pool is empty.
+    """
+
+    def __init__(
+        self,
+        constructors: dict[EntityType, EntityConstructor],
+        max_size: int = settings.ENTITY_POOL_MAX_SIZE,
+    ):
+        self.constructors = constructors
+        self.max_size = max_size
+        self.pools: dict[EntityType, list[Entity]] = {entity_type: [] for entity_type in constructors}
+        self.stats: dict[EntityType, PoolStats] = {entity_type: PoolStats() for entity_type in constructors}
+        self._spawn_surfaces: dict[EntityType, str] = {}
+
+    def acquire(self, entity_type: EntityType, x: float, y: float) -> Entity:
+        pool = self.pools.get(entity_type)
+        if pool is None:
+            raise ValueError(f"No constructor registered for entity type '{entity_type}'")
+        if pool:
+            self.stats[entity_type].hits += 1
+            entity = pool.pop()
+            entity.reset(Vector(x, y), self._spawn_surfaces.get(entity_type))
+            return entity
+        self.stats[entity_type].misses += 1
+        return self._create(entity_type, x, y)
+
+    def release(self, entity: Entity) -> bool:
+        """Keep a despawned entity for reuse, False when it is not pooled."""
+        pool = self.pools.get(entity.entity_type)
+        if pool is None:
+            return False
+        if len(pool) >= self.max_size:
+            self.stats[entity.entity_type].discarded += 1
+            return False
+        self.stats[entity.entity_type].released += 1
+        pool.append(entity)
+        return True
+
+    def prefill(self, entity_type: EntityType, count: int) -> None:
+        """Build entities ahead of a wave, e.g. at scene load."""
+        if entity_type not in self.pools:
+            raise ValueError(f"No constructor registered for entity type '{entity_type}'")
+        pool = self.pools[entity_type]
+        for _ in range(min(count, self.max_size - len(pool))):
+            pool.append(self._create(entity_type, 0, 0))
+
+    def _create(self, entity_type: EntityType, x: float, y: float) -> Entity:
+        entity = self.constructors[entity_type](x, y)
+        if entity.graphic_entity is not None:
+            self._spawn_surfaces.setdefault(entity_type, entity.graphic_entity.active_surface)
+        return entity
@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping, Optional
+
+from entities.entity import Entity
+from entities.entity_type import EntityType
+from systems.actions.action_entity import ActionEntity, ActionControllerID, ActionSystemID
+from systems.audio.entity import AudioEntity
+from systems.audio.sound import Sound
+from systems.data.entity import DataEntity
+from systems.data.storage import DataStorage
+from systems.graphics.entity import GraphicEntity
+from systems.graphics.surface import GraphicSurface
+from systems.graphics.system import RenderSystemID
+from systems.physics.collision_layer import CollisionLayer
+from systems.physics.entity import PhysicEntity
+from utils.math.primitive_surface import PrimitiveSurface
+from utils.math.vector import Vector
+
+
+# Templates hold the immutable parts of an entity (shapes, surface sets, sounds)
+# once; every instance shares them and only gets fresh mutable components.
+
+
+@dataclass(frozen=True, slots=True)
+class PhysicsTemplate:
+    surface: PrimitiveSurface
+    mass: float = 1.0
+    fixed: bool = False
+    category: int = CollisionLayer.DEFAULT
+    mask: int = CollisionLayer.ALL
+    sensor: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class GraphicTemplate:
+    surfaces: Mapping[str, GraphicSurface]
+    active_surface: str
+    z_index: int = 1
+    visible: bool = True
+    system_id: Optional[RenderSystemID] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, "surfaces", MappingProxyType(dict(self.surfaces)))
+
+
+@dataclass(frozen=True, slots=True)
+class ActionTemplate:
+    system_id: ActionSystemID
+    controller_id: Optional[ActionControllerID] = None
+
+
+@dataclass(frozen=True, slots=True)
+class EntityTemplate:
+    entity_type: EntityType
+    physics: Optional[PhysicsTemplate] = None
+    graphic: Optional[GraphicTemplate] = None
+    sounds: Optional[Mapping[str, Sound]] = None
+    action: Optional[ActionTemplate] = None
+    data_storage: Optional[Callable[[], DataStorage]] = None
+
+    def __post_init__(self):
+        if self.sounds is not None:
+            object.__setattr__(self, "sounds", MappingProxyType(dict(self.sounds)))
+
+    def instantiate(self, x: float, y: float) -> Entity:
+        position = Vector(x, y)
+        physics = self.physics
+        graphic = self.graphic
+        return Entity(
+            physics_entity=PhysicEntity(
+                position=position,
+                surface=physics.surface,
+                mass=physics.mass,
+                fixed=physics.fixed,
+                category=physics.category,
+                mask=physics.mask,
+                sensor=physics.sensor,
+            ) if physics is not None else None,
+            graphic_entity=GraphicEntity(
+                position=position,
+                surfaces=graphic.surfaces,
+                active_surface=graphic.active_surface,
+                z_index=graphic.z_index,
+                visible=graphic.visible,
+                system_id=graphic.system_id,
+            ) if graphic is not None else None,
+            audio_entity=AudioEntity(self.sounds) if self.sounds is not None else None,
+            action_entity=ActionEntity(
+                system_id=self.action.system_id,
+                controller_id=self.action.controller_id,
+            ) if self.action is not None else None,
+            data_entity=DataEntity(data_storage=self.data_storage()) if self.data_storage is not None else None,
+            entity_type=self.entity_type,
+        )
+
+
+class TemplateRegistry:
+    def __init__(self):
+        self.templates: dict[str, EntityTemplate] = {}
+
+    def register(self, name: str, template: EntityTemplate) -> None:
+        if name in self.templates:
+            raise ValueError(f"Entity template '{name}' is already registered")
+        self.templates[name] = template
+
+    def get(self, name: str) -> EntityTemplate:
+        template = self.templates.get(name)
+        if template is None:
+            raise ValueError(f"Unknown entity template '{name}'")
+        return template
+
+    def create(self, name: str, x: float, y: float) -> Entity:
+        return self.get(name).instantiate(x, y)
+
+    def create_many(self, name: str, positions: Iterable[tuple[float, float]]) -> list[Entity]:
+        instantiate = self.get(name).instantiate
+        return [instantiate(x, y) for x, y in positions]
@@ -1,15 +1,28 @@
+import random
+
 import pygame
 from systems.inputs.raw_input import RawInput, RawInputSystem
+from systems.inputs.recording import InputRecorder
+from utils.seeding import seed_all
 from settings import FPS, WINDOW_WIDTH, WINDOW_HEIGHT
 from scenes.scene import SceneManager
 from systems.logger import LoggerManager
+from systems.event_bus import EventBus
+from systems.event_bus.overlay import EventBusOverlay
+import settings
 
 from scenes.scenes.game_scene import GameScene
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, record_path: str | None = None, seed: int | None = None):
         pygame.init()
+        # a recording needs a known seed to be replayed
+        if record_path is not None and seed is None:
+            seed = random.randrange(2 ** 32)
+        if seed is not None:
+            seed_all(seed)
+        self.recorder = InputRecorder(record_path, seed) if record_path is not None else None
         self.display = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Slime Game")
         self.clock = pygame.time.Clock()
@@ -19,12 +32,15 @@ class Game:
         self.font = pygame.font.SysFont(None, 22)
         self.scene_manager.start_active_scene()
         self.logger_manager = LoggerManager()
+        self.event_bus_overlay = EventBusOverlay(pygame.font.SysFont("monospace", 14)) if settings.DEBUG_EVENT_BUS else None
 
     def run(self):
         while self.running:
             raw_input = RawInputSystem.poll()
             self.handle_events(raw_input)
             self.dt = self.clock.tick(FPS) / 1000
+            if self.recorder is not None:
+                self.recorder.record(raw_input, self.dt)
             self.scene_manager.handle_events(raw_input)
             self.scene_manager.update(self.dt)
             self.scene_manager.draw(self.display)
@@ -34,7 +50,14 @@ class Game:
             fps_surf = self.font.render(f"FPS: {fps:.0f}", True, (255, 0, 0))
             fps_rect = fps_surf.get_rect(bottomright=(WINDOW_WIDTH - 10, WINDOW_HEIGHT - 10))
             self.display.blit(fps_surf, fps_rect)
+            event_bus = EventBus.active()
+            if self.event_bus_overlay is not None:
+                self.event_bus_overlay.draw(self.display, event_bus)
+            event_bus.end_frame()
             pygame.display.flip()
+
+        if self.recorder is not None:
+            self.recorder.close()
             
     def handle_events(self, raw_input: RawInput):
         for event in raw_input.events:
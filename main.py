@@ -1,4 +1,18 @@
+import argparse
+
 from game import Game
 
+
+def seed_type(value: str) -> int:
+    seed = int(value)
+    if not 0 <= seed < 2 ** 64:
+        raise argparse.ArgumentTypeError("the seed must be an integer in [0, 2**64)")
+    return seed
+
+
 if __name__ == "__main__":
-    Game().run()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--record", help="record the inputs and frame times to this file, see benchmarks.replay")
+    parser.add_argument("--seed", type=seed_type, help="seed of the random generators")
+    args = parser.parse_args()
+    Game(record_path=args.record, seed=args.seed).run()
@@ -2,11 +2,20 @@ from abc import ABC, abstractmethod
 import pygame
 
 from systems.inputs.raw_input import RawInput
+from systems.event_bus import EventBus
 
 
 class Scene(ABC):
     def __init__(self):
         self.next_scene: str | None = None
+        # each scene has its own events, its bus becomes the active one on start
+        self.event_bus = EventBus()
+
+    def start(self) -> None:
+        EventBus.set_active(self.event_bus)
+
+    def quit(self) -> None:
+        pass
 
     @abstractmethod
     def handle_events(self, raw_input: RawInput) -> None:
@@ -29,9 +38,14 @@ class SceneManager:
 
     def __init__(self):
         self.active_scene: Scene = None
+        # scenes are built on their first switch, after seeding and settings overrides
+        self.scenes: dict[str, Scene] = {}
 
     def switch_scene(self, new_scene: str) -> None:
-        self.active_scene = self.SCENES[new_scene]
+        scene = self.scenes.get(new_scene)
+        if scene is None:
+            scene = self.scenes[new_scene] = self.SCENES[new_scene]()
+        self.active_scene = scene
 
     def start_active_scene(self) -> None:
         if self.active_scene:
@@ -56,6 +70,6 @@ class SceneManager:
 
 def register_scene(name: str):
     def decorator(cls):
-        SceneManager.SCENES[name] = cls()
+        SceneManager.SCENES[name] = cls
         return cls
     return decorator
\ No newline at end of file
@@ -5,21 +5,29 @@ from systems.inputs.raw_input import RawInput
 from systems.inputs.manager import InputSystemManager
 from systems.inputs.system.game import GameInputSystem
 from systems.physics.manager import PhysicSystemManager
+from systems.physics.threaded_manager import ThreadedPhysicSystemManager
 from systems.physics.system.primitive_2d import Primitive2DPhysicsSystem
+from systems.physics.broadphase.sweep_and_prune import SweepAndPruneBroadphase
 from systems.graphics.manager import GraphicSystemManager
 from systems.graphics.system import RenderSystemID
 from systems.graphics.system.primitive_2d import Primitive2DGraphicSystem
 from entities.entity_manager import EntityManager
 from entities.entity_factory import EntityFactory
+from entities.entity_pool import EntityPool
+from entities.entity_type import EntityType
 from scenes.scene import register_scene
 from systems.actions.manager import ActionSystemManager
+from systems.actions.scheduler import ActionScheduler
 from systems.actions.action_entity import ActionControllerID, ActionSystemID
 from systems.actions.controller.player import PlayerActionController
-from systems.actions.controller.ia import AIActionController
+from systems.actions.controller.ia import AIActionController, BatchAIActionController
 from systems.actions.system.alive import AliveActionSystem
 from systems.ia_components.slime_ia import SlimeIA
+from systems.ia_components.slime_batch_ia import SlimeBatchIA
+from systems.ia_components.process_pool_ia import ProcessPoolSlimeIA
 from systems.audio.audio_system_manager import AudioSystemManager
 from systems.audio.synth.source import SynthAudioSource
+from systems.event_bus.event.audio import PlaySoundEvent
 import settings
 
 
@@ -27,33 +35,52 @@ import settings
 class GameScene(Scene):
     def __init__(self):
         super().__init__()
-        self.physics_system_manager = PhysicSystemManager(Primitive2DPhysicsSystem())
+        physics_system_manager_class = ThreadedPhysicSystemManager if settings.PHYSICS_THREADED else PhysicSystemManager
+        self.physics_system_manager = physics_system_manager_class(Primitive2DPhysicsSystem(SweepAndPruneBroadphase()))
         self.graphic_system_manager = GraphicSystemManager(
             {RenderSystemID.WORLD: Primitive2DGraphicSystem()},
             default_system=RenderSystemID.WORLD,
         )
+        self.slime_batch = None
+        if settings.AI_PROCESS_POOL_WORKERS > 0:
+            self.slime_batch = ProcessPoolSlimeIA(seed=settings.AI_SEED, workers=settings.AI_PROCESS_POOL_WORKERS)
+        elif settings.AI_BATCHED:
+            self.slime_batch = SlimeBatchIA()
+        if self.slime_batch is not None:
+            slime_controller = lambda: BatchAIActionController(self.slime_batch)
+        else:
+            slime_controller = lambda: AIActionController(
+                SlimeIA(),
+                perception_radius=settings.SLIME_PERCEPTION_RADIUS,
+                perception_types=(EntityType.SLIME,),
+            )
         self.action_system_manager = ActionSystemManager(
             controller_registry={
                 ActionControllerID.PLAYER: PlayerActionController,
-                ActionControllerID.AI_SLIME: lambda: AIActionController(SlimeIA()),
+                ActionControllerID.AI_SLIME: slime_controller,
             },
             system_registry={
                 ActionSystemID.ALIVE: AliveActionSystem,
             },
+            scheduler=ActionScheduler(budget_ms=settings.AI_FRAME_BUDGET_MS),
         )
         self.input_system_manager = InputSystemManager(GameInputSystem(), has_ui=True)
         self.audio_system = AudioSystemManager()
         self.audio_system.register_audio_source(SynthAudioSource)
+        self.event_bus.subscribe(PlaySoundEvent, self.audio_system.on_play_sound)
 
+        self.entity_pool = EntityPool({EntityType.SLIME: EntityFactory.create_slime})
         self.entity_manager = EntityManager(
             physics_system_manager=self.physics_system_manager,
             graphic_system_manager=self.graphic_system_manager,
-            action_system_manager=self.action_system_manager
+            action_system_manager=self.action_system_manager,
+            entity_pool=self.entity_pool,
         )
 
         # ========= Create Player =========
         self.player = EntityFactory.create_player(800, 600)
         self.entity_manager.add_entity(self.player)
+        self.action_system_manager.scheduler.focus = self.player
 
         # ========= Create Solids =========
         self.solids = [
@@ -72,7 +99,7 @@ class GameScene(Scene):
 
         # ========= Create Slimes =========
         self.slimes = [
-            EntityFactory.create_slime(600, 350)
+            self.entity_pool.acquire(EntityType.SLIME, 600, 350)
             for _ in range(10)
         ]
         self.entity_manager.add_entities(self.slimes)
@@ -85,10 +112,15 @@ class GameScene(Scene):
         self.entity_manager.add_entities(self.visual_entities)
 
     def start(self) -> None:
+        super().start()
         self.audio_system.start_audio()
 
     def quit(self) -> None:
         self.audio_system.stop_audio()
+        if isinstance(self.physics_system_manager, ThreadedPhysicSystemManager):
+            self.physics_system_manager.stop()
+        if isinstance(self.slime_batch, ProcessPoolSlimeIA):
+            self.slime_batch.stop()
         super().quit()
 
     def handle_events(self, raw_input: RawInput) -> None:
@@ -100,7 +132,10 @@ class GameScene(Scene):
         self.physics_system_manager.update_all(dt)
         self.entity_manager.update_all(dt)
         self.action_system_manager.update_all(dt)
-        self.audio_system.play_sounds()
+        # subscribed events of the frame, sounds included
+        self.event_bus.dispatch()
+        # sync point: spawns and despawns queued during the frame are applied here
+        self.entity_manager.flush()
 
     def draw(self, screen: pygame.Surface) -> None:
         screen.fill((0, 0, 0))
@@ -6,13 +6,24 @@ DEBUG = True
 # DEBUG_PHYSICS = False
 # DEBUG_GRAPHIC = False
 # DEBUG_AUDIO = False
+# event bus overlay: per channel throughput, queue depth and event age
+DEBUG_EVENT_BUS = False
 
 # Instrumentation
 # PROFILE_PHYSICS = False
+PROFILE_EVENT_BUS = DEBUG_EVENT_BUS
+# a channel holding more events than this is shown as runaway
+EVENT_BUS_DEPTH_WARNING = 1000
 
 # ====== AUDIO SETTINGS ======
 AUDIO_FREQ_ECH = 44100
 AUDIO_SAMPLE_SIZE = 256
+# False runs without an output stream (headless replays), sounds are still mixed on demand
+AUDIO_OUTPUT = True
+# sounds waiting for the audio callback, the extra ones are dropped
+AUDIO_COMMAND_RING_SIZE = 256
+# sounds a synth plays at once
+AUDIO_MAX_VOICES = 32
 
 # ====== GAME SETTINGS ======
 FPS = 60
@@ -21,8 +32,13 @@ WINDOW_HEIGHT = 720
 
 # ====== PHYSICS SETTINGS ======
 # physics engine settings
+PHYSICS_THREADED = False
+PHYSICS_TIMESTEP = 1 / 60
+PHYSICS_MAX_STEPS_PER_FRAME = 5
 SPATIAL_CELL_SIZE = 50
 COLLISION_RESOLUTION_ITERATIONS = 3
+SLEEP_VELOCITY_THRESHOLD = 1.0
+SLEEP_TIME = 0.5
 
 # Physics constants
 ENTITY_ACCELERATION = 3000
@@ -32,3 +48,21 @@ ENTITY_MAX_SPEED = 100
 
 
 
+
+# ====== AI SETTINGS ======
+SLIME_PERCEPTION_RADIUS = 100
+# AI decisions are spread over frames within this budget
+AI_FRAME_BUDGET_MS = 4.0
+# (max distance to the player, frames between two decisions), nearest first
+AI_LOD_INTERVALS = ((300, 1), (600, 3))
+# beyond the last level or off-screen
+AI_LOD_FAR_INTERVAL = 8
+# evaluate all slimes in one vectorized pass instead of one SlimeIA per slime
+AI_BATCHED = False
+# > 0 evaluates the slimes in that many worker processes, actions arrive one frame later
+AI_PROCESS_POOL_WORKERS = 0
+# seed of the AI random draws, the process pool decisions are reproducible with it
+AI_SEED = 0
+
+# ====== ENTITY SETTINGS ======
+ENTITY_POOL_MAX_SIZE = 1024
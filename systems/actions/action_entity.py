@@ -24,3 +24,10 @@ class ActionEntity:
     controller_id: Optional[ActionControllerID] = None
     controller: Optional[ActionController] = None
     current_action: Optional[Action] = None
+
+    def reset(self) -> None:
+        if self.controller is None:
+            self.current_action = None
+            return
+        self.controller.reset()
+        self.current_action = self.controller.get_default_action()
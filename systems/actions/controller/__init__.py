@@ -4,6 +4,9 @@ from systems.inputs.system import InputEntity
 
 
 class ActionController(ABC):
+    # decisions may be spread over frames by an ActionScheduler
+    schedulable: bool = False
+
     @abstractmethod
     def get_default_action(self) -> Action:
         pass
@@ -11,3 +14,6 @@ class ActionController(ABC):
     @abstractmethod
     def get_action(self) -> Action:
         pass
+
+    def reset(self) -> None:
+        pass
@@ -19,9 +19,23 @@ class EntityPerception:
 
 
 class AIActionController(ActionController):
-    def __init__(self, ia_component):
+    schedulable = True
+
+    def __init__(
+        self,
+        ia_component,
+        perception_radius: float | None = None,
+        perception_types: tuple[EntityType, ...] | None = None,
+    ):
         self.ia_component = ia_component
         self.perception = None
+        # None means unlimited range / every type
+        self.perception_radius = perception_radius
+        self.perception_types = perception_types
+
+    def reset(self) -> None:
+        self.perception = None
+        self.ia_component.reset()
 
     def update_perception(self, perception: EntityPerception) -> None:
         self.perception = perception
@@ -31,3 +45,20 @@ class AIActionController(ActionController):
 
     def get_action(self) -> AliveActionEntity:
         return self.ia_component.action(self.perception)
+
+
+class BatchAIActionController(ActionController):
+    """Controller of an entity whose decisions come from a BatchIAComponent."""
+
+    def __init__(self, batch):
+        self.batch = batch
+        self.action = self.get_default_action()
+
+    def reset(self) -> None:
+        self.action = self.get_default_action()
+
+    def get_default_action(self) -> AliveActionEntity:
+        return AliveActionEntity()
+
+    def get_action(self) -> AliveActionEntity:
+        return self.action
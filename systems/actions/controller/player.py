@@ -26,7 +26,7 @@ class PlayerActionController(ActionController):
         return AliveActionEntity()
 
     def get_action(self) -> AliveActionEntity:
-        for event in EventBus.poll(ChannelEvent.INPUT_GAME):
+        for event in EventBus.active().poll(ChannelEvent.INPUT_GAME):
             return self._create_alive_action(event.input_entity)
         
         return self.get_default_action()
\ No newline at end of file
@@ -4,10 +4,12 @@ from typing import TYPE_CHECKING, Dict, Type, Callable
 
 from systems.actions.controller import ActionController
 from systems.actions.action_entity import ActionControllerID, ActionSystemID
+from utils.containers import DenseList
 
 if TYPE_CHECKING:
     from entities.entity import Entity
     from systems.actions.system import ActionSystem
+    from systems.actions.scheduler import ActionScheduler
 
 
 class ActionSystemManager:
@@ -15,12 +17,15 @@ class ActionSystemManager:
         self,
         controller_registry: Dict[ActionControllerID, Callable[[], ActionController]],
         system_registry: Dict[ActionSystemID, Type[ActionSystem]],
+        scheduler: ActionScheduler = None,
     ):
         if not system_registry:
             raise ValueError("ActionSystemManager requires at least one system registered")
         self.controller_registry = controller_registry
         self.system_registry = system_registry
-        self.entities: list[Entity] = []
+        self.entities: DenseList[Entity] = DenseList()
+        # without a scheduler every controller decides every frame
+        self.scheduler = scheduler
 
     def add_entity(self, entity: Entity) -> None:
         action_entity = entity.action_entity
@@ -39,6 +44,8 @@ class ActionSystemManager:
             action_entity.current_action = action_entity.controller.get_default_action()
 
         self.entities.append(entity)
+        if self._is_scheduled(entity):
+            self.scheduler.add(entity)
     
     def add_entities(self, entities: list[Entity]) -> None:
         for entity in entities:
@@ -47,12 +54,17 @@ class ActionSystemManager:
     def remove_entity(self, entity: Entity) -> None:
         if entity in self.entities:
             self.entities.remove(entity)
+            if self.scheduler is not None:
+                self.scheduler.remove(entity)
 
     def remove_entities(self, entities: list[Entity]) -> None:
         for entity in entities:
             self.remove_entity(entity)
 
     def update_all(self, dt: float) -> None:
+        if self.scheduler is not None:
+            self.scheduler.run(self._decide)
+
         for entity in self.entities:
             action_entity = entity.action_entity
 
@@ -60,7 +72,18 @@ class ActionSystemManager:
                 if action_entity.controller is None:
                     controller_factory = self.controller_registry[action_entity.controller_id]
                     action_entity.controller = controller_factory()
-                action_entity.current_action = action_entity.controller.get_action()
+                    if self._is_scheduled(entity):
+                        self.scheduler.add(entity)
+                if self.scheduler is None or not action_entity.controller.schedulable:
+                    action_entity.current_action = action_entity.controller.get_action()
 
             system = self.system_registry[action_entity.system_id]
             system.apply_action(dt, entity)
+
+    def _decide(self, entity: Entity) -> None:
+        action_entity = entity.action_entity
+        action_entity.current_action = action_entity.controller.get_action()
+
+    def _is_scheduled(self, entity: Entity) -> bool:
+        controller = entity.action_entity.controller
+        return self.scheduler is not None and controller is not None and controller.schedulable
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+import settings
+
+if TYPE_CHECKING:
+    from entities.entity import Entity
+
+
+class ActionScheduler:
+    """Spreads the decisions of schedulable controllers (AI) over frames.
+
+    Each entity is due again a number of frames after its decision, depending on
+    its distance to the focus entity (the player) and on being on screen; it
+    keeps its last action in between. Due entities are served most overdue
+    first until the per-frame time budget is spent, the rest wait a frame.
+    """
+
+    def __init__(
+        self,
+        budget_ms: float = settings.AI_FRAME_BUDGET_MS,
+        lod_intervals: tuple[tuple[float, int], ...] = settings.AI_LOD_INTERVALS,
+        far_interval: int = settings.AI_LOD_FAR_INTERVAL,
+        view: tuple[float, float, float, float] = (0, 0, settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT),
+    ):
+        self.budget_ms = budget_ms
+        self.lod_intervals = tuple((distance * distance, interval) for distance, interval in lod_intervals)
+        self.far_interval = far_interval
+        self.view = view
+        self.focus: Optional[Entity] = None
+        self.frame = 0
+        self.decisions_last_frame = 0
+        self._heap: list[tuple[int, int, Entity]] = []
+        self._entries: dict[int, tuple[int, int]] = {}
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, entity: Entity) -> None:
+        self._schedule(entity, self.frame)
+
+    def remove(self, entity: Entity) -> None:
+        # the heap entry is dropped lazily when it surfaces
+        self._entries.pop(id(entity), None)
+
+    def is_due(self, entity: Entity) -> bool:
+        entry = self._entries.get(id(entity))
+        return entry is not None and entry[0] <= self.frame
+
+    def run(self, decide: Callable[[Entity], None]) -> int:
+        """Call decide on due entities within the budget (at least one), returns the count."""
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        heap = self._heap
+        decisions = 0
+        while heap and heap[0][0] <= self.frame:
+            due, sequence, entity = heapq.heappop(heap)
+            if self._entries.get(id(entity)) != (due, sequence):
+                continue
+            decide(entity)
+            decisions += 1
+            self._schedule(entity, self.frame + self.interval(entity))
+            if time.perf_counter() >= deadline:
+                break
+        self.decisions_last_frame = decisions
+        self.frame += 1
+        return decisions
+
+    def interval(self, entity: Entity) -> int:
+        if self.focus is None or entity.physics_entity is None or self.focus.physics_entity is None:
+            return 1
+        position = entity.physics_entity.position
+        x0, y0, x1, y1 = self.view
+        if not (x0 <= position.x <= x1 and y0 <= position.y <= y1):
+            return self.far_interval
+        distance_squared = (position - self.focus.physics_entity.position).length_squared
+        for max_distance_squared, interval in self.lod_intervals:
+            if distance_squared <= max_distance_squared:
+                return interval
+        return self.far_interval
+
+    def _schedule(self, entity: Entity, due: int) -> None:
+        sequence = next(self._sequence)
+        self._entries[id(entity)] = (due, sequence)
+        heapq.heappush(self._heap, (due, sequence, entity))
@@ -38,7 +38,7 @@ class AliveActionSystem(ActionSystem):
         acc_max = move_normalized * settings.ENTITY_ACCELERATION
 
         if move.length > 0:
-            EventBus.emit(PlaySoundEvent(key_sound="walk", entity=entity))
+            EventBus.active().emit(PlaySoundEvent.acquire("walk", entity))
             entity.graphic_entity.active_surface = "walk"
         else:
             entity.graphic_entity.active_surface = "static"
@@ -1,5 +1,4 @@
 import numpy as np
-import sounddevice as sd
 
 import settings
 from systems.event_bus import EventBus, ChannelEvent
@@ -18,25 +17,36 @@ class AudioSystemManager:
     def __init__(self):
         self.mix = MixAudioSource()
         self.audio_sources = []
-        self._audio_stream = sd.OutputStream(
-            samplerate=settings.AUDIO_FREQ_ECH,
-            blocksize=settings.AUDIO_SAMPLE_SIZE,
-            channels=2,
-            callback=self._audio_callback
-        )
+        self._audio_stream = None
+        if settings.AUDIO_OUTPUT:
+            # imported here so headless runs work without PortAudio
+            import sounddevice as sd
+
+            self._audio_stream = sd.OutputStream(
+                samplerate=settings.AUDIO_FREQ_ECH,
+                blocksize=settings.AUDIO_SAMPLE_SIZE,
+                channels=2,
+                callback=self._audio_callback
+            )
 
     def start_audio(self) -> None:
-        self._audio_stream.start()
+        if self._audio_stream is not None:
+            self._audio_stream.start()
 
     def stop_audio(self) -> None:
-        self._audio_stream.stop()
+        if self._audio_stream is not None:
+            self._audio_stream.stop()
 
     def play_sounds(self) -> None:
-        events = EventBus.poll(ChannelEvent.AUDIO)
+        events = EventBus.active().poll(ChannelEvent.AUDIO)
         for event in events:
             if isinstance(event, PlaySoundEvent):
                 self._play_sound(event.key_sound, event.entity)
 
+    def on_play_sound(self, event: PlaySoundEvent) -> None:
+        """Handler for EventBus.subscribe, replaces play_sounds when the bus dispatches."""
+        self._play_sound(event.key_sound, event.entity)
+
     def register_audio_source(self, audio_source_class: type[AudioSource]) -> None:
         if any(isinstance(obj, audio_source_class) for obj in self.audio_sources):
             return
@@ -14,8 +14,10 @@ class SoundReader(ABC):
         raise NotImplementedError("Subclass must implement this method")
 
 class MixAudioSource(AudioSource):
-    def __init__(self, audio_sources: list[AudioSource] = []):
-        self.audio_sources = audio_sources
+    def __init__(self, audio_sources: list[AudioSource] = None):
+        self.audio_sources = audio_sources if audio_sources is not None else []
+        # reused between blocks, play runs on the audio callback thread
+        self._mix = np.zeros((0, 2), dtype=np.float32)
     
     def add_audio_source(self, audio_source: AudioSource) -> None:
         self.audio_sources.append(audio_source)
@@ -24,10 +26,13 @@ class MixAudioSource(AudioSource):
         self.audio_sources.remove(audio_source)
 
     def play(self, frames: int, time, status):
-        mix = np.zeros((frames, 2), dtype=np.float32)
+        if frames > len(self._mix):
+            self._mix = np.zeros((frames, 2), dtype=np.float32)
+        mix = self._mix[:frames]
+        mix.fill(0)
 
         for audio_source in self.audio_sources:
             mix += audio_source.play(frames, time, status)
 
-        return np.clip(mix, -1, 1)
+        return np.clip(mix, -1, 1, out=mix)
 
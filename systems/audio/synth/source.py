@@ -1,59 +1,139 @@
+import math
+
 import numpy as np
 from systems.audio.source import AudioSource, SoundReader
 from systems.audio.synth.sound import SynthSound, SynthSoundInterpreter
 from systems.audio.play_policy import PlayPolicy
 from systems.audio.synth.wave_type import WaveType
+from utils.containers import SPSCRing
+import settings
+
+TWO_PI = 2 * math.pi
+
 
 class SynthAudioSource(AudioSource, SoundReader):
-    def __init__(self, freq_ech: float):
-        self.sounds = []
+    """Synth played from the audio callback thread.
+
+    set_sound runs on the game thread and only pushes the sound into a
+    single-producer/single-consumer ring. play drains the ring at the start of
+    each block. Voices and sample buffers are allocated up front so the
+    callback takes no lock and builds no arrays.
+    """
+
+    def __init__(
+        self,
+        freq_ech: float,
+        max_voices: int = settings.AUDIO_MAX_VOICES,
+        ring_size: int = settings.AUDIO_COMMAND_RING_SIZE,
+        block_size: int = settings.AUDIO_SAMPLE_SIZE,
+    ):
+        self.commands: SPSCRing[SynthSound] = SPSCRing(ring_size)
+        # one counter per thread: ring full (game thread), no free voice (audio thread)
+        self.dropped_commands = 0
+        self.dropped_voices = 0
+        # voices[:active] are playing, a finished voice swaps with the last playing one
+        self.voices = [SynthSoundInterpreter(sound=None, duration=0) for _ in range(max_voices)]
+        self.active = 0
 
         self.freq_ech = freq_ech
         self.prev_time = 0
+        self._allocate(block_size)
 
+    @property
+    def dropped(self) -> int:
+        return self.dropped_commands + self.dropped_voices
 
     def set_sound(self, sound: SynthSound) -> None:
-        if sound.play_policy == PlayPolicy.IGNORE and not sound.id in [s.sound.id for s in self.sounds]:
-            self.sounds.append(SynthSoundInterpreter.create(sound))
-        elif sound.play_policy == PlayPolicy.RESTART:
-            if sound.id in [s.sound.id for s in self.sounds]:
-                sound_to_remove = [s for s in self.sounds if s.sound.id == sound.id][0]
-                self.sounds.append(SynthSoundInterpreter.create(sound, phase=sound_to_remove.phase))
-                self.sounds.remove(sound_to_remove)
-            else:
-                self.sounds.append(SynthSoundInterpreter.create(sound))
-        elif sound.play_policy == PlayPolicy.OVERLAP:
-            self.sounds.append(SynthSoundInterpreter.create(sound))
+        if not self.commands.push(sound):
+            self.dropped_commands += 1
 
     def play(self, frames: int, time, status):
-        mix = np.zeros((frames, 2), dtype=np.float32)
-        note_to_remove = []
+        if frames > len(self._mix):
+            self._allocate(frames)
+        self._apply_commands()
+
+        mix = self._mix[:frames]
+        mix.fill(0)
+        phase = self._phase[:frames]
+        wave = self._wave[:frames]
+        ramp = self._ramp[:frames]
         dt = frames / self.freq_ech
 
-        for sound in self.sounds:
-            freq = np.array([sound.sound.freq] * frames)
-            phase_d = (2 * np.pi) / (self.freq_ech / freq)
-            phase_d[0] += sound.phase
-            phase = phase_d.cumsum() % (2 * np.pi)
-            sound.phase = phase[-1]
-            wave = self._get_sig(phase, sound.sound.wave_type) * sound.sound.amp
-            wave = np.column_stack((wave, wave))
-            mix += wave
-            sound.duration -= dt
-            if sound.duration <= 0:
-                note_to_remove.append(sound)
-
-        for sound in note_to_remove:
-            self.sounds.remove(sound)
+        index = 0
+        while index < self.active:
+            voice = self.voices[index]
+            sound = voice.sound
+            # phase of the sample k is the voice phase plus (k + 1) steps
+            np.multiply(ramp, TWO_PI * sound.freq / self.freq_ech, out=phase)
+            phase += voice.phase
+            np.remainder(phase, TWO_PI, out=phase)
+            voice.phase = float(phase[-1])
+            self._signal(phase, sound.wave_type, wave)
+            wave *= sound.amp
+            mix[:, 0] += wave
+            mix[:, 1] += wave
+            voice.duration -= dt
+            if voice.duration <= 0:
+                self._stop_voice(index)
+            else:
+                index += 1
 
         self.prev_time = time.currentTime
         return mix
 
-    def _get_sig(self, phase: np.ndarray, wave_type: WaveType):
-        return {
-            WaveType.SIN: np.sin(phase),
-            WaveType.SQUARD: np.sign(np.sin(phase)),
-            WaveType.TRIANGULAR: (2 * (phase % np.pi) / np.pi) - 1,
-            WaveType.RAMP: phase / (np.pi) - 1,
-        }[wave_type]
+    def _apply_commands(self) -> None:
+        while True:
+            sound = self.commands.pop()
+            if sound is None:
+                return
+            playing = self._voice_of(sound)
+            if sound.play_policy == PlayPolicy.IGNORE and playing is not None:
+                continue
+            if sound.play_policy == PlayPolicy.RESTART and playing is not None:
+                # the phase is kept so the restart does not click
+                playing.duration = sound.duration
+                continue
+            self._start_voice(sound)
+
+    def _voice_of(self, sound: SynthSound) -> SynthSoundInterpreter | None:
+        for index in range(self.active):
+            voice = self.voices[index]
+            if voice.sound.id == sound.id:
+                return voice
+        return None
+
+    def _start_voice(self, sound: SynthSound) -> None:
+        if self.active == len(self.voices):
+            self.dropped_voices += 1
+            return
+        voice = self.voices[self.active]
+        voice.sound = sound
+        voice.duration = sound.duration
+        voice.phase = 0
+        self.active += 1
+
+    def _stop_voice(self, index: int) -> None:
+        self.active -= 1
+        voices = self.voices
+        voices[index], voices[self.active] = voices[self.active], voices[index]
+        voices[self.active].sound = None
+
+    def _signal(self, phase: np.ndarray, wave_type: WaveType, out: np.ndarray) -> None:
+        if wave_type == WaveType.SIN:
+            np.sin(phase, out=out)
+        elif wave_type == WaveType.SQUARD:
+            np.sin(phase, out=out)
+            np.sign(out, out=out)
+        elif wave_type == WaveType.TRIANGULAR:
+            np.remainder(phase, math.pi, out=out)
+            out *= 2 / math.pi
+            out -= 1
+        elif wave_type == WaveType.RAMP:
+            np.divide(phase, math.pi, out=out)
+            out -= 1
 
+    def _allocate(self, frames: int) -> None:
+        self._mix = np.zeros((frames, 2), dtype=np.float32)
+        self._phase = np.zeros(frames)
+        self._wave = np.zeros(frames)
+        self._ramp = np.arange(1, frames + 1, dtype=np.float64)
@@ -2,4 +2,5 @@ from abc import ABC
 
 
 class DataStorage(ABC):
-    pass
+    def reset(self) -> None:
+        pass
@@ -7,3 +7,8 @@ class AliveDataStorage(DataStorage):
         self.life = life if life is not None else max_life
         self.dead = False
         self.time_before_delete = 2.0
+
+    def reset(self) -> None:
+        self.life = self.max_life
+        self.dead = False
+        self.time_before_delete = 2.0
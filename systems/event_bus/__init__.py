@@ -1,27 +1,196 @@
-from systems.event_bus.event import Event
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from itertools import count
+from time import perf_counter
+from typing import Callable
+
+from systems.event_bus.event import Event, PooledEvent
 from systems.event_bus.channel_event import ChannelEvent
+from systems.event_bus.stats import ChannelStats
+import settings
 
 
 class EventBus:
-    events: list[Event] = []
+    """One queue per channel, polling a channel takes its whole queue at once.
+
+    The bus is not thread safe, emit and poll from the main thread only.
+    Systems talk to the active bus, EventBus.active(). A scene or a test can
+    start from a clean one with EventBus.reset() or swap it with set_active().
+
+    Events can also be pushed: handlers subscribed to an event class or to a
+    channel are called by dispatch(), which only drains the channels someone
+    subscribed to. Pooled events go back to their pool once dispatched, or on
+    the next poll of the channel they were polled from.
+
+    With stats on, each channel keeps a ChannelStats: throughput, queue depth
+    and the age of the events when taken. end_frame() closes a frame.
+    """
+
+    _active: EventBus
+
+    def __init__(self, stats: bool = settings.PROFILE_EVENT_BUS):
+        self._events: dict[ChannelEvent, deque[Event]] = {channel: deque() for channel in ChannelEvent}
+        # emission order, used to interleave the channels when GLOBAL is polled
+        self._sequences: dict[ChannelEvent, deque[int]] = {channel: deque() for channel in ChannelEvent}
+        self._counter = count()
+        self._handlers: dict[type[Event] | ChannelEvent, list[Callable[[Event], None]]] = {}
+        # handlers by concrete event class, subscriptions to base classes included
+        self._class_handlers: dict[type[Event], list[Callable[[Event], None]]] = {}
+        self._dispatched_channels: tuple[ChannelEvent, ...] = ()
+        # batches handed out by poll, their pooled events are released on the next poll
+        self._polled: dict[ChannelEvent, deque[Event] | list[Event]] = {}
+        self.frame = 0
+        self.channel_stats: dict[ChannelEvent, ChannelStats] | None = (
+            {channel: ChannelStats() for channel in ChannelEvent} if stats else None
+        )
 
     @classmethod
-    def emit(self, event: Event):
-        self.events.append(event)
+    def active(cls) -> EventBus:
+        return cls._active
 
     @classmethod
-    def poll(self, channel: ChannelEvent = ChannelEvent.GLOBAL):
-        if channel != ChannelEvent.GLOBAL:
-            events = []
-            for event in self.events:
-                if event.channel == channel:
-                    events.append(event)
+    def set_active(cls, event_bus: EventBus) -> EventBus:
+        """Make event_bus the active bus, returns the previous one."""
+        previous, cls._active = cls._active, event_bus
+        return previous
 
-            for event in events:
-                self.events.remove(event)
+    @classmethod
+    def reset(cls) -> EventBus:
+        cls._active = cls()
+        return cls._active
+
+    def emit(self, event: Event) -> None:
+        channel = event.channel
+        events = self._events[channel]
+        events.append(event)
+        self._sequences[channel].append(next(self._counter))
+        if self.channel_stats is not None:
+            self.channel_stats[channel].record_emit(self.frame, perf_counter(), len(events))
 
-            return events
+    def poll(self, channel: ChannelEvent = ChannelEvent.GLOBAL) -> deque[Event] | list[Event] | tuple[()]:
+        """Events of a channel in emission order. GLOBAL takes the events of every channel."""
+        _release(self._polled.pop(channel, ()))
+        if channel != ChannelEvent.GLOBAL:
+            events = self._events[channel]
+            if not events:
+                # never hand out the live queue, later emits would land in a batch already released
+                return ()
+            if self.channel_stats is not None:
+                self.channel_stats[channel].record_take(len(events), self.frame, perf_counter())
+            self._events[channel] = deque()
+            self._sequences[channel] = deque()
         else:
-            events = self.events
-            self.events = []
-            return events
+            events = self._take(ChannelEvent)
+            if not events:
+                return ()
+        self._polled[channel] = events
+        return events
+
+    def subscribe(self, key: type[Event] | ChannelEvent, handler: Callable[[Event], None]) -> None:
+        """Call handler on dispatch for every event of a class (subclasses included) or of a channel.
+
+        A class is dispatched from its default channel, the GLOBAL channel subscribes to every event.
+        """
+        self._handlers.setdefault(key, []).append(handler)
+        self._subscriptions_changed()
+
+    def unsubscribe(self, key: type[Event] | ChannelEvent, handler: Callable[[Event], None]) -> None:
+        handlers = self._handlers.get(key)
+        if handlers is None or handler not in handlers:
+            return
+        handlers.remove(handler)
+        if not handlers:
+            del self._handlers[key]
+        self._subscriptions_changed()
+
+    def dispatch(self) -> int:
+        """Hand the pending events of the subscribed channels to their handlers, in emission order.
+
+        Events emitted by the handlers wait for the next dispatch. Returns the number of events.
+        """
+        channels = self._dispatched_channels
+        if not channels:
+            return 0
+        events = self._take(channels)
+        channel_handlers = self._handlers
+        for event in events:
+            for handler in self._handlers_of(type(event)):
+                handler(event)
+            for handler in channel_handlers.get(event.channel, ()):
+                handler(event)
+            if event.channel != ChannelEvent.GLOBAL:
+                for handler in channel_handlers.get(ChannelEvent.GLOBAL, ()):
+                    handler(event)
+        _release(events)
+        return len(events)
+
+    def pending(self, channel: ChannelEvent = ChannelEvent.GLOBAL) -> int:
+        """Number of events waiting to be polled on a channel, or on every channel for GLOBAL."""
+        if channel != ChannelEvent.GLOBAL:
+            return len(self._events[channel])
+        return sum(len(events) for events in self._events.values())
+
+    def end_frame(self) -> None:
+        self.frame += 1
+        if self.channel_stats is not None:
+            for stats in self.channel_stats.values():
+                stats.end_frame()
+
+    def stats(self, channel: ChannelEvent) -> ChannelStats | None:
+        """Stats of a channel, None when the bus was created without stats."""
+        if self.channel_stats is None:
+            return None
+        return self.channel_stats[channel]
+
+    def _take(self, channels) -> list[Event]:
+        """Empty the queues of the given channels, merged in emission order."""
+        queues = [
+            zip(self._sequences[channel], self._events[channel])
+            for channel in channels if self._events[channel]
+        ]
+        if not queues:
+            return []
+        if self.channel_stats is not None:
+            now = perf_counter()
+            for channel in channels:
+                self.channel_stats[channel].record_take(len(self._events[channel]), self.frame, now)
+        for channel in channels:
+            self._events[channel] = deque()
+            self._sequences[channel] = deque()
+        if len(queues) == 1:
+            return [event for _, event in queues[0]]
+        return [event for _, event in heapq.merge(*queues, key=_sequence)]
+
+    def _handlers_of(self, event_class: type[Event]) -> list[Callable[[Event], None]]:
+        handlers = self._class_handlers.get(event_class)
+        if handlers is None:
+            handlers = [
+                handler
+                for base in event_class.__mro__ if base in self._handlers
+                for handler in self._handlers[base]
+            ]
+            self._class_handlers[event_class] = handlers
+        return handlers
+
+    def _subscriptions_changed(self) -> None:
+        self._class_handlers.clear()
+        if ChannelEvent.GLOBAL in self._handlers:
+            self._dispatched_channels = tuple(ChannelEvent)
+            return
+        channels = {key if isinstance(key, ChannelEvent) else key.channel for key in self._handlers}
+        self._dispatched_channels = tuple(channel for channel in ChannelEvent if channel in channels)
+
+
+def _release(events) -> None:
+    for event in events:
+        if isinstance(event, PooledEvent):
+            event.release()
+
+
+def _sequence(item: tuple[int, Event]) -> int:
+    return item[0]
+
+
+EventBus._active = EventBus()
@@ -7,6 +7,7 @@ class ChannelEvent(Enum):
 
     # ==== ENGINE EVENTS ====
     AUDIO = 'audio'
+    PHYSICS = 'physics'
 
     # ==== INPUT EVENTS ====
     INPUT_UI = 'input_ui'
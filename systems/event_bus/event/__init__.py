@@ -4,3 +4,25 @@ from systems.event_bus.channel_event import ChannelEvent
 
 class Event(ABC):
     channel: ChannelEvent = ChannelEvent.GLOBAL
+
+
+class PooledEvent(Event):
+    """Event whose records are reused instead of allocated on every emit.
+
+    Get a record with the subclass' acquire(). The bus releases it once it has
+    been dispatched, or on the next poll of its channel, so consumers must not
+    keep it past that.
+    """
+
+    _free: list["PooledEvent"] = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._free = []
+
+    @classmethod
+    def _record(cls):
+        return cls._free.pop() if cls._free else cls()
+
+    def release(self) -> None:
+        type(self)._free.append(self)
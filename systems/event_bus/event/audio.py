@@ -1,11 +1,25 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 
-from systems.event_bus import Event, ChannelEvent
+from systems.event_bus import ChannelEvent
+from systems.event_bus.event import PooledEvent
 from entities.entity import Entity
 
 
-@dataclass(frozen=True)
-class PlaySoundEvent(Event):
-    key_sound: str
-    entity: Entity
+@dataclass
+class PlaySoundEvent(PooledEvent):
+    key_sound: str = ""
+    entity: Entity | None = None
     channel: ChannelEvent = ChannelEvent.AUDIO
+
+    @classmethod
+    def acquire(cls, key_sound: str, entity: Entity) -> PlaySoundEvent:
+        event = cls._record()
+        event.key_sound = key_sound
+        event.entity = entity
+        return event
+
+    def release(self) -> None:
+        self.entity = None
+        super().release()
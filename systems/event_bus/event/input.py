@@ -1,6 +1,9 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 
 from systems.event_bus import Event, ChannelEvent
+from systems.event_bus.event import PooledEvent
 from systems.inputs.system.ui import UIInputEntity
 from systems.inputs.system.game import GameInputEntity
 
@@ -10,7 +13,17 @@ class UIInputEvent(Event):
     input_entity: UIInputEntity
     channel: ChannelEvent = ChannelEvent.INPUT_UI
 
-@dataclass(frozen=True)
-class GameInputEvent(Event):
-    input_entity: GameInputEntity
-    channel: ChannelEvent = ChannelEvent.INPUT_GAME
\ No newline at end of file
+@dataclass
+class GameInputEvent(PooledEvent):
+    input_entity: GameInputEntity | None = None
+    channel: ChannelEvent = ChannelEvent.INPUT_GAME
+
+    @classmethod
+    def acquire(cls, input_entity: GameInputEntity) -> GameInputEvent:
+        event = cls._record()
+        event.input_entity = input_entity
+        return event
+
+    def release(self) -> None:
+        self.input_entity = None
+        super().release()
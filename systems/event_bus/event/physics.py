@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from systems.event_bus import Event, ChannelEvent
+
+if TYPE_CHECKING:
+    from systems.physics.entity import PhysicEntity
+
+
+@dataclass(frozen=True)
+class SensorEnterEvent(Event):
+    sensor: PhysicEntity
+    other: PhysicEntity
+    channel: ChannelEvent = ChannelEvent.PHYSICS
+
+
+@dataclass(frozen=True)
+class SensorExitEvent(Event):
+    sensor: PhysicEntity
+    other: PhysicEntity
+    channel: ChannelEvent = ChannelEvent.PHYSICS
@@ -0,0 +1,32 @@
+import pygame
+
+from systems.event_bus import EventBus, ChannelEvent
+import settings
+
+
+def stats_lines(event_bus: EventBus) -> list[tuple[str, bool]]:
+    """One line per channel and whether its queue looks like it runs away."""
+    if event_bus.channel_stats is None:
+        return [("event bus stats are off (settings.PROFILE_EVENT_BUS)", False)]
+    lines = [("channel      emit/f  depth    max  age f  age ms", False)]
+    for channel in ChannelEvent:
+        stats = event_bus.channel_stats[channel]
+        depth = event_bus.pending(channel)
+        lines.append((
+            f"{channel.value:<12} {stats.emitted_last_frame:>6} {depth:>6} {stats.max_depth:>6}"
+            f" {stats.max_age_frames:>6} {stats.max_age_ms:>7.1f}",
+            depth > settings.EVENT_BUS_DEPTH_WARNING,
+        ))
+    return lines
+
+
+class EventBusOverlay:
+    def __init__(self, font: pygame.font.Font):
+        self.font = font
+
+    def draw(self, screen: pygame.Surface, event_bus: EventBus, position: tuple[int, int] = (10, 10)) -> None:
+        x, y = position
+        for text, warning in stats_lines(event_bus):
+            surface = self.font.render(text, True, (255, 80, 80) if warning else (200, 200, 200))
+            screen.blit(surface, (x, y))
+            y += surface.get_height()
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class ChannelStats:
+    """Traffic of one channel. Ages are those of the last batch taken by a poll or a dispatch."""
+
+    emitted: int = 0
+    emitted_last_frame: int = 0
+    taken: int = 0
+    max_depth: int = 0
+    mean_age_frames: float = 0
+    max_age_frames: int = 0
+    mean_age_ms: float = 0
+    max_age_ms: float = 0
+    # worst age ever seen when taking a batch
+    peak_age_frames: int = 0
+    peak_age_ms: float = 0
+    # pending events, summed so ages are computed without a timestamp per event
+    _emitted_this_frame: int = 0
+    _frame_sum: int = 0
+    _time_sum: float = 0
+    _oldest_frame: int = 0
+    _oldest_time: float = 0
+
+    def record_emit(self, frame: int, now: float, depth: int) -> None:
+        self.emitted += 1
+        self._emitted_this_frame += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+        if depth == 1:
+            self._oldest_frame = frame
+            self._oldest_time = now
+        self._frame_sum += frame
+        self._time_sum += now
+
+    def record_take(self, count: int, frame: int, now: float) -> None:
+        if count == 0:
+            return
+        self.taken += count
+        self.mean_age_frames = frame - self._frame_sum / count
+        self.max_age_frames = frame - self._oldest_frame
+        self.mean_age_ms = (now - self._time_sum / count) * 1000
+        self.max_age_ms = (now - self._oldest_time) * 1000
+        self.peak_age_frames = max(self.peak_age_frames, self.max_age_frames)
+        self.peak_age_ms = max(self.peak_age_ms, self.max_age_ms)
+        self._frame_sum = 0
+        self._time_sum = 0
+
+    def end_frame(self) -> None:
+        self.emitted_last_frame = self._emitted_this_frame
+        self._emitted_this_frame = 0
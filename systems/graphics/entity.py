@@ -17,3 +17,8 @@ class GraphicEntity:
     visible: bool = True
     id: Optional[int] = None
     system_id: Optional["RenderSystemID"] = None
+
+    def reset(self, position: Vector, active_surface: str) -> None:
+        self.position = position
+        self.active_surface = active_surface
+        self.visible = True
@@ -4,6 +4,7 @@ import pygame
 
 from systems.graphics.entity import GraphicEntity
 from systems.graphics.system import GraphicSystem, RenderSystemID
+from utils.containers import SortedList
 
 
 class GraphicSystemManager:
@@ -14,37 +15,22 @@ class GraphicSystemManager:
         self.default_system = default_system or next(iter(graphic_systems))
         if self.default_system not in self.graphic_systems:
             raise ValueError(f"Default graphic system '{self.default_system}' is not registered")
-        self.entities_by_system: Dict[RenderSystemID, list[GraphicEntity]] = {name: [] for name in graphic_systems}
+        self.entities_by_system: Dict[RenderSystemID, SortedList[GraphicEntity]] = {
+            name: SortedList(system.key_sort_function) for name, system in graphic_systems.items()
+        }
         self.entity_system_map: Dict[int, RenderSystemID] = {}
         self._id_counter: int = 0
 
     def add_entity(self, entity: GraphicEntity) -> None:
-        system_id = entity.system_id or self.default_system
-        system = self.graphic_systems.get(system_id)
-        if system is None:
-            raise ValueError(f"No graphic system registered for id '{system_id}'")
-
-        if entity.id is None:
-            self._id_counter += 1
-            entity.id = self._id_counter
-
-        bucket = self.entities_by_system[system_id]
-        key_sort_function = system.key_sort_function
-        if key_sort_function is not None:
-            key = key_sort_function(entity)
-            for i, e in enumerate(bucket):
-                if key < key_sort_function(e):
-                    bucket.insert(i, entity)
-                    break
-            else:
-                bucket.append(entity)
-        else:
-            bucket.append(entity)
-        self.entity_system_map[entity.id] = system_id
+        system_id = self._register(entity)
+        self.entities_by_system[system_id].add(entity)
 
     def add_entities(self, entities: list[GraphicEntity]) -> None:
+        added: Dict[RenderSystemID, list[GraphicEntity]] = {}
         for entity in entities:
-            self.add_entity(entity)
+            added.setdefault(self._register(entity), []).append(entity)
+        for system_id, bucket_entities in added.items():
+            self.entities_by_system[system_id].extend(bucket_entities)
 
     def remove_entity(self, entity: GraphicEntity) -> None:
         if entity.id is None:
@@ -56,6 +42,17 @@ class GraphicSystemManager:
         if bucket is not None and entity in bucket:
             bucket.remove(entity)
 
+    def _register(self, entity: GraphicEntity) -> RenderSystemID:
+        system_id = entity.system_id or self.default_system
+        if system_id not in self.graphic_systems:
+            raise ValueError(f"No graphic system registered for id '{system_id}'")
+
+        if entity.id is None:
+            self._id_counter += 1
+            entity.id = self._id_counter
+        self.entity_system_map[entity.id] = system_id
+        return system_id
+
     def draw_all(self, screen: pygame.Surface) -> None:
         for system_id, system in sorted(self.graphic_systems.items(), key=lambda kv: kv[1].priority):
             entities = self.entities_by_system.get(system_id, [])
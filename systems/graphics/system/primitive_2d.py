@@ -4,7 +4,6 @@ from systems.graphics.system import GraphicSystem
 from systems.graphics.entity import GraphicEntity
 from utils.math.primitive_surface import RectPrimitiveSurface, RotatedRectPrimitiveSurface, CirclePrimitiveSurface
 from utils.math.vector import Vector
-import math
 
 
 class Primitive2DGraphicSystem(GraphicSystem):
@@ -31,11 +30,10 @@ class Primitive2DGraphicSystem(GraphicSystem):
                 )
                 pygame.draw.rect(screen, surface.color, rect)
             elif isinstance(surface, RotatedRectPrimitiveSurface):
-                hw = surface.width / 2
-                hh = surface.height / 2
-                angle = surface.rotation
-                cos_a = math.cos(angle)
-                sin_a = math.sin(angle)
+                hw = surface.half_width
+                hh = surface.half_height
+                cos_a = surface.cos_rotation
+                sin_a = surface.sin_rotation
                 corners = [
                     Vector(-hw, -hh),
                     Vector(hw, -hh),
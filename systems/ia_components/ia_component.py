@@ -1,2 +1,31 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from entities.entity import Entity
+    from systems.physics.entity import PhysicEntity
+    from utils.math.vector import Vector
+
+
 class IAComponent:
-    pass
\ No newline at end of file
+    def reset(self) -> None:
+        pass
+
+
+class BatchIAComponent(ABC):
+    """IA evaluated for all its entities at once instead of one controller at a time."""
+
+    @abstractmethod
+    def add(self, entity: Entity) -> None:
+        raise NotImplementedError("Subclass must implement this method")
+
+    @abstractmethod
+    def remove(self, entity: Entity) -> None:
+        raise NotImplementedError("Subclass must implement this method")
+
+    @abstractmethod
+    def evaluate(self, position_of: Callable[[PhysicEntity], Vector]) -> None:
+        """Decide for every entity and hand each action to its BatchAIActionController."""
+        raise NotImplementedError("Subclass must implement this method")
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+
+from entities.entity_type import EntityType
+from systems.ia_components.slime_batch_ia import SlimeBatchIA, find_nearest_targets, random_walk, slime_action
+import settings
+
+if TYPE_CHECKING:
+    from entities.entity import Entity
+    from systems.physics.entity import PhysicEntity
+    from utils.math.vector import Vector
+
+
+# snapshot columns, one float64 row per entity
+X, Y, TYPE, DEAD, ORDER, ANGLE, ROTATION_SPEED, ROTATION_ACC = range(8)
+COLUMNS = 8
+TYPE_CODES = {entity_type: code for code, entity_type in enumerate(EntityType)}
+
+# blocks attached by this worker process, by name
+_attached: dict[str, SharedMemory] = {}
+
+
+def _attach(name: str) -> SharedMemory:
+    memory = _attached.get(name)
+    if memory is None:
+        # a new block means the previous one was replaced
+        for old in _attached.values():
+            old.close()
+        _attached.clear()
+        memory = _attached[name] = SharedMemory(name=name)
+    return memory
+
+
+def decide_rows(
+    snapshot: np.ndarray, start: int, stop: int, seed: int, frame: int, radius: float
+) -> tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+    """Slime decisions for rows [start, stop) of a snapshot: targets, moves and the new walk state.
+
+    The draws of a frame only depend on the seed and the frame number, so the
+    result does not depend on how the rows are split between workers.
+    """
+    count = len(snapshot)
+    rows = np.arange(start, stop)
+    positions = snapshot[:, X:Y + 1]
+    targetable = (snapshot[:, DEAD] == 0) & (snapshot[:, TYPE] == TYPE_CODES[EntityType.SLIME])
+    targets = find_nearest_targets(positions, targetable, snapshot[:, ORDER], radius, rows)
+
+    rng = np.random.default_rng((seed, frame))
+    acc_draws = rng.uniform(-0.05, 0.05, count)[start:stop]
+    turn_draws = rng.uniform(-1, 1, count)[start:stop]
+    state = snapshot[start:stop, ANGLE:ROTATION_ACC + 1].copy()
+    walking = targets < 0
+    angle, rotation_speed, rotation_acc = random_walk(
+        state[walking, 0], state[walking, 1], state[walking, 2], acc_draws[walking], turn_draws[walking]
+    )
+    state[walking, 0], state[walking, 1], state[walking, 2] = angle, rotation_speed, rotation_acc
+
+    directions = np.column_stack((np.cos(state[:, 0]), np.sin(state[:, 0])))
+    moves = np.where(walking[:, np.newaxis], directions, positions[targets] - positions[rows])
+    return start, targets, moves, state
+
+
+def _decide_shared(name: str, count: int, start: int, stop: int, seed: int, frame: int, radius: float):
+    memory = _attach(name)
+    snapshot = np.ndarray((count, COLUMNS), dtype=np.float64, buffer=memory.buf)
+    return decide_rows(snapshot, start, stop, seed, frame, radius)
+
+
+class ProcessPoolSlimeIA(SlimeBatchIA):
+    """SlimeBatchIA evaluated in a process pool, the actions arrive one frame later.
+
+    Each frame the positions, types, dead flags and walk state are written to a
+    shared memory snapshot and the rows are split between the workers. The
+    results are collected at the start of the next evaluate. Given a seed the
+    decisions are the same whatever the number of workers.
+    """
+
+    def __init__(
+        self,
+        perception_radius: float = settings.SLIME_PERCEPTION_RADIUS,
+        seed: int = settings.AI_SEED,
+        workers: int = settings.AI_PROCESS_POOL_WORKERS,
+        capacity: int = 64,
+    ):
+        if workers < 1:
+            raise ValueError("ProcessPoolSlimeIA needs at least one worker")
+        super().__init__(perception_radius, rng=np.random.default_rng(seed), capacity=capacity)
+        self.seed = seed
+        self.workers = workers
+        self.frame = 0
+        self._executor: ProcessPoolExecutor | None = None
+        self._memory: SharedMemory | None = None
+        self._pending: list[Future] = []
+        self._submitted: list[Entity | None] = []
+        self._submitted_rows: dict[int, int] = {}
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+        # spawn: the main process runs the physics thread and pygame, forking it is not safe
+        self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def stop(self) -> None:
+        if self._executor is None:
+            return
+        self._collect()
+        self._executor.shutdown()
+        self._executor = None
+        if self._memory is not None:
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+
+    def remove(self, entity: Entity) -> None:
+        super().remove(entity)
+        # a pending result must not reach the entity once it is recycled
+        row = self._submitted_rows.pop(id(entity), None)
+        if row is not None:
+            self._submitted[row] = None
+
+    def evaluate(self, position_of: Callable[[PhysicEntity], Vector]) -> None:
+        self.start()
+        self._collect()
+        entities = self.entities
+        count = len(entities)
+        if count == 0:
+            return
+
+        snapshot = np.ndarray((count, COLUMNS), dtype=np.float64, buffer=self._reserve(count).buf)
+        snapshot[:, X:Y + 1] = [position_of(entity.physics_entity).to_tuple() for entity in entities]
+        snapshot[:, TYPE] = [TYPE_CODES[entity.entity_type] for entity in entities]
+        snapshot[:, DEAD] = [entity.data_entity.data_storage.dead for entity in entities]
+        snapshot[:, ORDER] = [entity.id if entity.id is not None else 0 for entity in entities]
+        snapshot[:, ANGLE] = self.angle[:count]
+        snapshot[:, ROTATION_SPEED] = self.rotation_speed[:count]
+        snapshot[:, ROTATION_ACC] = self.rotation_acc[:count]
+
+        self._submitted = list(entities)
+        self._submitted_rows = {id(entity): row for row, entity in enumerate(entities)}
+        bounds = np.linspace(0, count, min(self.workers, count) + 1).astype(int).tolist()
+        self._pending = [
+            self._executor.submit(
+                _decide_shared, self._memory.name, count, start, stop, self.seed, self.frame, self.perception_radius
+            )
+            for start, stop in zip(bounds, bounds[1:])
+        ]
+        self.frame += 1
+
+    def _collect(self) -> None:
+        """Apply the results of the previous frame to the entities still in the batch."""
+        pending, self._pending = self._pending, []
+        submitted, self._submitted = self._submitted, []
+        self._submitted_rows = {}
+        slots = self.slots
+        for future in pending:
+            start, targets, moves, state = future.result()
+            for row, target, (move_x, move_y), (angle, rotation_speed, rotation_acc) in zip(
+                range(start, start + len(targets)), targets.tolist(), moves.tolist(), state.tolist()
+            ):
+                entity = submitted[row]
+                if entity is None:
+                    continue
+                slot = slots[id(entity)]
+                self.angle[slot] = angle
+                self.rotation_speed[slot] = rotation_speed
+                self.rotation_acc[slot] = rotation_acc
+                # a target removed in the meantime is not chased
+                target_entity = submitted[target] if target >= 0 else None
+                entity.action_entity.controller.action = slime_action(move_x, move_y, target_entity)
+
+    def _reserve(self, count: int) -> SharedMemory:
+        row_size = COLUMNS * np.dtype(np.float64).itemsize
+        if self._memory is None or self._memory.size < count * row_size:
+            if self._memory is not None:
+                self._memory.close()
+                self._memory.unlink()
+            # sized for the state arrays so it grows as rarely as they do
+            self._memory = SharedMemory(create=True, size=max(count, len(self.angle)) * row_size)
+        return self._memory
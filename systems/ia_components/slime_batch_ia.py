@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+
+from systems.ia_components.ia_component import BatchIAComponent
+from systems.actions.action.alive import AliveActionEntity
+from utils.math.vector import Vector
+import settings
+
+if TYPE_CHECKING:
+    from entities.entity import Entity
+    from systems.physics.entity import PhysicEntity
+
+
+def find_nearest_targets(
+    positions: np.ndarray, targetable: np.ndarray, order: np.ndarray, radius: float, rows: np.ndarray = None
+) -> np.ndarray:
+    """Index of the nearest targetable other row strictly within radius, -1 when there is none.
+
+    Ties go to the lowest order key. Targets are bucketed in a grid of radius
+    sized cells, so each row only looks at the 3x3 cells around it. Only the
+    given rows are searched for when rows is set.
+    """
+    rows = np.arange(len(positions)) if rows is None else rows
+    count = len(rows)
+    nearest = np.full(count, -1, dtype=np.intp)
+    target_index = np.flatnonzero(targetable)
+    if count == 0 or len(target_index) == 0:
+        return nearest
+
+    cells = np.floor(positions / radius).astype(np.int64)
+    min_x, min_y = cells[:, 0].min() - 1, cells[:, 1].min() - 1
+    stride = cells[:, 1].max() - min_y + 2
+    keys = (cells[:, 0] - min_x) * stride + (cells[:, 1] - min_y)
+    sort = np.argsort(keys[target_index], kind="stable")
+    sorted_targets = target_index[sort]
+    sorted_keys = keys[target_index][sort]
+
+    sources, targets = [], []
+    row_keys = keys[rows]
+    local = np.arange(count)
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            neighbour_keys = row_keys + dx * stride + dy
+            low = np.searchsorted(sorted_keys, neighbour_keys, "left")
+            counts = np.searchsorted(sorted_keys, neighbour_keys, "right") - low
+            total = counts.sum()
+            if total == 0:
+                continue
+            # expand the [low, low + count) ranges of every row into flat pairs
+            offsets = np.cumsum(counts) - counts
+            sources.append(np.repeat(local, counts))
+            targets.append(sorted_targets[np.repeat(low - offsets, counts) + np.arange(total)])
+    if not sources:
+        return nearest
+
+    source = np.concatenate(sources)
+    target = np.concatenate(targets)
+    delta = positions[target] - positions[rows[source]]
+    distance_squared = delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1]
+    keep = (rows[source] != target) & (distance_squared < radius * radius)
+    source, target, distance_squared = source[keep], target[keep], distance_squared[keep]
+
+    best = np.lexsort((order[target], distance_squared, source))
+    source, target = source[best], target[best]
+    first = np.ones(len(source), dtype=bool)
+    first[1:] = source[1:] != source[:-1]
+    nearest[source[first]] = target[first]
+    return nearest
+
+
+def random_walk(
+    angle: np.ndarray, rotation_speed: np.ndarray, rotation_acc: np.ndarray, acc_draws: np.ndarray, turn_draws: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """SlimeIA's wandering step, acc_draws in [-0.05, 0.05) and turn_draws in [-1, 1)."""
+    rotation_acc = np.clip(rotation_acc + acc_draws, -0.1, 0.1)
+    rotation_speed = np.clip(rotation_speed + rotation_acc, -0.3, 0.3)
+    return angle + rotation_speed * turn_draws, rotation_speed, rotation_acc
+
+
+def slime_action(move_x: float, move_y: float, target: Entity | None) -> AliveActionEntity:
+    return AliveActionEntity(move=Vector(move_x, move_y), pick=False, target=target, attack=target is not None)
+
+
+class SlimeBatchIA(BatchIAComponent):
+    """SlimeIA for every slime at once: chase the nearest living slime, else random walk.
+
+    The random walk state lives in arrays indexed by slot, rows are swap-removed.
+    """
+
+    def __init__(self, perception_radius: float = settings.SLIME_PERCEPTION_RADIUS, rng: np.random.Generator = None, capacity: int = 64):
+        self.perception_radius = perception_radius
+        # seeded from random by default, so seeding random makes the batch reproducible
+        self.rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+        self.entities: list[Entity] = []
+        self.slots: dict[int, int] = {}
+        self.angle = np.zeros(capacity)
+        self.rotation_speed = np.zeros(capacity)
+        self.rotation_acc = np.zeros(capacity)
+
+    def add(self, entity: Entity) -> None:
+        if id(entity) in self.slots:
+            return
+        slot = len(self.entities)
+        if slot == len(self.angle):
+            for name in ("angle", "rotation_speed", "rotation_acc"):
+                array = getattr(self, name)
+                setattr(self, name, np.concatenate((array, np.zeros(len(array)))))
+        self.angle[slot] = self.rng.uniform(0, 2 * np.pi)
+        self.rotation_speed[slot] = 0
+        self.rotation_acc[slot] = 0
+        self.slots[id(entity)] = slot
+        self.entities.append(entity)
+
+    def remove(self, entity: Entity) -> None:
+        slot = self.slots.pop(id(entity), None)
+        if slot is None:
+            return
+        last = len(self.entities) - 1
+        if slot != last:
+            moved = self.entities[last]
+            self.entities[slot] = moved
+            self.slots[id(moved)] = slot
+            for array in (self.angle, self.rotation_speed, self.rotation_acc):
+                array[slot] = array[last]
+        self.entities.pop()
+
+    def evaluate(self, position_of: Callable[[PhysicEntity], Vector]) -> None:
+        entities = self.entities
+        count = len(entities)
+        if count == 0:
+            return
+        positions = np.array([position_of(entity.physics_entity).to_tuple() for entity in entities], dtype=np.float64)
+        alive = np.fromiter((not entity.data_entity.data_storage.dead for entity in entities), dtype=bool, count=count)
+        order = np.fromiter((entity.id if entity.id is not None else 0 for entity in entities), dtype=np.int64, count=count)
+        targets = find_nearest_targets(positions, alive, order, self.perception_radius)
+
+        self._random_walk(targets < 0)
+        directions = np.column_stack((np.cos(self.angle[:count]), np.sin(self.angle[:count])))
+        moves = np.where((targets >= 0)[:, np.newaxis], positions[targets] - positions, directions)
+
+        for entity, target, (move_x, move_y) in zip(entities, targets.tolist(), moves.tolist()):
+            entity.action_entity.controller.action = slime_action(move_x, move_y, entities[target] if target >= 0 else None)
+
+    def _random_walk(self, walking: np.ndarray) -> None:
+        # same update as SlimeIA, only for the slimes that are not chasing
+        slots = np.flatnonzero(walking)
+        if len(slots) == 0:
+            return
+        self.angle[slots], self.rotation_speed[slots], self.rotation_acc[slots] = random_walk(
+            self.angle[slots],
+            self.rotation_speed[slots],
+            self.rotation_acc[slots],
+            self.rng.uniform(-0.05, 0.05, len(slots)),
+            self.rng.uniform(-1, 1, len(slots)),
+        )
@@ -5,10 +5,14 @@ from utils.math.vector import Vector
 from systems.actions.action.alive import AliveActionEntity
 from systems.actions.controller.ia import EntityPerception
 from entities.entity_type import EntityType
+import settings
 
 
 class SlimeIA(IAComponent):
     def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
         self.target_direction = Vector.random_unit_vector()
         self.rotation_speed = 0
         self.rotation_acc = 0
@@ -16,12 +20,13 @@ class SlimeIA(IAComponent):
 
     def action(self, entity_perception: EntityPerception):
         closest_slime = None
-        closest_slime_distance = float('inf')
+        closest_slime_distance_squared = settings.SLIME_PERCEPTION_RADIUS ** 2
         for entity_info in entity_perception.entities:
             if entity_info.type == EntityType.SLIME and not entity_info.entity.data_entity.data_storage.dead:
-                if entity_info.distance.length < 100 and entity_info.distance.length < closest_slime_distance:
+                distance_squared = entity_info.distance.length_squared
+                if distance_squared < closest_slime_distance_squared:
                     closest_slime = entity_info
-                    closest_slime_distance = entity_info.distance.length
+                    closest_slime_distance_squared = distance_squared
 
         if closest_slime:
             return AliveActionEntity(
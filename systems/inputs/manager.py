@@ -13,9 +13,9 @@ class InputSystemManager:
         if self.ui_input_system is not None:
             ui_input_entity = self.ui_input_system.handle(raw_input)
             if not self.ui_input_system.is_empty(ui_input_entity):
-                EventBus.emit(UIInputEvent(input_entity=ui_input_entity))
+                EventBus.active().emit(UIInputEvent(input_entity=ui_input_entity))
                 return 
 
         input_entity = self.input_system.handle(raw_input)
         if not self.input_system.is_empty(input_entity):
-            EventBus.emit(GameInputEvent(input_entity=input_entity))
+            EventBus.active().emit(GameInputEvent.acquire(input_entity))
@@ -0,0 +1,104 @@
+"""Binary recording of the raw input and frame time of a session.
+
+Layout, little endian: a header (magic, version, seed) then one record per frame:
+dt (f64), mouse x and y (i16), mouse buttons (u8 bitmask), pressed key count (u16),
+event count (u16), the pressed scancodes (u16 each) and the events as type (u32)
+and key (i32, 0 for events without a key). Other event attributes are not kept.
+"""
+import struct
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator
+
+import pygame
+
+from systems.inputs.raw_input import RawInput
+
+MAGIC = b"SLRP"
+VERSION = 1
+HEADER = struct.Struct("<4sHQ")
+FRAME = struct.Struct("<dhhBHH")
+SCANCODE = struct.Struct("<H")
+EVENT = struct.Struct("<Ii")
+KEY_EVENTS = (pygame.KEYDOWN, pygame.KEYUP)
+SCANCODE_COUNT = 512
+
+
+@dataclass(frozen=True, slots=True)
+class RecordedFrame:
+    raw_input: RawInput
+    dt: float
+
+
+class InputRecorder:
+    """Appends the RawInputSystem.poll output and dt of each frame to a file."""
+
+    def __init__(self, path: str, seed: int):
+        if not 0 <= seed < 2 ** 64:
+            raise ValueError(f"Seed {seed} does not fit the recording header, expected [0, 2**64)")
+        self.seed = seed
+        self.frames = 0
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, seed))
+
+    def record(self, raw_input: RawInput, dt: float) -> None:
+        pressed = [scancode for scancode, down in enumerate(raw_input.keys) if down]
+        buttons = sum(1 << index for index, down in enumerate(raw_input.pressed_keys) if down)
+        mouse_x, mouse_y = raw_input.mouse_position
+        write = self._file.write
+        write(FRAME.pack(dt, mouse_x, mouse_y, buttons, len(pressed), len(raw_input.events)))
+        for scancode in pressed:
+            write(SCANCODE.pack(scancode))
+        for event in raw_input.events:
+            write(EVENT.pack(event.type, getattr(event, "key", 0) if event.type in KEY_EVENTS else 0))
+        self.frames += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "InputRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class InputRecording:
+    """Reads a recording back, frame by frame.
+
+    Keys are rebuilt as a pygame ScancodeWrapper, indexing it by key code needs pygame.init().
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self._data = file.read()
+        if len(self._data) < HEADER.size:
+            raise ValueError(f"{path} is not an input recording")
+        magic, version, self.seed = HEADER.unpack_from(self._data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an input recording")
+        if version != VERSION:
+            raise ValueError(f"Unsupported input recording version {version}")
+
+    def __iter__(self) -> Iterator[RecordedFrame]:
+        data = self._data
+        offset = HEADER.size
+        while offset < len(data):
+            dt, mouse_x, mouse_y, buttons, key_count, event_count = FRAME.unpack_from(data, offset)
+            offset += FRAME.size
+            keys = [False] * SCANCODE_COUNT
+            for (scancode,) in SCANCODE.iter_unpack(data[offset:offset + key_count * SCANCODE.size]):
+                keys[scancode] = True
+            offset += key_count * SCANCODE.size
+            events = []
+            for event_type, key in EVENT.iter_unpack(data[offset:offset + event_count * EVENT.size]):
+                events.append(pygame.event.Event(event_type, key=key) if event_type in KEY_EVENTS else pygame.event.Event(event_type))
+            offset += event_count * EVENT.size
+            yield RecordedFrame(
+                raw_input=RawInput(
+                    keys=pygame.key.ScancodeWrapper(keys),
+                    events=events,
+                    mouse_position=(mouse_x, mouse_y),
+                    pressed_keys=tuple(bool(buttons >> index & 1) for index in range(3)),
+                ),
+                dt=dt,
+            )
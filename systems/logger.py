@@ -10,7 +10,7 @@ class LoggerManager:
         self.debug_enabled = settings.DEBUG
     
     def update(self):
-        events = EventBus.poll(ChannelEvent.LOGGING)
+        events = EventBus.active().poll(ChannelEvent.LOGGING)
         for event in events:
             if event.level == LogLevel.DEBUG and not self.debug_enabled:
                 continue
@@ -0,0 +1,94 @@
+import numpy as np
+
+from systems.physics.entity import PhysicEntity
+from utils.math.primitive_surface import CirclePrimitiveSurface
+
+
+class PhysicBodyStore:
+    """Struct-of-arrays storage for physic bodies.
+
+    Rows [0, count) are live and densely packed: removal swaps the last row into
+    the freed slot and updates the slot of the moved entity. The surface stays on
+    the entity; circles additionally get their radius cached in `radius`.
+    """
+
+    ARRAY_NAMES = ("position", "previous_position", "vel", "acc", "mass", "fixed", "sleeping", "sleep_timer", "is_circle", "radius")
+
+    def __init__(self, capacity: int = 64):
+        self.count = 0
+        self.entities: list[PhysicEntity] = []
+        self.position = np.zeros((capacity, 2), dtype=np.float64)
+        self.previous_position = np.zeros((capacity, 2), dtype=np.float64)
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.acc = np.zeros((capacity, 2), dtype=np.float64)
+        self.mass = np.ones(capacity, dtype=np.float64)
+        self.fixed = np.zeros(capacity, dtype=bool)
+        self.sleeping = np.zeros(capacity, dtype=bool)
+        self.sleep_timer = np.zeros(capacity, dtype=np.float64)
+        self.is_circle = np.zeros(capacity, dtype=bool)
+        self.radius = np.zeros(capacity, dtype=np.float64)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.mass)
+
+    def add(self, entity: PhysicEntity) -> int:
+        if entity.store is not None:
+            raise ValueError(f"PhysicEntity {entity.id} is already bound to a store")
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+
+        slot = self.count
+        self.position[slot] = entity.position.to_tuple()
+        self.previous_position[slot] = entity.previous_position.to_tuple()
+        self.vel[slot] = entity.vel.to_tuple()
+        self.acc[slot] = entity.acc.to_tuple()
+        self.mass[slot] = entity.mass
+        self.fixed[slot] = entity.fixed
+        self.sleeping[slot] = entity.sleeping
+        self.sleep_timer[slot] = entity.sleep_timer
+        self.is_circle[slot] = isinstance(entity.surface, CirclePrimitiveSurface)
+        self.radius[slot] = entity.surface.radius if self.is_circle[slot] else 0.0
+        self.entities.append(entity)
+        self.count += 1
+
+        entity.store = self
+        entity.slot = slot
+        return slot
+
+    def remove(self, entity: PhysicEntity) -> None:
+        if entity.store is not self:
+            return
+        slot = entity.slot
+
+        # hand the state back to the entity so it stays usable once unbound
+        position, previous_position = entity.position, entity.previous_position
+        vel, acc = entity.vel, entity.acc
+        mass, fixed = entity.mass, entity.fixed
+        sleeping, sleep_timer = entity.sleeping, entity.sleep_timer
+        entity.store = None
+        entity.slot = -1
+        entity.position, entity.previous_position = position, previous_position
+        entity.vel, entity.acc = vel, acc
+        entity.mass, entity.fixed = mass, fixed
+        entity.sleeping, entity.sleep_timer = sleeping, sleep_timer
+
+        last = self.count - 1
+        if slot != last:
+            for array in self._arrays():
+                array[slot] = array[last]
+            moved = self.entities[last]
+            self.entities[slot] = moved
+            moved.slot = slot
+        self.entities.pop()
+        self.count -= 1
+
+    def _grow(self, capacity: int) -> None:
+        for name in self.ARRAY_NAMES:
+            array = getattr(self, name)
+            grown = np.zeros((capacity, *array.shape[1:]), dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def _arrays(self) -> list[np.ndarray]:
+        return [getattr(self, name) for name in self.ARRAY_NAMES]
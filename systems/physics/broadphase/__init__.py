@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+from systems.physics.entity import PhysicEntity
+
+
+class Broadphase(ABC):
+    @abstractmethod
+    def add_entity(self, entity: PhysicEntity) -> None:
+        raise NotImplementedError("Subclass must implement this method")
+
+    @abstractmethod
+    def remove_entity(self, entity: PhysicEntity) -> None:
+        raise NotImplementedError("Subclass must implement this method")
+
+    @abstractmethod
+    def update(self) -> None:
+        """Refresh the structure after bodies have moved."""
+        raise NotImplementedError("Subclass must implement this method")
+
+    @abstractmethod
+    def find_potential_pairs(self) -> list[tuple[PhysicEntity, PhysicEntity]]:
+        raise NotImplementedError("Subclass must implement this method")
+
+    @abstractmethod
+    def query_aabb(self, min_x: float, min_y: float, max_x: float, max_y: float) -> list[PhysicEntity]:
+        """Bodies whose bounding box overlaps the given box, as of the last update."""
+        raise NotImplementedError("Subclass must implement this method")
@@ -0,0 +1,118 @@
+from systems.physics.broadphase import Broadphase
+from systems.physics.entity import PhysicEntity
+from utils.math.collision import compute_aabb
+import settings
+
+
+CellRange = tuple[int, int, int, int]
+
+
+class SpatialHashBroadphase(Broadphase):
+    """Persistent uniform grid, only re-buckets bodies whose cell range changed."""
+
+    def __init__(self, cell_size: float = settings.SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], set[int]] = {}
+        self.entities: dict[int, PhysicEntity] = {}
+        self.cell_ranges: dict[int, CellRange] = {}
+        self.dynamic_ids: set[int] = set()
+
+    def add_entity(self, entity: PhysicEntity) -> None:
+        if entity.id in self.entities:
+            return
+        cell_range = self._compute_cell_range(entity)
+        self.entities[entity.id] = entity
+        self.cell_ranges[entity.id] = cell_range
+        if not entity.fixed:
+            self.dynamic_ids.add(entity.id)
+        self._insert(entity.id, cell_range)
+
+    def remove_entity(self, entity: PhysicEntity) -> None:
+        cell_range = self.cell_ranges.pop(entity.id, None)
+        if cell_range is None:
+            return
+        self._remove(entity.id, cell_range)
+        self.dynamic_ids.discard(entity.id)
+        del self.entities[entity.id]
+
+    def update(self) -> None:
+        for entity_id in self.dynamic_ids:
+            cell_range = self._compute_cell_range(self.entities[entity_id])
+            old_cell_range = self.cell_ranges[entity_id]
+            if cell_range != old_cell_range:
+                self._remove(entity_id, old_cell_range)
+                self._insert(entity_id, cell_range)
+                self.cell_ranges[entity_id] = cell_range
+
+    def find_potential_pairs(self) -> list[tuple[PhysicEntity, PhysicEntity]]:
+        # Only cells touched by an awake moving body can hold a relevant pair,
+        # fixed/fixed and sleeping pairs are skipped for free.
+        cells = self.cells
+        entities = self.entities
+        pair_ids = set[tuple[int, int]]()
+        for entity_id in self.dynamic_ids:
+            if entities[entity_id].sleeping:
+                continue
+            cx0, cy0, cx1, cy1 = self.cell_ranges[entity_id]
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    for other_id in cells[(cx, cy)]:
+                        if other_id < entity_id:
+                            pair_ids.add((other_id, entity_id))
+                        elif other_id > entity_id:
+                            pair_ids.add((entity_id, other_id))
+
+        return [(entities[i], entities[j]) for i, j in pair_ids]
+
+    def query_aabb(self, min_x: float, min_y: float, max_x: float, max_y: float) -> list[PhysicEntity]:
+        cell_size = self.cell_size
+        cx0, cy0 = int(min_x // cell_size), int(min_y // cell_size)
+        cx1, cy1 = int(max_x // cell_size), int(max_y // cell_size)
+        candidate_ids = set[int]()
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self.cells):
+            # the box covers more cells than exist, walk the occupied ones instead
+            for (cx, cy), cell in self.cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    candidate_ids |= cell
+        else:
+            cells = self.cells
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    cell = cells.get((cx, cy))
+                    if cell:
+                        candidate_ids |= cell
+
+        result = []
+        for entity_id in candidate_ids:
+            entity = self.entities[entity_id]
+            e_min_x, e_min_y, e_max_x, e_max_y = compute_aabb(entity.position, entity.surface)
+            if e_min_x <= max_x and min_x <= e_max_x and e_min_y <= max_y and min_y <= e_max_y:
+                result.append(entity)
+        return result
+
+    def _compute_cell_range(self, entity: PhysicEntity) -> CellRange:
+        min_x, min_y, max_x, max_y = compute_aabb(entity.position, entity.surface)
+        return (
+            int(min_x // self.cell_size),
+            int(min_y // self.cell_size),
+            int(max_x // self.cell_size),
+            int(max_y // self.cell_size),
+        )
+
+    def _insert(self, entity_id: int, cell_range: CellRange) -> None:
+        cx0, cy0, cx1, cy1 = cell_range
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is None:
+                    cell = self.cells[(cx, cy)] = set()
+                cell.add(entity_id)
+
+    def _remove(self, entity_id: int, cell_range: CellRange) -> None:
+        cx0, cy0, cx1, cy1 = cell_range
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = self.cells[(cx, cy)]
+                cell.discard(entity_id)
+                if not cell:
+                    del self.cells[(cx, cy)]
@@ -0,0 +1,189 @@
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+
+from systems.physics.broadphase import Broadphase
+from systems.physics.entity import PhysicEntity
+from utils.math.collision import compute_aabb
+import settings
+
+
+# Endpoints are small mutable lists [value, kind, entity_id] so that plain list
+# comparison orders them by value, with MIN before MAX on ties (touching boxes overlap).
+MIN = 0
+MAX = 1
+
+_VALUE = itemgetter(0)
+
+
+class SweepAndPruneBroadphase(Broadphase):
+    """Sort-and-sweep on both axes with persistent endpoint lists.
+
+    Moving bodies only update their endpoint values; an insertion sort then
+    restores the order, and each swap of a MIN past a MAX (or the opposite)
+    adds (or drops) the corresponding pair. Frame coherence keeps the number of
+    swaps close to the number of bodies. Added bodies trigger a full re-sort,
+    removed bodies are only marked and their endpoints compacted in one pass.
+
+    Box queries bisect the sorted x axis; bodies wider than wide_width are kept
+    aside and always tested, so the window only extends wide_width to the left.
+    """
+
+    def __init__(self, wide_width: float = 4 * settings.SPATIAL_CELL_SIZE):
+        self.wide_width = wide_width
+        self.wide_ids: set[int] = set()
+        self.entities: dict[int, PhysicEntity] = {}
+        self.endpoints: dict[int, tuple[list, list, list, list]] = {}
+        self.axis_x: list[list] = []
+        self.axis_y: list[list] = []
+        self.dynamic_ids: set[int] = set()
+        self.pairs: set[tuple[int, int]] = set()
+        self.partners: dict[int, set[int]] = {}
+        self._removed_ids: set[int] = set()
+        self._needs_rebuild = False
+
+    def add_entity(self, entity: PhysicEntity) -> None:
+        if entity.id in self.entities:
+            return
+        if entity.id in self._removed_ids:
+            self._compact()
+        min_x, min_y, max_x, max_y = compute_aabb(entity.position, entity.surface)
+        endpoints = (
+            [min_x, MIN, entity.id],
+            [max_x, MAX, entity.id],
+            [min_y, MIN, entity.id],
+            [max_y, MAX, entity.id],
+        )
+        self.entities[entity.id] = entity
+        self.endpoints[entity.id] = endpoints
+        self.partners[entity.id] = set()
+        if not entity.fixed:
+            self.dynamic_ids.add(entity.id)
+        if max_x - min_x > self.wide_width:
+            self.wide_ids.add(entity.id)
+        self.axis_x += endpoints[0:2]
+        self.axis_y += endpoints[2:4]
+        self._needs_rebuild = True
+
+    def remove_entity(self, entity: PhysicEntity) -> None:
+        endpoints = self.endpoints.pop(entity.id, None)
+        if endpoints is None:
+            return
+        self._removed_ids.add(entity.id)
+        for other_id in self.partners.pop(entity.id):
+            self.partners[other_id].discard(entity.id)
+            self.pairs.discard((entity.id, other_id) if entity.id < other_id else (other_id, entity.id))
+        self.dynamic_ids.discard(entity.id)
+        self.wide_ids.discard(entity.id)
+        del self.entities[entity.id]
+
+    def update(self) -> None:
+        self._compact()
+        for entity_id in self.dynamic_ids:
+            entity = self.entities[entity_id]
+            min_x, min_y, max_x, max_y = compute_aabb(entity.position, entity.surface)
+            endpoint_min_x, endpoint_max_x, endpoint_min_y, endpoint_max_y = self.endpoints[entity_id]
+            endpoint_min_x[0] = min_x
+            endpoint_max_x[0] = max_x
+            endpoint_min_y[0] = min_y
+            endpoint_max_y[0] = max_y
+
+        if self._needs_rebuild:
+            self._rebuild()
+        else:
+            self._sort_axis(self.axis_x)
+            self._sort_axis(self.axis_y)
+
+    def find_potential_pairs(self) -> list[tuple[PhysicEntity, PhysicEntity]]:
+        if self._needs_rebuild:
+            self._rebuild()
+        entities = self.entities
+        pairs = []
+        for i, j in self.pairs:
+            entity1, entity2 = entities[i], entities[j]
+            if (entity1.fixed or entity1.sleeping) and (entity2.fixed or entity2.sleeping):
+                continue
+            pairs.append((entity1, entity2))
+        return pairs
+
+    def query_aabb(self, min_x: float, min_y: float, max_x: float, max_y: float) -> list[PhysicEntity]:
+        self._compact()
+        if self._needs_rebuild:
+            self._rebuild()
+        axis_x = self.axis_x
+        start = bisect_left(axis_x, min_x - self.wide_width, key=_VALUE)
+        end = bisect_right(axis_x, max_x, key=_VALUE)
+        wide_ids = self.wide_ids
+        candidate_ids = [
+            endpoint[2] for endpoint in axis_x[start:end]
+            if endpoint[1] == MIN and endpoint[2] not in wide_ids
+        ]
+        candidate_ids.extend(wide_ids)
+
+        result = []
+        for entity_id in candidate_ids:
+            e_min_x, e_max_x, e_min_y, e_max_y = self.endpoints[entity_id]
+            if e_min_x[0] <= max_x and min_x <= e_max_x[0] and e_min_y[0] <= max_y and min_y <= e_max_y[0]:
+                result.append(self.entities[entity_id])
+        return result
+
+    def _compact(self) -> None:
+        if not self._removed_ids:
+            return
+        removed_ids = self._removed_ids
+        self.axis_x[:] = [endpoint for endpoint in self.axis_x if endpoint[2] not in removed_ids]
+        self.axis_y[:] = [endpoint for endpoint in self.axis_y if endpoint[2] not in removed_ids]
+        removed_ids.clear()
+
+    def _sort_axis(self, axis: list[list]) -> None:
+        for k in range(1, len(axis)):
+            endpoint = axis[k]
+            j = k - 1
+            while j >= 0 and axis[j] > endpoint:
+                other = axis[j]
+                if endpoint[1] == MIN and other[1] == MAX:
+                    if self._overlaps(endpoint[2], other[2]):
+                        self._add_pair(endpoint[2], other[2])
+                elif endpoint[1] == MAX and other[1] == MIN:
+                    self._remove_pair(endpoint[2], other[2])
+                axis[j + 1] = other
+                j -= 1
+            axis[j + 1] = endpoint
+
+    def _rebuild(self) -> None:
+        self._compact()
+        self.axis_x.sort()
+        self.axis_y.sort()
+        self.pairs.clear()
+        for partners in self.partners.values():
+            partners.clear()
+
+        active: dict[int, None] = {}
+        for value, kind, entity_id in self.axis_x:
+            if kind == MIN:
+                for other_id in active:
+                    if self._overlaps(entity_id, other_id):
+                        self._add_pair(entity_id, other_id)
+                active[entity_id] = None
+            else:
+                del active[entity_id]
+        self._needs_rebuild = False
+
+    def _overlaps(self, id_a: int, id_b: int) -> bool:
+        min_xa, max_xa, min_ya, max_ya = self.endpoints[id_a]
+        min_xb, max_xb, min_yb, max_yb = self.endpoints[id_b]
+        return (
+            min_xa[0] <= max_xb[0] and min_xb[0] <= max_xa[0]
+            and min_ya[0] <= max_yb[0] and min_yb[0] <= max_ya[0]
+        )
+
+    def _add_pair(self, id_a: int, id_b: int) -> None:
+        if id_a not in self.dynamic_ids and id_b not in self.dynamic_ids:
+            return
+        self.pairs.add((id_a, id_b) if id_a < id_b else (id_b, id_a))
+        self.partners[id_a].add(id_b)
+        self.partners[id_b].add(id_a)
+
+    def _remove_pair(self, id_a: int, id_b: int) -> None:
+        self.pairs.discard((id_a, id_b) if id_a < id_b else (id_b, id_a))
+        self.partners[id_a].discard(id_b)
+        self.partners[id_b].discard(id_a)
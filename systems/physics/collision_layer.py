@@ -0,0 +1,12 @@
+from enum import IntFlag
+
+
+class CollisionLayer(IntFlag):
+    NONE = 0
+    DEFAULT = 1 << 0
+    SOLID = 1 << 1
+    ALIVE = 1 << 2
+    ITEM = 1 << 3
+    TRIGGER = 1 << 4
+    ALL = 0xFFFFFFFF
+
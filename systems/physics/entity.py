@@ -1,13 +1,177 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
+from typing import Optional, TYPE_CHECKING
+
 from utils.math.vector import Vector
 from utils.math.primitive_surface import PrimitiveSurface
+from systems.physics.collision_layer import CollisionLayer
+
+if TYPE_CHECKING:
+    from systems.physics.body_store import PhysicBodyStore
 
 
-@dataclass(slots=True)
 class PhysicEntity:
-    position: Vector
-    surface: PrimitiveSurface
-    vel: Vector = Vector.zero()
-    acc: Vector = Vector.zero()
-    mass: float = 1.0
-    fixed: bool = False
+    """Physic body, either standalone or a handle on a slot of a PhysicBodyStore.
+
+    While bound to a store, position, vel, acc, mass and fixed live in the store
+    arrays and the attributes below read/write that slot. previous_position is
+    the position at the start of the last physics step, used for interpolation.
+    Sleeping bodies are skipped by integration and pair generation until woken.
+
+    Two bodies collide only if each one's category is in the other's mask.
+    Sensors report overlaps but are never pushed nor push anything.
+    """
+
+    __slots__ = (
+        "_position", "_previous_position", "_vel", "_acc", "_mass", "_fixed",
+        "_sleeping", "_sleep_timer", "surface", "category", "mask", "sensor", "id", "store", "slot",
+    )
+
+    def __init__(
+        self,
+        position: Vector,
+        surface: PrimitiveSurface,
+        vel: Vector = Vector.zero(),
+        acc: Vector = Vector.zero(),
+        mass: float = 1.0,
+        fixed: bool = False,
+        category: int = CollisionLayer.DEFAULT,
+        mask: int = CollisionLayer.ALL,
+        sensor: bool = False,
+        id: Optional[int] = None,
+    ):
+        self._position = position
+        self._previous_position = position
+        self._vel = vel
+        self._acc = acc
+        self._mass = mass
+        self._fixed = fixed
+        self._sleeping = False
+        self._sleep_timer = 0.0
+        self.surface = surface
+        self.category = int(category)
+        self.mask = int(mask)
+        self.sensor = sensor
+        self.id = id
+        self.store: Optional[PhysicBodyStore] = None
+        self.slot: int = -1
+
+    @property
+    def position(self) -> Vector:
+        if self.store is None:
+            return self._position
+        return Vector(*self.store.position[self.slot].tolist())
+
+    @position.setter
+    def position(self, value: Vector) -> None:
+        if self.store is None:
+            self._position = value
+        else:
+            self.store.position[self.slot] = (value.x, value.y)
+
+    @property
+    def previous_position(self) -> Vector:
+        if self.store is None:
+            return self._previous_position
+        return Vector(*self.store.previous_position[self.slot].tolist())
+
+    @previous_position.setter
+    def previous_position(self, value: Vector) -> None:
+        if self.store is None:
+            self._previous_position = value
+        else:
+            self.store.previous_position[self.slot] = (value.x, value.y)
+
+    @property
+    def vel(self) -> Vector:
+        if self.store is None:
+            return self._vel
+        return Vector(*self.store.vel[self.slot].tolist())
+
+    @vel.setter
+    def vel(self, value: Vector) -> None:
+        if self.store is None:
+            self._vel = value
+        else:
+            self.store.vel[self.slot] = (value.x, value.y)
+
+    @property
+    def acc(self) -> Vector:
+        if self.store is None:
+            return self._acc
+        return Vector(*self.store.acc[self.slot].tolist())
+
+    @acc.setter
+    def acc(self, value: Vector) -> None:
+        if self.store is None:
+            self._acc = value
+        else:
+            self.store.acc[self.slot] = (value.x, value.y)
+
+    @property
+    def mass(self) -> float:
+        if self.store is None:
+            return self._mass
+        return float(self.store.mass[self.slot])
+
+    @mass.setter
+    def mass(self, value: float) -> None:
+        if self.store is None:
+            self._mass = value
+        else:
+            self.store.mass[self.slot] = value
+
+    @property
+    def fixed(self) -> bool:
+        if self.store is None:
+            return self._fixed
+        return bool(self.store.fixed[self.slot])
+
+    @fixed.setter
+    def fixed(self, value: bool) -> None:
+        if self.store is None:
+            self._fixed = value
+        else:
+            self.store.fixed[self.slot] = value
+
+    @property
+    def sleeping(self) -> bool:
+        if self.store is None:
+            return self._sleeping
+        return bool(self.store.sleeping[self.slot])
+
+    @sleeping.setter
+    def sleeping(self, value: bool) -> None:
+        if self.store is None:
+            self._sleeping = value
+        else:
+            self.store.sleeping[self.slot] = value
+
+    @property
+    def sleep_timer(self) -> float:
+        if self.store is None:
+            return self._sleep_timer
+        return float(self.store.sleep_timer[self.slot])
+
+    @sleep_timer.setter
+    def sleep_timer(self, value: float) -> None:
+        if self.store is None:
+            self._sleep_timer = value
+        else:
+            self.store.sleep_timer[self.slot] = value
+
+    def reset(self, position: Vector) -> None:
+        """Put a recycled body back at rest at position."""
+        self.position = position
+        self.previous_position = position
+        self.vel = Vector.zero()
+        self.acc = Vector.zero()
+        self.sleeping = False
+        self.sleep_timer = 0.0
+
+    def __repr__(self):
+        return (
+            f"PhysicEntity(position={self.position}, surface={self.surface}, vel={self.vel}, "
+            f"acc={self.acc}, mass={self.mass}, fixed={self.fixed}, sleeping={self.sleeping}, "
+            f"category={self.category}, mask={self.mask}, sensor={self.sensor}, id={self.id})"
+        )
@@ -1,32 +1,183 @@
+import contextlib
+import heapq
+import math
+from typing import Callable
+
 from systems.physics.system import PhysicSystem
 from systems.physics.entity import PhysicEntity
+from systems.physics.collision_layer import CollisionLayer
+from systems.physics.raycast_hit import RaycastHit
+from utils.containers import SortedList
+from utils.math.collision import raycast
+from utils.math.vector import Vector
+import settings
 
 
 class PhysicSystemManager:
-    def __init__(self, physic_system: PhysicSystem):
+    def __init__(
+        self,
+        physic_system: PhysicSystem,
+        timestep: float = settings.PHYSICS_TIMESTEP,
+        max_steps_per_frame: int = settings.PHYSICS_MAX_STEPS_PER_FRAME,
+    ):
         self.physic_system = physic_system
-        self.entities = []
+        self.entities = SortedList[PhysicEntity](physic_system.key_sort_function)
+        self._id_counter: int = 0
+
+        # fixed timestep simulation, the renderer interpolates between the last two steps
+        self.timestep = timestep
+        self.max_steps_per_frame = max_steps_per_frame
+        self.accumulator: float = 0.0
+        self.alpha: float = 1.0
+
+        # bodies moved since the query structures were last refreshed
+        self._queries_stale = False
+        self._query_lock = contextlib.nullcontext()
 
     def add_entity(self, entity: PhysicEntity) -> None:
-        if self.physic_system.key_sort_function is not None:
-            key_sort_function = self.physic_system.key_sort_function
-            key = key_sort_function(entity)
-            for i, e in enumerate[PhysicEntity](self.entities):
-                if key < key_sort_function(e):
-                    self.entities.insert(i, entity)
-                    return
-
-            self.entities.append(entity)
-        else:
-            self.entities.append(entity)
+        self._assign_id(entity)
+        self.entities.add(entity)
+        self.physic_system.add_entity(entity)
 
     def add_entities(self, entities: list[PhysicEntity]) -> None:
         for entity in entities:
-            self.add_entity(entity)
+            self._assign_id(entity)
+        self.entities.extend(entities)
+        for entity in entities:
+            self.physic_system.add_entity(entity)
 
     def remove_entity(self, entity: PhysicEntity) -> None:
         self.entities.remove(entity)
+        self.physic_system.remove_entity(entity)
 
     def update_all(self, dt: float) -> None:
+        self.accumulator += dt
+        steps = 0
+        while self.accumulator >= self.timestep and steps < self.max_steps_per_frame:
+            self.step(self.timestep)
+            self.accumulator -= self.timestep
+            steps += 1
+
+        # too far behind (spiral of death): drop the time we can not catch up
+        if self.accumulator >= self.timestep:
+            self.accumulator %= self.timestep
+        self.alpha = self.accumulator / self.timestep
+
+    def step(self, dt: float) -> None:
+        self.physic_system.save_previous_state(self.entities)
         self.physic_system.update_all(self.entities, dt)
         self.physic_system.resolve_collisions(self.entities)
+        self._queries_stale = True
+
+    def get_overlaps(self, entity: PhysicEntity) -> list[PhysicEntity]:
+        """Bodies currently overlapping the sensor (or sensors overlapping the body)."""
+        return self.physic_system.get_overlaps(entity)
+
+    def position_of(self, entity: PhysicEntity) -> Vector:
+        return entity.position
+
+    def interpolated_position(self, entity: PhysicEntity) -> Vector:
+        previous_position = entity.previous_position
+        return previous_position + (entity.position - previous_position) * self.alpha
+
+    def query_aabb(self, min_x: float, min_y: float, max_x: float, max_y: float) -> list[PhysicEntity]:
+        """Bodies whose bounding box overlaps the box."""
+        with self._query_lock:
+            return self._query_aabb(min_x, min_y, max_x, max_y)
+
+    def query_radius(
+        self, center: Vector, radius: float, predicate: Callable[[PhysicEntity], bool] = None
+    ) -> list[PhysicEntity]:
+        """Bodies whose position lies within radius of center."""
+        with self._query_lock:
+            return self._query_radius(center, radius, predicate)
+
+    def query_nearest(
+        self, point: Vector, k: int, predicate: Callable[[PhysicEntity], bool] = None
+    ) -> list[PhysicEntity]:
+        """The k bodies whose position is closest to point, nearest first."""
+        if k <= 0:
+            return []
+        with self._query_lock:
+            # grow the search radius until k bodies are found or every body was seen
+            radius = settings.SPATIAL_CELL_SIZE
+            while True:
+                candidates = self._query_aabb(point.x - radius, point.y - radius, point.x + radius, point.y + radius)
+                seen_all = len(candidates) >= len(self.entities)
+                in_range = []
+                for entity in candidates:
+                    if predicate is not None and not predicate(entity):
+                        continue
+                    dx = entity.position.x - point.x
+                    dy = entity.position.y - point.y
+                    distance_squared = dx * dx + dy * dy
+                    if seen_all or distance_squared <= radius * radius:
+                        in_range.append((distance_squared, entity.id, entity))
+                if len(in_range) >= k or seen_all:
+                    return [entity for _, _, entity in heapq.nsmallest(k, in_range)]
+                radius *= 2
+
+    def raycast(
+        self,
+        origin: Vector,
+        direction: Vector,
+        max_distance: float,
+        mask: CollisionLayer = CollisionLayer.ALL,
+        ignore: PhysicEntity = None,
+        include_sensors: bool = False,
+    ) -> RaycastHit | None:
+        """First body hit by the ray, sensors are skipped unless include_sensors."""
+        direction = direction.normalize()
+        if direction.x == 0 and direction.y == 0:
+            raise ValueError("Raycast direction must not be zero")
+
+        with self._query_lock:
+            # walk the ray in short segments so each box query stays small
+            segment_length = 2 * settings.SPATIAL_CELL_SIZE
+            tested = set[int]()
+            best_entity, best_distance = None, math.inf
+            start = 0.0
+            while start < max_distance:
+                end = min(start + segment_length, max_distance)
+                x0, y0 = origin.x + direction.x * start, origin.y + direction.y * start
+                x1, y1 = origin.x + direction.x * end, origin.y + direction.y * end
+                for entity in self._query_aabb(min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)):
+                    if entity.id in tested:
+                        continue
+                    tested.add(entity.id)
+                    if entity is ignore or not entity.category & mask or (entity.sensor and not include_sensors):
+                        continue
+                    distance = raycast(origin, direction, entity.position, entity.surface)
+                    if distance is not None and distance <= max_distance and distance < best_distance:
+                        best_entity, best_distance = entity, distance
+                # any hit closer than the end of this segment was found by now
+                if best_distance <= end:
+                    break
+                start = end
+
+        if best_entity is None:
+            return None
+        return RaycastHit(best_entity, best_distance, origin + direction * best_distance)
+
+    def _assign_id(self, entity: PhysicEntity) -> None:
+        if entity.id is None:
+            self._id_counter += 1
+            entity.id = self._id_counter
+
+    def _query_aabb(self, min_x: float, min_y: float, max_x: float, max_y: float) -> list[PhysicEntity]:
+        if self._queries_stale:
+            self.physic_system.prepare_queries()
+            self._queries_stale = False
+        return self.physic_system.query_aabb(self.entities, min_x, min_y, max_x, max_y)
+
+    def _query_radius(
+        self, center: Vector, radius: float, predicate: Callable[[PhysicEntity], bool] = None
+    ) -> list[PhysicEntity]:
+        radius_squared = radius * radius
+        result = []
+        for entity in self._query_aabb(center.x - radius, center.y - radius, center.x + radius, center.y + radius):
+            dx = entity.position.x - center.x
+            dy = entity.position.y - center.y
+            if dx * dx + dy * dy <= radius_squared and (predicate is None or predicate(entity)):
+                result.append(entity)
+        return result
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from systems.physics.entity import PhysicEntity
+from utils.math.vector import Vector
+
+
+@dataclass(frozen=True, slots=True)
+class RaycastHit:
+    entity: PhysicEntity
+    distance: float
+    point: Vector
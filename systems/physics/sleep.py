@@ -0,0 +1,64 @@
+from collections import defaultdict
+from typing import Iterable
+
+from systems.physics.entity import PhysicEntity
+from utils.math.vector import Vector
+import settings
+
+
+def wake(entity: PhysicEntity) -> None:
+    entity.sleeping = False
+    entity.sleep_timer = 0.0
+
+
+def put_to_sleep(entity: PhysicEntity) -> None:
+    entity.sleeping = True
+    entity.vel = Vector.zero()
+
+
+def update_sleep_islands(awake_bodies: Iterable[PhysicEntity], contacts: Iterable[tuple[PhysicEntity, PhysicEntity]]) -> None:
+    """Put islands of resting bodies to sleep and wake the disturbed ones.
+
+    An island is a group of non-fixed bodies connected by contacts. It falls
+    asleep only when every member has been still for SLEEP_TIME, and any
+    restless member wakes the sleeping bodies it touches.
+    """
+    bodies: dict[int, PhysicEntity] = {}
+    parent: dict[int, int] = {}
+
+    def find(entity_id: int) -> int:
+        root = entity_id
+        while parent[root] != root:
+            root = parent[root]
+        while parent[entity_id] != root:
+            parent[entity_id], entity_id = root, parent[entity_id]
+        return root
+
+    for body in awake_bodies:
+        bodies[body.id] = body
+        parent[body.id] = body.id
+
+    for entity1, entity2 in contacts:
+        if entity1.fixed or entity2.fixed:
+            continue
+        for body in (entity1, entity2):
+            if body.id not in parent:
+                bodies[body.id] = body
+                parent[body.id] = body.id
+        root1, root2 = find(entity1.id), find(entity2.id)
+        if root1 != root2:
+            parent[root2] = root1
+
+    islands = defaultdict[int, list[PhysicEntity]](list)
+    for entity_id, body in bodies.items():
+        islands[find(entity_id)].append(body)
+
+    for members in islands.values():
+        if all(body.sleeping or body.sleep_timer >= settings.SLEEP_TIME for body in members):
+            for body in members:
+                if not body.sleeping:
+                    put_to_sleep(body)
+        else:
+            for body in members:
+                if body.sleeping:
+                    wake(body)
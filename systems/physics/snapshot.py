@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from systems.physics.entity import PhysicEntity
+from utils.math.vector import Vector
+
+
+@dataclass(frozen=True, slots=True)
+class PhysicSnapshot:
+    """Immutable view of the simulation published after a physics frame."""
+    positions: Mapping[int, Vector] = field(default_factory=lambda: MappingProxyType({}))
+    previous_positions: Mapping[int, Vector] = field(default_factory=lambda: MappingProxyType({}))
+    alpha: float = 1.0
+    frame: int = 0
+
+    @staticmethod
+    def capture(entities: list[PhysicEntity], alpha: float, frame: int) -> "PhysicSnapshot":
+        return PhysicSnapshot(
+            positions=MappingProxyType({entity.id: entity.position for entity in entities}),
+            previous_positions=MappingProxyType({entity.id: entity.previous_position for entity in entities}),
+            alpha=alpha,
+            frame=frame,
+        )
+
+    def position(self, entity: PhysicEntity) -> Optional[Vector]:
+        return self.positions.get(entity.id)
+
+    def interpolated_position(self, entity: PhysicEntity) -> Optional[Vector]:
+        position = self.positions.get(entity.id)
+        if position is None:
+            return None
+        previous_position = self.previous_positions[entity.id]
+        return previous_position + (position - previous_position) * self.alpha
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 
 from systems.physics.entity import PhysicEntity
+from systems.event_bus import EventBus, Event
+from utils.math.collision import compute_aabb
 
 
 
@@ -12,6 +14,37 @@ class PhysicSystem(ABC):
 
     key_sort_function: KeySortFunction = None
 
+    def add_entity(self, entity: PhysicEntity) -> None:
+        pass
+
+    def remove_entity(self, entity: PhysicEntity) -> None:
+        pass
+
+    def get_overlaps(self, entity: PhysicEntity) -> list[PhysicEntity]:
+        return []
+
+    def emit_event(self, event: Event) -> None:
+        """Events raised during a step, replaced by a queue when the step runs off the main thread."""
+        EventBus.active().emit(event)
+
+    def prepare_queries(self) -> None:
+        """Bring the query structures up to date with the current positions."""
+        pass
+
+    def query_aabb(
+        self, entities: list[PhysicEntity], min_x: float, min_y: float, max_x: float, max_y: float
+    ) -> list[PhysicEntity]:
+        result = []
+        for entity in entities:
+            e_min_x, e_min_y, e_max_x, e_max_y = compute_aabb(entity.position, entity.surface)
+            if e_min_x <= max_x and min_x <= e_max_x and e_min_y <= max_y and min_y <= e_max_y:
+                result.append(entity)
+        return result
+
+    def save_previous_state(self, entities: list[PhysicEntity]) -> None:
+        for entity in entities:
+            entity.previous_position = entity.position
+
     @abstractmethod
     def update_all(self, entities: list[PhysicEntity], dt: float) -> None:
         raise NotImplementedError("Subclass must implement this method")
@@ -0,0 +1,116 @@
+import numpy as np
+
+from systems.physics.system.primitive_2d import Primitive2DPhysicsSystem
+from systems.physics.entity import PhysicEntity
+from systems.physics.body_store import PhysicBodyStore
+from systems.physics.broadphase import Broadphase
+from systems.physics.sleep import update_sleep_islands
+from utils.math.collision import resolve_collision, resolve_circle_vs_circle_batch
+import settings
+
+
+class Numpy2DPhysicsSystem(Primitive2DPhysicsSystem):
+    """Primitive2DPhysicsSystem backed by a PhysicBodyStore.
+
+    Registered PhysicEntity objects become handles on the store, every moving
+    body is integrated in a single vectorized step and circle/circle pairs go
+    through the batched narrowphase.
+    """
+
+    def __init__(self, broadphase: Broadphase = None):
+        super().__init__(broadphase)
+        self.store = PhysicBodyStore()
+
+    def add_entity(self, entity: PhysicEntity) -> None:
+        self.store.add(entity)
+        super().add_entity(entity)
+
+    def remove_entity(self, entity: PhysicEntity) -> None:
+        super().remove_entity(entity)
+        self.store.remove(entity)
+
+    def save_previous_state(self, entities: list[PhysicEntity]) -> None:
+        count = self.store.count
+        self.store.previous_position[:count] = self.store.position[:count]
+
+    def update_all(self, entities: list[PhysicEntity], dt: float) -> None:
+        count = self.store.count
+        if count == 0:
+            return
+        position = self.store.position[:count]
+        vel = self.store.vel[:count]
+        acc = self.store.acc[:count]
+        sleeping = self.store.sleeping[:count]
+        sleep_timer = self.store.sleep_timer[:count]
+
+        pushed = (acc != 0).any(axis=1)
+        woken = sleeping & pushed
+        sleeping[woken] = False
+        sleep_timer[woken] = 0.0
+        awake = ~self.store.fixed[:count] & ~sleeping
+        moving = awake[:, np.newaxis]
+
+        new_vel = vel + acc * dt
+        new_vel *= 1 - settings.ENTITY_FRICTION
+        speed = np.hypot(new_vel[:, 0], new_vel[:, 1])
+        too_fast = speed > settings.ENTITY_MAX_SPEED
+        if too_fast.any():
+            new_vel[too_fast] *= (settings.ENTITY_MAX_SPEED / speed[too_fast])[:, np.newaxis]
+
+        np.copyto(vel, new_vel, where=moving)
+        np.add(position, new_vel * dt, out=position, where=moving)
+
+        still = awake & ~pushed & (speed < settings.SLEEP_VELOCITY_THRESHOLD)
+        sleep_timer[still] += dt
+        sleep_timer[awake & ~still] = 0.0
+
+    def resolve_collisions(self, entities: list[PhysicEntity]) -> None:
+        count = self.store.count
+        potential_pairs = self._find_potential_pairs()
+        store = self.store
+        position = store.position[:count]
+        mass = store.mass[:count]
+        fixed = store.fixed[:count]
+
+        slot_a = np.fromiter((entity1.slot for entity1, _ in potential_pairs), dtype=np.intp, count=len(potential_pairs))
+        slot_b = np.fromiter((entity2.slot for _, entity2 in potential_pairs), dtype=np.intp, count=len(potential_pairs))
+
+        # share of the separation taken by each side, same rules as the per-pair path
+        ratio_a = mass[slot_a] / (mass[slot_a] + mass[slot_b])
+        weight_a = np.where(fixed[slot_a], 0.0, np.where(fixed[slot_b], 1.0, 1 - ratio_a))
+        weight_b = np.where(fixed[slot_b], 0.0, np.where(fixed[slot_a], 1.0, ratio_a))
+
+        circle_pairs = store.is_circle[slot_a] & store.is_circle[slot_b]
+        circle_a, circle_b = slot_a[circle_pairs], slot_b[circle_pairs]
+        circle_weight_a = weight_a[circle_pairs, np.newaxis]
+        circle_weight_b = weight_b[circle_pairs, np.newaxis]
+        other_indices = np.flatnonzero(~circle_pairs)
+        other_pairs = [(potential_pairs[k], weight_a[k], weight_b[k]) for k in other_indices]
+        circle_contact = np.zeros(len(circle_a), dtype=bool)
+        other_contact = set[int]()
+
+        for _ in range(settings.COLLISION_RESOLUTION_ITERATIONS):
+            corrections = np.zeros_like(position)
+
+            detected, mtv = resolve_circle_vs_circle_batch(circle_a, circle_b, position, store.radius)
+            circle_contact |= detected & mtv.any(axis=1)
+            np.add.at(corrections, circle_a, mtv * circle_weight_a)
+            np.add.at(corrections, circle_b, -mtv * circle_weight_b)
+
+            for k, ((entity1, entity2), share_a, share_b) in enumerate(other_pairs):
+                detected, correction_a, correction_b = resolve_collision(
+                    entity1.position, entity1.surface, entity2.position, entity2.surface
+                )
+                if detected and (correction_a.x != 0 or correction_a.y != 0):
+                    other_contact.add(other_indices[k])
+                    corrections[entity1.slot] += (correction_a * share_a).to_tuple()
+                    corrections[entity2.slot] += (correction_b * share_b).to_tuple()
+
+            position += corrections
+
+        contact_indices = [*np.flatnonzero(circle_pairs)[circle_contact], *other_contact]
+        awake = np.flatnonzero(~fixed & ~store.sleeping[:count])
+        update_sleep_islands(
+            (store.entities[slot] for slot in awake),
+            (potential_pairs[k] for k in contact_indices),
+        )
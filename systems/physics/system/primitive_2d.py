@@ -1,7 +1,11 @@
 from systems.physics.system import PhysicSystem
 from systems.physics.entity import PhysicEntity
-from utils.math.collision import resolve_collision, compute_aabb
-from utils.math.vector import Vector
+from systems.physics.broadphase import Broadphase
+from systems.physics.broadphase.spatial_hash import SpatialHashBroadphase
+from systems.physics.sleep import wake, update_sleep_islands
+from systems.event_bus.event.physics import SensorEnterEvent, SensorExitEvent
+from utils.math.collision import resolve_collision, detect_collision
+from utils.math.vector import Vector, MutableVector
 import settings
 
 from collections import defaultdict
@@ -14,68 +18,136 @@ class Primitive2DPhysicsSystem(PhysicSystem):
 
     key_sort_function = KeySortFunction()
 
+    def __init__(self, broadphase: Broadphase = None):
+        self.broadphase = broadphase if broadphase is not None else SpatialHashBroadphase()
+        self.entities_by_id: dict[int, PhysicEntity] = {}
+        self.sensor_overlaps: set[tuple[int, int]] = set()
+        # the same overlaps by body id, so a removal only touches its own pairs
+        self.sensor_partners: dict[int, set[int]] = {}
+
+    def add_entity(self, entity: PhysicEntity) -> None:
+        self.entities_by_id[entity.id] = entity
+        self.broadphase.add_entity(entity)
+
+    def remove_entity(self, entity: PhysicEntity) -> None:
+        self.entities_by_id.pop(entity.id, None)
+        self.broadphase.remove_entity(entity)
+        for other_id in self.sensor_partners.pop(entity.id, ()):
+            self._unlink_sensor_partner(other_id, entity.id)
+            self.sensor_overlaps.discard((entity.id, other_id) if entity.id < other_id else (other_id, entity.id))
+
+    def get_overlaps(self, entity: PhysicEntity) -> list[PhysicEntity]:
+        return [self.entities_by_id[other_id] for other_id in self.sensor_partners.get(entity.id, ())]
+
+    def prepare_queries(self) -> None:
+        self.broadphase.update()
+
+    def query_aabb(
+        self, entities: list[PhysicEntity], min_x: float, min_y: float, max_x: float, max_y: float
+    ) -> list[PhysicEntity]:
+        return self.broadphase.query_aabb(min_x, min_y, max_x, max_y)
+
     def update_all(self, entities: list[PhysicEntity], dt: float) -> None:
         for entity in entities:
             if entity.fixed:
                 continue
-            entity.vel += entity.acc * dt
-            entity.vel -= entity.vel * settings.ENTITY_FRICTION
-            if entity.vel.length > settings.ENTITY_MAX_SPEED:
-                entity.vel = entity.vel.normalize() * settings.ENTITY_MAX_SPEED
-            entity.position += entity.vel * dt
+            acc = entity.acc
+            pushed = acc.x != 0 or acc.y != 0
+            if entity.sleeping:
+                if not pushed:
+                    continue
+                wake(entity)
+            vel = MutableVector.from_vector(entity.vel)
+            vel.add_scaled(acc, dt).scale(1 - settings.ENTITY_FRICTION).clamp_length(settings.ENTITY_MAX_SPEED)
+            position = entity.position
+            entity.vel = vel.to_vector()
+            entity.position = Vector(position.x + vel.x * dt, position.y + vel.y * dt)
+
+            if not pushed and vel.length_squared < settings.SLEEP_VELOCITY_THRESHOLD ** 2:
+                entity.sleep_timer += dt
+            else:
+                entity.sleep_timer = 0.0
 
 
     def resolve_collisions(self, entities: list[PhysicEntity]) -> None:
-        potential_pairs = self._find_potential_pairs(entities)
+        potential_pairs = self._find_potential_pairs()
+        in_contact = set[int]()
         for _ in range(settings.COLLISION_RESOLUTION_ITERATIONS):
 
-            corrections = defaultdict[int, Vector](Vector)
-            for i, j in potential_pairs:
-                entity1 = entities[i]
-                entity2 = entities[j]
+            corrections = defaultdict[int, MutableVector](MutableVector)
+            for k, (entity1, entity2) in enumerate(potential_pairs):
                 detected, correction_a, correction_b = resolve_collision(
                     entity1.position, entity1.surface, entity2.position, entity2.surface
                 )
                 if detected and (correction_a.x != 0 or correction_a.y != 0):
+                    in_contact.add(k)
                     if not entity1.fixed and entity2.fixed:
-                        corrections[i] += correction_a
+                        corrections[entity1.id] += correction_a
                     elif entity1.fixed and not entity2.fixed:
-                        corrections[j] += correction_b
+                        corrections[entity2.id] += correction_b
                     else:
                         ratio1 = entity1.mass / (entity1.mass + entity2.mass)
                         ratio2 = 1 - ratio1
-                        corrections[i] += correction_a * ratio2
-                        corrections[j] += correction_b * ratio1
+                        corrections[entity1.id].add_scaled(correction_a, ratio2)
+                        corrections[entity2.id].add_scaled(correction_b, ratio1)
             
-            for i, correction in corrections.items():
-                if not entities[i].fixed:
-                    entities[i].position += correction
-
-    def _find_potential_pairs(self, entities: list[PhysicEntity]) -> list[tuple[int, int]]:
-        spatial_index = self._build_spatial_index(entities)
-        potential_pairs = set[tuple[int, int]]()
-        for entity_keys in spatial_index.values():
-            for i in entity_keys:
-                for j in entity_keys:
-                    if i < j and not (entities[i].fixed and entities[j].fixed):
-                        potential_pairs.add((i, j))
-        return potential_pairs
-
-    def _build_spatial_index(self, entities: list[PhysicEntity]) -> defaultdict[tuple[int, int], list[int]]:
-        index = defaultdict[tuple[int, int], list[int]](list)
-        for i, entity in enumerate[PhysicEntity](entities):
-            self._insert_entity_in_spatial_index(index, i, entities)
-        return index
-
-    def _insert_entity_in_spatial_index(self, index: defaultdict[tuple[int, int], list[int]], entity_id: int, entities: list[PhysicEntity]) -> None:
-        min_x, min_y, max_x, max_y = compute_aabb(entities[entity_id].position, entities[entity_id].surface)
-
-        cx0 = int(min_x // settings.SPATIAL_CELL_SIZE)
-        cy0 = int(min_y // settings.SPATIAL_CELL_SIZE)
-        cx1 = int(max_x // settings.SPATIAL_CELL_SIZE)
-        cy1 = int(max_y // settings.SPATIAL_CELL_SIZE)
-
-        for cx in range(cx0, cx1 + 1):
-            for cy in range(cy0, cy1 + 1):
-                index[(cx, cy)].append(entity_id)
+            for entity_id, correction in corrections.items():
+                entity = self.entities_by_id[entity_id]
+                if not entity.fixed:
+                    position = entity.position
+                    entity.position = Vector(position.x + correction.x, position.y + correction.y)
+
+        update_sleep_islands(
+            (entity for entity in entities if not entity.fixed and not entity.sleeping),
+            (potential_pairs[k] for k in in_contact),
+        )
+
+    def _find_potential_pairs(self) -> list[tuple[PhysicEntity, PhysicEntity]]:
+        """Broadphase pairs filtered by collision layers, sensor pairs are handled here."""
+        self.broadphase.update()
+        pairs = []
+        sensor_pairs = []
+        for entity1, entity2 in self.broadphase.find_potential_pairs():
+            if not (entity1.category & entity2.mask and entity2.category & entity1.mask):
+                continue
+            if entity1.sensor or entity2.sensor:
+                sensor_pairs.append((entity1, entity2))
+            else:
+                pairs.append((entity1, entity2))
+        self._update_sensor_overlaps(sensor_pairs)
+        return pairs
+
+    def _update_sensor_overlaps(self, sensor_pairs: list[tuple[PhysicEntity, PhysicEntity]]) -> None:
+        overlaps = set[tuple[int, int]]()
+        for entity1, entity2 in sensor_pairs:
+            if detect_collision(entity1.position, entity1.surface, entity2.position, entity2.surface):
+                overlaps.add((entity1.id, entity2.id) if entity1.id < entity2.id else (entity2.id, entity1.id))
+
+        # resting pairs are not generated by the broadphase, they keep overlapping
+        for pair in self.sensor_overlaps:
+            entity1, entity2 = self.entities_by_id[pair[0]], self.entities_by_id[pair[1]]
+            if (entity1.fixed or entity1.sleeping) and (entity2.fixed or entity2.sleeping):
+                overlaps.add(pair)
+
+        for id1, id2 in overlaps - self.sensor_overlaps:
+            self.sensor_partners.setdefault(id1, set()).add(id2)
+            self.sensor_partners.setdefault(id2, set()).add(id1)
+            self._emit_sensor_event(SensorEnterEvent, (id1, id2))
+        for id1, id2 in self.sensor_overlaps - overlaps:
+            self._unlink_sensor_partner(id1, id2)
+            self._unlink_sensor_partner(id2, id1)
+            self._emit_sensor_event(SensorExitEvent, (id1, id2))
+        self.sensor_overlaps = overlaps
+
+    def _unlink_sensor_partner(self, entity_id: int, other_id: int) -> None:
+        partners = self.sensor_partners[entity_id]
+        partners.discard(other_id)
+        if not partners:
+            del self.sensor_partners[entity_id]
 
+    def _emit_sensor_event(self, event_class: type, pair: tuple[int, int]) -> None:
+        entity1, entity2 = self.entities_by_id[pair[0]], self.entities_by_id[pair[1]]
+        if entity1.sensor:
+            self.emit_event(event_class(sensor=entity1, other=entity2))
+        if entity2.sensor:
+            self.emit_event(event_class(sensor=entity2, other=entity1))
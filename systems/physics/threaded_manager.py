@@ -0,0 +1,121 @@
+import queue
+import threading
+from typing import Callable
+
+from systems.physics.manager import PhysicSystemManager
+from systems.physics.entity import PhysicEntity
+from systems.physics.snapshot import PhysicSnapshot
+from systems.event_bus import EventBus, Event
+from utils.math.vector import Vector
+
+
+class ThreadedPhysicSystemManager(PhysicSystemManager):
+    """PhysicSystemManager stepping the simulation on a worker thread.
+
+    update_all only hands the frame time to the worker and returns. After each
+    frame the worker publishes a new immutable PhysicSnapshot by swapping a
+    single reference, so readers on the main thread never take a lock. Spatial
+    queries are the exception: they read the live bodies between two frames.
+    Structural changes are queued and applied by the worker between frames.
+    Events raised by the worker, sensor events, are queued too and emitted on
+    the main thread by the next update_all, wait or stop: the bus is main-thread only.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.snapshot = PhysicSnapshot()
+        self._frames: queue.Queue[float | None] = queue.Queue()
+        self._commands: queue.SimpleQueue[Callable[[], None]] = queue.SimpleQueue()
+        self._step_lock = threading.Lock()
+        self._query_lock = self._step_lock
+        self._thread: threading.Thread | None = None
+        self._frame_count = 0
+        self._events: queue.SimpleQueue[Event] = queue.SimpleQueue()
+        self.physic_system.emit_event = self._events.put
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="physics", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._frames.put(None)
+        self._thread.join()
+        self._thread = None
+        self._emit_events()
+
+    def wait(self) -> None:
+        """Block until every submitted frame has been simulated and published."""
+        self._frames.join()
+        self._emit_events()
+
+    def add_entity(self, entity: PhysicEntity) -> None:
+        # ids are handed out right away so the entity can be looked up in snapshots
+        self._assign_id(entity)
+        self._commands.put(lambda: PhysicSystemManager.add_entity(self, entity))
+
+    def add_entities(self, entities: list[PhysicEntity]) -> None:
+        entities = list(entities)
+        for entity in entities:
+            self._assign_id(entity)
+        self._commands.put(lambda: PhysicSystemManager.add_entities(self, entities))
+
+    def remove_entity(self, entity: PhysicEntity) -> None:
+        self._commands.put(lambda: PhysicSystemManager.remove_entity(self, entity))
+
+    def update_all(self, dt: float) -> None:
+        self.start()
+        self._emit_events()
+        self._frames.put(dt)
+
+    def position_of(self, entity: PhysicEntity) -> Vector:
+        position = self.snapshot.position(entity)
+        return position if position is not None else entity.position
+
+    def interpolated_position(self, entity: PhysicEntity) -> Vector:
+        position = self.snapshot.interpolated_position(entity)
+        return position if position is not None else entity.position
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            # when the worker fell behind, the late frames are simulated in one go
+            received = [self._frames.get()]
+            while True:
+                try:
+                    received.append(self._frames.get_nowait())
+                except queue.Empty:
+                    break
+            frames = received
+            if None in received:
+                running = False
+                frames = received[:received.index(None)]
+
+            if frames:
+                with self._step_lock:
+                    self._apply_commands()
+                    PhysicSystemManager.update_all(self, sum(frames))
+                    self._frame_count += 1
+                    self.snapshot = PhysicSnapshot.capture(self.entities, self.alpha, self._frame_count)
+            for _ in received:
+                self._frames.task_done()
+
+    def _apply_commands(self) -> None:
+        while True:
+            try:
+                command = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            command()
+
+    def _emit_events(self) -> None:
+        event_bus = EventBus.active()
+        while True:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                return
+            event_bus.emit(event)
@@ -0,0 +1,67 @@
+import pytest
+
+from entities.archetype import ArchetypeStore, signature_of
+from entities.entity import Entity
+from entities.entity_factory import EntityFactory
+from systems.actions.action_entity import ActionEntity
+from systems.actions.controller.ia import AIActionController
+from systems.data.storage.alive import AliveDataStorage
+from systems.graphics.entity import GraphicEntity
+from systems.ia_components.slime_ia import SlimeIA
+from systems.physics.entity import PhysicEntity
+
+
+def make_slime(x: float = 0, y: float = 0) -> Entity:
+    slime = EntityFactory.create_slime(x, y)
+    slime.action_entity.controller = AIActionController(SlimeIA())
+    return slime
+
+
+class TestArchetypeStore:
+    def test_entities_are_grouped_by_signature(self):
+        store = ArchetypeStore()
+        slimes = [make_slime() for _ in range(3)]
+        solid = EntityFactory.create_solid_rect(0, 0, 10, 10)
+        for entity in slimes + [solid]:
+            store.add(entity)
+
+        assert len(store.archetypes) == 2
+        assert [entity.id for entity in slimes + [solid]] == [1, 2, 3, 4]
+        (ai,) = store.query(AIActionController, AliveDataStorage)
+        assert ai.entities == slimes
+        assert ai.column(PhysicEntity) == [slime.physics_entity for slime in slimes]
+        assert ai.column(AIActionController) == [slime.action_entity.controller for slime in slimes]
+        assert {len(archetype) for archetype in store.query(PhysicEntity, GraphicEntity)} == {1, 3}
+
+    def test_swap_remove_keeps_rows_aligned(self):
+        store = ArchetypeStore()
+        slimes = [make_slime(x=i) for i in range(4)]
+        for slime in slimes:
+            store.add(slime)
+        store.remove(slimes[1])
+
+        (archetype,) = store.query(AIActionController)
+        assert archetype.entities == [slimes[0], slimes[3], slimes[2]]
+        assert archetype.column(PhysicEntity) == [e.physics_entity for e in archetype.entities]
+        assert archetype.rows == {slimes[0].id: 0, slimes[3].id: 1, slimes[2].id: 2}
+        assert slimes[1] not in store and len(store) == 3
+
+    def test_refresh_moves_entity_to_new_archetype(self):
+        store = ArchetypeStore()
+        entity = Entity(physics_entity=EntityFactory.create_slime(0, 0).physics_entity)
+        store.add(entity)
+        assert store.query(ActionEntity) == []
+
+        entity.action_entity = make_slime().action_entity
+        store.refresh(entity)
+        (archetype,) = store.query(ActionEntity)
+        assert archetype.entities == [entity]
+        assert archetype.signature == signature_of(entity)
+        assert sum(len(a) for a in store.query(PhysicEntity)) == 1
+
+    def test_adding_twice_raises(self):
+        store = ArchetypeStore()
+        slime = make_slime()
+        store.add(slime)
+        with pytest.raises(ValueError):
+            store.add(slime)
@@ -0,0 +1,84 @@
+import pytest
+
+from entities.command_buffer import CommandBuffer
+from entities.entity_factory import EntityFactory
+from entities.entity_pool import EntityPool
+from entities.entity_type import EntityType
+from systems.actions.controller.ia import AIActionController
+from systems.graphics.entity import GraphicEntity
+from systems.ia_components.slime_ia import SlimeIA
+from utils.math.vector import Vector
+from tests.systems.helpers import make_entity_manager
+
+
+@pytest.fixture
+def entity_manager():
+    return make_entity_manager(lambda: AIActionController(SlimeIA(), perception_radius=100, perception_types=None))
+
+
+def graphics_of(entity_manager) -> list[GraphicEntity]:
+    return [e for bucket in entity_manager.graphic_system_manager.entities_by_system.values() for e in bucket]
+
+
+class TestCommandBuffer:
+    def test_commands_wait_for_flush(self, entity_manager):
+        slime = EntityFactory.create_slime(10, 10)
+        entity_manager.commands.spawn(slime)
+        assert slime not in entity_manager.entities
+        entity_manager.flush()
+        assert slime in entity_manager.entities
+        assert slime.physics_entity in entity_manager.physics_system_manager.entities
+        assert slime in entity_manager.action_system_manager.entities
+
+        entity_manager.commands.despawn(slime)
+        entity_manager.flush()
+        assert slime not in entity_manager.entities
+        assert len(entity_manager.physics_system_manager.entities) == 0
+        assert graphics_of(entity_manager) == []
+        assert len(entity_manager.commands) == 0
+
+    def test_last_spawn_or_despawn_wins(self, entity_manager):
+        registered, transient = EntityFactory.create_slime(0, 0), EntityFactory.create_slime(5, 5)
+        entity_manager.add_entity(registered)
+        entity_manager.commands.despawn(registered)
+        entity_manager.commands.spawn(registered)
+        entity_manager.commands.spawn(transient)
+        entity_manager.commands.despawn(transient)
+        entity_manager.flush()
+        assert list(entity_manager.entities) == [registered]
+        assert list(entity_manager.physics_system_manager.entities) == [registered.physics_entity]
+
+    def test_component_change_re_registers_entity(self, entity_manager):
+        slime = EntityFactory.create_slime(0, 0)
+        entity_manager.add_entity(slime)
+        old_graphic = slime.graphic_entity
+        entity_manager.commands.set_components(slime, graphic_entity=None)
+        entity_manager.flush()
+        assert slime.graphic_entity is None
+        assert old_graphic not in graphics_of(entity_manager)
+
+        new_graphic = EntityFactory.create_slime(0, 0).graphic_entity
+        entity_manager.commands.set_components(slime, graphic_entity=new_graphic)
+        entity_manager.flush()
+        assert graphics_of(entity_manager) == [new_graphic]
+        entity_manager.physics_system_manager.step(1 / 60)
+        entity_manager.update_all(0)
+        assert new_graphic.position == slime.physics_entity.position
+
+    def test_recycled_despawn_returns_to_pool(self, entity_manager):
+        pool = EntityPool({EntityType.SLIME: EntityFactory.create_slime})
+        entity_manager.entity_pool = pool
+        slime = pool.acquire(EntityType.SLIME, 0, 0)
+        entity_manager.add_entity(slime)
+        entity_manager.commands.despawn(slime, recycle=True)
+        entity_manager.flush()
+        assert pool.pools[EntityType.SLIME] == [slime]
+
+        entity_manager.commands.spawn(pool.acquire(EntityType.SLIME, 20, 20))
+        entity_manager.flush()
+        assert slime in entity_manager.entities
+        assert slime.physics_entity.position == Vector(20, 20)
+
+    def test_unknown_component_raises(self):
+        with pytest.raises(ValueError):
+            CommandBuffer().set_components(EntityFactory.create_slime(0, 0), sprite=None)
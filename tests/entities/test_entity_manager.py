@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from entities.entity import Entity
+from entities.entity_factory import EntityFactory
+from entities.entity_manager import EntityManager
+from entities.entity_type import EntityType
+from systems.actions.controller.ia import AIActionController
+from systems.ia_components.slime_ia import SlimeIA
+from tests.systems.helpers import make_entity_manager
+
+
+def populate(entity_manager: EntityManager) -> list[Entity]:
+    rng = random.Random(11)
+    entities = [EntityFactory.create_player(200, 200), EntityFactory.create_solid_rect(150, 150, 60, 20)]
+    entities += [EntityFactory.create_slime(rng.uniform(0, 400), rng.uniform(0, 400)) for _ in range(80)]
+    entity_manager.add_entities(entities)
+    entity_manager.update_all(0)
+    return entities
+
+
+def perceived(entity: Entity) -> list[tuple]:
+    return [
+        (info.type, info.distance, info.entity)
+        for info in entity.action_entity.controller.perception.entities
+    ]
+
+
+class TestPerception:
+    def test_unlimited_perception_sees_every_body(self):
+        entity_manager = make_entity_manager(
+            lambda: AIActionController(SlimeIA(), perception_radius=None, perception_types=None)
+        )
+        entities = populate(entity_manager)
+        slime = entities[2]
+        assert [e for _, _, e in perceived(slime)] == [e for e in entities if e is not slime]
+
+    @pytest.mark.parametrize("perception_types", [None, (EntityType.SLIME,)])
+    def test_radius_limited_perception_matches_full_scan(self, perception_types: tuple | None):
+        reference = make_entity_manager(
+            lambda: AIActionController(SlimeIA(), perception_radius=None, perception_types=None)
+        )
+        reference_entities = populate(reference)
+        entity_manager = make_entity_manager(
+            lambda: AIActionController(SlimeIA(), perception_radius=100, perception_types=perception_types)
+        )
+        entities = populate(entity_manager)
+
+        for entity, reference_entity in zip(entities, reference_entities):
+            if entity.entity_type != EntityType.SLIME:
+                continue
+            expected = [
+                (info_type, distance, entities[reference_entities.index(other)])
+                for info_type, distance, other in perceived(reference_entity)
+                if distance.length_squared <= 100 ** 2
+                and (perception_types is None or info_type in perception_types)
+            ]
+            assert perceived(entity) == expected
+
+    def test_removed_entity_is_no_longer_perceived(self):
+        entity_manager = make_entity_manager(
+            lambda: AIActionController(SlimeIA(), perception_radius=100, perception_types=None)
+        )
+        entities = populate(entity_manager)
+        slime, neighbour = entities[2], perceived(entities[2])[0][2]
+        entity_manager.remove_entity(neighbour)
+        entity_manager.update_all(0)
+        assert neighbour not in [e for _, _, e in perceived(slime)]
@@ -0,0 +1,74 @@
+import pytest
+
+from entities.entity_factory import EntityFactory
+from entities.entity_pool import EntityPool
+from entities.entity_type import EntityType
+from systems.actions.controller.ia import AIActionController
+from systems.ia_components.slime_ia import SlimeIA
+from utils.math.vector import Vector
+from tests.systems.helpers import make_entity_manager
+
+
+@pytest.fixture
+def pool() -> EntityPool:
+    return EntityPool({EntityType.SLIME: EntityFactory.create_slime}, max_size=2)
+
+
+class TestEntityPool:
+    def test_released_entity_is_reused_and_reset(self, pool: EntityPool):
+        slime = pool.acquire(EntityType.SLIME, 10, 10)
+        slime.action_entity.controller = AIActionController(SlimeIA())
+        slime.physics_entity.position = Vector(50, 50)
+        slime.physics_entity.vel = Vector(3, 0)
+        slime.graphic_entity.active_surface = "dead"
+        slime.data_entity.data_storage.life = 0
+        slime.data_entity.data_storage.dead = True
+        assert pool.release(slime)
+
+        recycled = pool.acquire(EntityType.SLIME, 20, 30)
+        assert recycled is slime
+        assert recycled.physics_entity.position == Vector(20, 30)
+        assert recycled.physics_entity.previous_position == Vector(20, 30)
+        assert recycled.physics_entity.vel == Vector(0, 0)
+        assert recycled.graphic_entity.position == Vector(20, 30)
+        assert recycled.graphic_entity.active_surface == "static"
+        assert recycled.data_entity.data_storage.life == 50
+        assert not recycled.data_entity.data_storage.dead
+        assert recycled.action_entity.controller.perception is None
+        assert pool.stats[EntityType.SLIME].hits == 1
+        assert pool.stats[EntityType.SLIME].misses == 1
+        assert pool.stats[EntityType.SLIME].hit_rate == 0.5
+
+    def test_pool_is_bounded(self, pool: EntityPool):
+        slimes = [pool.acquire(EntityType.SLIME, 0, 0) for _ in range(3)]
+        assert [pool.release(slime) for slime in slimes] == [True, True, False]
+        assert pool.stats[EntityType.SLIME].discarded == 1
+        assert not pool.release(EntityFactory.create_player(0, 0))
+
+    def test_prefill(self, pool: EntityPool):
+        pool.prefill(EntityType.SLIME, 5)
+        assert len(pool.pools[EntityType.SLIME]) == 2
+        pool.acquire(EntityType.SLIME, 0, 0)
+        assert pool.stats[EntityType.SLIME].hits == 1
+        with pytest.raises(ValueError):
+            pool.acquire(EntityType.PLAYER, 0, 0)
+
+    def test_dead_entities_are_recycled_by_the_entity_manager(self, pool: EntityPool):
+        entity_manager = make_entity_manager(
+            lambda: AIActionController(SlimeIA(), perception_radius=100, perception_types=None)
+        )
+        entity_manager.entity_pool = pool
+        slime = pool.acquire(EntityType.SLIME, 10, 10)
+        entity_manager.add_entity(slime)
+        slime.data_entity.data_storage.dead = True
+        slime.data_entity.data_storage.time_before_delete = -1
+        entity_manager.update_all(0)
+        assert slime in entity_manager.entities
+        entity_manager.flush()
+        assert slime not in entity_manager.entities
+        assert pool.pools[EntityType.SLIME] == [slime]
+
+        recycled = pool.acquire(EntityType.SLIME, 30, 30)
+        entity_manager.add_entity(recycled)
+        entity_manager.physics_system_manager.step(1 / 60)
+        assert entity_manager.physics_system_manager.query_radius(Vector(30, 30), 1) == [recycled.physics_entity]
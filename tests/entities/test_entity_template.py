@@ -0,0 +1,55 @@
+import pytest
+
+from entities.entity_factory import EntityFactory, TEMPLATES
+from entities.entity_template import EntityTemplate, GraphicTemplate, PhysicsTemplate, TemplateRegistry
+from entities.entity_type import EntityType
+from systems.data.storage.alive import AliveDataStorage
+from utils.math.primitive_surface import CirclePrimitiveSurface
+from utils.math.vector import Vector
+
+
+class TestEntityTemplate:
+    def test_immutable_parts_are_shared(self):
+        a, b = EntityFactory.create_slime(0, 0), EntityFactory.create_slime(5, 5)
+        assert a.graphic_entity.surfaces is b.graphic_entity.surfaces
+        assert a.physics_entity.surface is b.physics_entity.surface
+        player = EntityFactory.create_player(0, 0)
+        assert player.graphic_entity.surfaces["walk"] is a.graphic_entity.surfaces["walk"]
+        assert player.audio_entity.sounds is EntityFactory.create_player(1, 1).audio_entity.sounds
+
+    def test_mutable_state_is_per_instance(self):
+        a, b = EntityFactory.create_slime(0, 0), EntityFactory.create_slime(5, 5)
+        assert a.physics_entity is not b.physics_entity
+        assert a.graphic_entity is not b.graphic_entity
+        assert a.action_entity is not b.action_entity
+        assert a.data_entity.data_storage is not b.data_entity.data_storage
+        a.data_entity.data_storage.life -= 10
+        assert b.data_entity.data_storage.life == 50
+        assert b.physics_entity.position == Vector(5, 5) == b.graphic_entity.position
+
+    def test_shared_surfaces_are_read_only(self):
+        slime = EntityFactory.create_slime(0, 0)
+        with pytest.raises(TypeError):
+            slime.graphic_entity.surfaces["walk"] = None
+
+    def test_create_many(self):
+        slimes = TEMPLATES.create_many("slime", [(i, 2 * i) for i in range(100)])
+        assert [slime.physics_entity.position for slime in slimes] == [Vector(i, 2 * i) for i in range(100)]
+        assert all(slime.entity_type == EntityType.SLIME for slime in slimes)
+
+    def test_registry(self):
+        registry = TemplateRegistry()
+        template = EntityTemplate(
+            entity_type=EntityType.VISUAL,
+            physics=PhysicsTemplate(surface=CirclePrimitiveSurface(radius=1)),
+            graphic=GraphicTemplate(surfaces={}, active_surface="static"),
+            data_storage=lambda: AliveDataStorage(max_life=3),
+        )
+        registry.register("dot", template)
+        with pytest.raises(ValueError):
+            registry.register("dot", template)
+        with pytest.raises(ValueError):
+            registry.create("missing", 0, 0)
+        dot = registry.create("dot", 1, 2)
+        assert dot.audio_entity is None and dot.action_entity is None
+        assert dot.data_entity.data_storage.max_life == 3
@@ -0,0 +1,41 @@
+import random
+
+from entities.entity_factory import EntityFactory
+from entities.entity_manager import EntityManager
+from systems.actions.action_entity import ActionControllerID, ActionSystemID
+from systems.actions.controller.player import PlayerActionController
+from systems.actions.manager import ActionSystemManager
+from systems.actions.system.alive import AliveActionSystem
+from systems.graphics.manager import GraphicSystemManager
+from systems.graphics.system import RenderSystemID
+from systems.graphics.system.primitive_2d import Primitive2DGraphicSystem
+from systems.physics.manager import PhysicSystemManager
+from systems.physics.system.primitive_2d import Primitive2DPhysicsSystem
+
+RADIUS = 100
+
+
+def make_entity_manager(slime_controller) -> EntityManager:
+    return EntityManager(
+        physics_system_manager=PhysicSystemManager(Primitive2DPhysicsSystem()),
+        graphic_system_manager=GraphicSystemManager(
+            {RenderSystemID.WORLD: Primitive2DGraphicSystem()},
+            default_system=RenderSystemID.WORLD,
+        ),
+        action_system_manager=ActionSystemManager(
+            controller_registry={
+                ActionControllerID.PLAYER: PlayerActionController,
+                ActionControllerID.AI_SLIME: slime_controller,
+            },
+            system_registry={ActionSystemID.ALIVE: AliveActionSystem},
+        ),
+    )
+
+
+def spawn_slimes(entity_manager: EntityManager, seed: int, count: int, size: float, dead_every: int = 7):
+    rng = random.Random(seed)
+    slimes = [EntityFactory.create_slime(rng.uniform(0, size), rng.uniform(0, size)) for _ in range(count)]
+    for index, slime in enumerate(slimes):
+        slime.data_entity.data_storage.dead = index % dead_every == 0
+    entity_manager.add_entities(slimes)
+    return slimes
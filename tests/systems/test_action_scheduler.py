@@ -0,0 +1,118 @@
+import pytest
+
+from entities.entity import Entity
+from systems.actions.action.alive import AliveActionEntity
+from systems.actions.action_entity import ActionEntity, ActionControllerID, ActionSystemID
+from systems.actions.controller import ActionController
+from systems.actions.controller.ia import AIActionController
+from systems.actions.manager import ActionSystemManager
+from systems.actions.scheduler import ActionScheduler
+from systems.actions.system import ActionSystem
+from systems.ia_components.ia_component import IAComponent
+from systems.physics.entity import PhysicEntity
+from utils.math.primitive_surface import CirclePrimitiveSurface
+from utils.math.vector import Vector
+
+
+class CountingIA(IAComponent):
+    def __init__(self):
+        self.calls = 0
+
+    def action(self, perception) -> AliveActionEntity:
+        self.calls += 1
+        return AliveActionEntity(move=Vector(self.calls, 0))
+
+
+class CountingPlayerController(ActionController):
+    def __init__(self):
+        self.calls = 0
+
+    def get_default_action(self) -> AliveActionEntity:
+        return AliveActionEntity()
+
+    def get_action(self) -> AliveActionEntity:
+        self.calls += 1
+        return AliveActionEntity()
+
+
+class NoopActionSystem(ActionSystem):
+    @classmethod
+    def apply_action(cls, dt: float, entity: Entity) -> None:
+        pass
+
+
+def make_entity(x: float, y: float, controller_id: ActionControllerID) -> Entity:
+    return Entity(
+        physics_entity=PhysicEntity(position=Vector(x, y), surface=CirclePrimitiveSurface(radius=3)),
+        action_entity=ActionEntity(system_id=ActionSystemID.ALIVE, controller_id=controller_id),
+    )
+
+
+@pytest.fixture
+def scheduler() -> ActionScheduler:
+    return ActionScheduler(budget_ms=1000, lod_intervals=((100, 1), (300, 4)), far_interval=10, view=(0, 0, 1000, 1000))
+
+
+def make_manager(scheduler: ActionScheduler = None) -> ActionSystemManager:
+    return ActionSystemManager(
+        controller_registry={
+            ActionControllerID.PLAYER: CountingPlayerController,
+            ActionControllerID.AI_SLIME: lambda: AIActionController(CountingIA()),
+        },
+        system_registry={ActionSystemID.ALIVE: NoopActionSystem},
+        scheduler=scheduler,
+    )
+
+
+class TestActionScheduler:
+    def test_interval_follows_distance_and_view(self, scheduler: ActionScheduler):
+        scheduler.focus = make_entity(500, 500, ActionControllerID.PLAYER)
+        assert scheduler.interval(make_entity(550, 500, ActionControllerID.AI_SLIME)) == 1
+        assert scheduler.interval(make_entity(700, 500, ActionControllerID.AI_SLIME)) == 4
+        assert scheduler.interval(make_entity(900, 900, ActionControllerID.AI_SLIME)) == 10
+        assert scheduler.interval(make_entity(-5, 500, ActionControllerID.AI_SLIME)) == 10
+
+    def test_budget_spreads_decisions_over_frames(self, scheduler: ActionScheduler):
+        scheduler.budget_ms = 0
+        entities = [make_entity(i, 0, ActionControllerID.AI_SLIME) for i in range(5)]
+        for entity in entities:
+            scheduler.add(entity)
+
+        decided = []
+        for _ in range(5):
+            assert scheduler.run(decided.append) == 1
+        # most overdue first, nobody starves
+        assert decided == entities
+
+    def test_removed_entity_is_not_decided(self, scheduler: ActionScheduler):
+        a, b = make_entity(0, 0, ActionControllerID.AI_SLIME), make_entity(1, 0, ActionControllerID.AI_SLIME)
+        scheduler.add(a)
+        scheduler.add(b)
+        scheduler.remove(a)
+        decided = []
+        scheduler.run(decided.append)
+        assert decided == [b] and not scheduler.is_due(a)
+
+
+class TestScheduledActionSystemManager:
+    def test_without_scheduler_every_controller_decides_every_frame(self):
+        manager = make_manager()
+        slime = make_entity(900, 900, ActionControllerID.AI_SLIME)
+        manager.add_entity(slime)
+        for _ in range(10):
+            manager.update_all(1 / 60)
+        assert slime.action_entity.controller.ia_component.calls == 10
+
+    def test_far_ai_decides_less_often_and_keeps_its_action(self, scheduler: ActionScheduler):
+        manager = make_manager(scheduler)
+        player = make_entity(100, 100, ActionControllerID.PLAYER)
+        near, far = make_entity(120, 100, ActionControllerID.AI_SLIME), make_entity(900, 900, ActionControllerID.AI_SLIME)
+        manager.add_entities([player, near, far])
+        scheduler.focus = player
+
+        for _ in range(20):
+            manager.update_all(1 / 60)
+        assert player.action_entity.controller.calls == 20
+        assert near.action_entity.controller.ia_component.calls == 20
+        assert far.action_entity.controller.ia_component.calls == 2
+        assert far.action_entity.current_action.move == Vector(2, 0)
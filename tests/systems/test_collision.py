@@ -0,0 +1,124 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from systems.graphics.surface import CircleGraphicSurface, RectGraphicSurface
+from utils.math.collision import (
+    compute_aabb,
+    detect_collision,
+    resolve_collision,
+    resolve_circle_vs_circle,
+    resolve_circle_vs_circle_batch,
+    detect_circle_vs_circle_batch,
+    raycast,
+)
+from utils.math.primitive_surface import (
+    PrimitiveSurface,
+    CirclePrimitiveSurface,
+    RectPrimitiveSurface,
+    RotatedRectPrimitiveSurface,
+)
+from utils.math.vector import Vector
+
+
+@pytest.fixture
+def circles() -> tuple[np.ndarray, np.ndarray]:
+    rng = random.Random(42)
+    positions = np.array([(rng.uniform(0, 40), rng.uniform(0, 40)) for _ in range(30)])
+    radii = np.array([rng.uniform(1, 6) for _ in range(30)])
+    return positions, radii
+
+
+class TestCircleBatch:
+    def test_batch_matches_reference(self, circles: tuple[np.ndarray, np.ndarray]):
+        positions, radii = circles
+        index_a, index_b = np.triu_indices(len(radii), k=1)
+        detected, mtv = resolve_circle_vs_circle_batch(index_a, index_b, positions, radii)
+
+        for k, (i, j) in enumerate(zip(index_a, index_b)):
+            ref_detected, ref_mtv, _ = resolve_circle_vs_circle(
+                Vector(*positions[i]), CirclePrimitiveSurface(radii[i]),
+                Vector(*positions[j]), CirclePrimitiveSurface(radii[j]),
+            )
+            assert detected[k] == ref_detected
+            assert mtv[k] == pytest.approx(ref_mtv.to_tuple())
+        assert detected.any() and not detected.all()
+
+    def test_detect_batch_matches_resolve(self, circles: tuple[np.ndarray, np.ndarray]):
+        positions, radii = circles
+        index_a, index_b = np.triu_indices(len(radii), k=1)
+        detected, _ = resolve_circle_vs_circle_batch(index_a, index_b, positions, radii)
+        assert (detect_circle_vs_circle_batch(index_a, index_b, positions, radii) == detected).all()
+
+    def test_concentric_circles_are_separated(self):
+        positions = np.array([[5.0, 5.0], [5.0, 5.0]])
+        radii = np.array([2.0, 3.0])
+        detected, mtv = resolve_circle_vs_circle_batch(np.array([0]), np.array([1]), positions, radii)
+        assert detected[0]
+        assert np.hypot(*mtv[0]) == pytest.approx(5)
+
+    def test_empty_batch(self):
+        detected, mtv = resolve_circle_vs_circle_batch(
+            np.array([], dtype=int), np.array([], dtype=int), np.zeros((0, 2)), np.zeros(0)
+        )
+        assert detected.shape == (0,) and mtv.shape == (0, 2)
+
+
+class TestDispatch:
+    def test_subclassed_surfaces_are_dispatched(self):
+        circle = CircleGraphicSurface(radius=3, color=(0, 0, 0))
+        rect = RectGraphicSurface(width=10, height=10, color=(0, 0, 0))
+        detected, mtv, _ = resolve_collision(Vector(0, 7), circle, Vector(0, 0), rect)
+        assert detected
+        assert mtv.y == pytest.approx(1)
+        assert detect_collision(Vector(0, 7), circle, Vector(0, 0), rect)
+
+    def test_unsupported_surface_raises(self):
+        with pytest.raises(ValueError):
+            resolve_collision(Vector(0, 0), PrimitiveSurface(), Vector(0, 0), CirclePrimitiveSurface(radius=1))
+        with pytest.raises(ValueError):
+            compute_aabb(Vector(0, 0), PrimitiveSurface())
+
+    def test_rotated_rect_geometry_is_cached(self):
+        rect = RotatedRectPrimitiveSurface(width=4, height=2, rotation=math.pi / 2)
+        assert rect.half_width == 2 and rect.half_height == 1
+        assert rect.extent_x == pytest.approx(1) and rect.extent_y == pytest.approx(2)
+        assert compute_aabb(Vector(10, 10), rect) == pytest.approx((9, 8, 11, 12))
+        assert rect == RotatedRectPrimitiveSurface(width=4, height=2, rotation=math.pi / 2)
+
+    def test_rect_vs_rotated_rect(self):
+        wall = RotatedRectPrimitiveSurface(width=100, height=10, rotation=math.pi / 4)
+        box = RectPrimitiveSurface(width=4, height=4)
+        detected, mtv, _ = resolve_collision(Vector(0, 0), box, Vector(0, 0), wall)
+        assert detected
+        assert mtv.length > 0
+        assert not detect_collision(Vector(40, -40), box, Vector(0, 0), wall)
+
+
+class TestRaycast:
+    def test_circle(self):
+        circle = CirclePrimitiveSurface(radius=2)
+        assert raycast(Vector(0, 0), Vector(1, 0), Vector(10, 0), circle) == pytest.approx(8)
+        assert raycast(Vector(0, 0), Vector(-1, 0), Vector(10, 0), circle) is None
+        assert raycast(Vector(0, 0), Vector(1, 0), Vector(10, 3), circle) is None
+        assert raycast(Vector(10, 1), Vector(1, 0), Vector(10, 0), circle) == 0
+
+    def test_rect(self):
+        rect = RectPrimitiveSurface(width=4, height=2)
+        assert raycast(Vector(0, 0), Vector(1, 0), Vector(10, 0), rect) == pytest.approx(8)
+        assert raycast(Vector(10, -5), Vector(0, 1), Vector(10, 0), rect) == pytest.approx(4)
+        assert raycast(Vector(0, 2), Vector(1, 0), Vector(10, 0), rect) is None
+
+    def test_rotated_rect(self):
+        wall = RotatedRectPrimitiveSurface(width=2, height=2, rotation=math.pi / 4)
+        # the diamond's corner points at the ray
+        assert raycast(Vector(0, 0), Vector(1, 0), Vector(10, 0), wall) == pytest.approx(10 - math.sqrt(2))
+        assert raycast(Vector(0, 1.5), Vector(1, 0), Vector(10, 0), wall) is None
+
+    def test_subclassed_surface(self):
+        circle = CircleGraphicSurface(radius=1, color=(0, 0, 0))
+        assert raycast(Vector(0, 0), Vector(0, 1), Vector(0, 5), circle) == pytest.approx(4)
+        with pytest.raises(ValueError):
+            raycast(Vector(0, 0), Vector(1, 0), Vector(0, 0), PrimitiveSurface())
@@ -2,7 +2,9 @@ import pytest
 
 from dataclasses import dataclass
 
-from systems.event_bus import EventBus, Event
+from systems.event_bus import EventBus, Event, ChannelEvent
+from systems.event_bus.event.audio import PlaySoundEvent
+from systems.event_bus.event.input import GameInputEvent
 
 
 @pytest.fixture
@@ -13,16 +15,197 @@ def event_bus() -> EventBus:
 class EventTest(Event):
     data_test: str
 
+@dataclass(frozen=True)
+class AudioEventTest(Event):
+    data_test: str
+    channel: ChannelEvent = ChannelEvent.AUDIO
+
 class TestEventBus:
     def test_emit(self, event_bus: EventBus):
         event_bus.emit(EventTest(data_test="test"))
-        event = event_bus.events[0]
-        assert len(event_bus.events) == 1
+        assert event_bus.pending() == 1
+        event = event_bus.poll()[0]
         assert isinstance(event, EventTest)
         assert event.data_test == "test"
     
     def test_poll(self, event_bus: EventBus):
-        event_bus.events.append(EventTest(data_test="test"))
+        event_bus.emit(EventTest(data_test="test"))
         events = event_bus.poll()[0]
         assert isinstance(events, EventTest)
         assert events.data_test == "test"
+        assert event_bus.pending() == 0
+
+    def test_poll_channel_only_takes_its_events(self, event_bus: EventBus):
+        event_bus.emit(EventTest(data_test="a"))
+        event_bus.emit(AudioEventTest(data_test="b"))
+        event_bus.emit(AudioEventTest(data_test="c"))
+        assert [event.data_test for event in event_bus.poll(ChannelEvent.AUDIO)] == ["b", "c"]
+        assert list(event_bus.poll(ChannelEvent.AUDIO)) == []
+        assert [event.data_test for event in event_bus.poll()] == ["a"]
+
+    def test_global_poll_keeps_emission_order(self, event_bus: EventBus):
+        for data in "abcde":
+            event_class = AudioEventTest if data in "bd" else EventTest
+            event_bus.emit(event_class(data_test=data))
+        assert [event.data_test for event in event_bus.poll()] == list("abcde")
+        assert event_bus.pending(ChannelEvent.AUDIO) == 0
+
+    def test_instances_are_independent(self, event_bus: EventBus):
+        previous = EventBus.set_active(event_bus)
+        try:
+            EventBus.active().emit(EventTest(data_test="test"))
+            assert previous.pending() == 0
+            assert event_bus.pending() == 1
+        finally:
+            EventBus.set_active(previous)
+
+    def test_reset(self, event_bus: EventBus):
+        previous = EventBus.set_active(event_bus)
+        try:
+            event_bus.emit(EventTest(data_test="test"))
+            assert EventBus.reset().pending() == 0
+            assert EventBus.active() is not event_bus
+        finally:
+            EventBus.set_active(previous)
+
+
+@dataclass(frozen=True)
+class ChildAudioEventTest(AudioEventTest):
+    pass
+
+
+class TestDispatch:
+    def test_handlers_by_class_and_channel(self, event_bus: EventBus):
+        by_class, by_channel, everything = [], [], []
+        event_bus.subscribe(AudioEventTest, by_class.append)
+        event_bus.subscribe(ChannelEvent.AUDIO, by_channel.append)
+        event_bus.subscribe(ChannelEvent.GLOBAL, everything.append)
+        events = [AudioEventTest(data_test="a"), EventTest(data_test="b"), ChildAudioEventTest(data_test="c")]
+        for event in events:
+            event_bus.emit(event)
+
+        assert event_bus.dispatch() == 3
+        assert by_class == [events[0], events[2]]
+        assert by_channel == [events[0], events[2]]
+        assert everything == events
+        assert event_bus.pending() == 0
+
+    def test_only_subscribed_channels_are_drained(self, event_bus: EventBus):
+        received = []
+        event_bus.subscribe(AudioEventTest, received.append)
+        event_bus.emit(EventTest(data_test="a"))
+        event_bus.emit(AudioEventTest(data_test="b"))
+        event_bus.dispatch()
+        assert [event.data_test for event in received] == ["b"]
+        assert [event.data_test for event in event_bus.poll()] == ["a"]
+
+    def test_events_emitted_by_handlers_wait_for_the_next_dispatch(self, event_bus: EventBus):
+        received = []
+
+        def handler(event):
+            received.append(event.data_test)
+            if event.data_test == "a":
+                event_bus.emit(AudioEventTest(data_test="b"))
+
+        event_bus.subscribe(ChannelEvent.AUDIO, handler)
+        event_bus.emit(AudioEventTest(data_test="a"))
+        event_bus.dispatch()
+        assert received == ["a"]
+        event_bus.dispatch()
+        assert received == ["a", "b"]
+
+    def test_unsubscribe(self, event_bus: EventBus):
+        received = []
+        event_bus.subscribe(AudioEventTest, received.append)
+        event_bus.unsubscribe(AudioEventTest, received.append)
+        event_bus.emit(AudioEventTest(data_test="a"))
+        assert event_bus.dispatch() == 0
+        assert received == []
+        assert event_bus.pending(ChannelEvent.AUDIO) == 1
+
+
+class TestPooledEvents:
+    def test_dispatched_records_are_reused(self, event_bus: EventBus):
+        entity = object()
+        keys = []
+        event_bus.subscribe(PlaySoundEvent, lambda event: keys.append((event.key_sound, event.entity)))
+        event = PlaySoundEvent.acquire("walk", entity)
+        event_bus.emit(event)
+        event_bus.dispatch()
+        assert event.entity is None
+        assert PlaySoundEvent.acquire("hit", entity) is event
+        event_bus.emit(event)
+        event_bus.dispatch()
+        assert keys == [("walk", entity), ("hit", entity)]
+
+    def test_polled_records_are_released_on_the_next_poll(self, event_bus: EventBus):
+        event = GameInputEvent.acquire(input_entity="input")
+        event_bus.emit(event)
+        assert list(event_bus.poll(ChannelEvent.INPUT_GAME)) == [event]
+        assert event.input_entity == "input"
+        event_bus.poll(ChannelEvent.INPUT_GAME)
+        assert event.input_entity is None
+        assert GameInputEvent.acquire(input_entity="next") is event
+
+    def test_poll_of_an_empty_channel_keeps_later_events(self, event_bus: EventBus):
+        assert list(event_bus.poll(ChannelEvent.INPUT_GAME)) == []
+        event = GameInputEvent.acquire(input_entity="input")
+        event_bus.emit(event)
+        events = event_bus.poll(ChannelEvent.INPUT_GAME)
+        assert list(events) == [event]
+        assert event.input_entity == "input"
+
+
+class TestStats:
+    def test_off_by_default(self, event_bus: EventBus):
+        assert event_bus.stats(ChannelEvent.AUDIO) is None
+
+    def test_throughput_and_depth(self):
+        event_bus = EventBus(stats=True)
+        for _ in range(3):
+            event_bus.emit(AudioEventTest(data_test="a"))
+        event_bus.end_frame()
+        event_bus.emit(AudioEventTest(data_test="b"))
+        event_bus.poll(ChannelEvent.AUDIO)
+        event_bus.emit(AudioEventTest(data_test="c"))
+        event_bus.end_frame()
+
+        stats = event_bus.stats(ChannelEvent.AUDIO)
+        assert stats.emitted == 5
+        assert stats.emitted_last_frame == 2
+        assert stats.max_depth == 4
+        assert stats.taken == 4
+        assert event_bus.stats(ChannelEvent.LOGGING).emitted == 0
+
+    def test_age_when_taken(self):
+        event_bus = EventBus(stats=True)
+        event_bus.emit(AudioEventTest(data_test="a"))
+        event_bus.end_frame()
+        event_bus.end_frame()
+        event_bus.emit(AudioEventTest(data_test="b"))
+        event_bus.emit(EventTest(data_test="c"))
+        event_bus.poll()
+
+        stats = event_bus.stats(ChannelEvent.AUDIO)
+        assert stats.max_age_frames == 2
+        assert stats.mean_age_frames == 1
+        assert stats.max_age_ms >= stats.mean_age_ms >= 0
+        assert event_bus.stats(ChannelEvent.GLOBAL).max_age_frames == 0
+
+        event_bus.subscribe(AudioEventTest, lambda event: None)
+        event_bus.emit(AudioEventTest(data_test="d"))
+        event_bus.end_frame()
+        event_bus.dispatch()
+        assert stats.max_age_frames == 1
+        assert stats.peak_age_frames == 2
+        assert stats.taken == 3
+
+    def test_overlay_flags_runaway_channels(self, monkeypatch):
+        from systems.event_bus.overlay import stats_lines
+
+        monkeypatch.setattr("settings.EVENT_BUS_DEPTH_WARNING", 2)
+        event_bus = EventBus(stats=True)
+        for _ in range(3):
+            event_bus.emit(AudioEventTest(data_test="a"))
+        warnings = {text.split()[0]: warning for text, warning in stats_lines(event_bus)[1:]}
+        assert warnings["audio"] and not warnings["logging"]
@@ -0,0 +1,522 @@
+import random
+import threading
+
+import pytest
+
+import settings
+
+from systems.event_bus import EventBus, ChannelEvent
+from systems.event_bus.event.physics import SensorEnterEvent, SensorExitEvent
+from systems.physics.collision_layer import CollisionLayer
+from systems.physics.entity import PhysicEntity
+from systems.physics.manager import PhysicSystemManager
+from systems.physics.threaded_manager import ThreadedPhysicSystemManager
+from systems.physics.broadphase.spatial_hash import SpatialHashBroadphase
+from systems.physics.broadphase.sweep_and_prune import SweepAndPruneBroadphase
+from systems.physics.system.primitive_2d import Primitive2DPhysicsSystem
+from systems.physics.system.numpy_2d import Numpy2DPhysicsSystem
+from utils.math.primitive_surface import CirclePrimitiveSurface, RectPrimitiveSurface
+from utils.math.vector import Vector
+from utils.math.collision import compute_aabb
+
+
+def make_circle(x: float, y: float, radius: float = 3, fixed: bool = False) -> PhysicEntity:
+    return PhysicEntity(position=Vector(x, y), surface=CirclePrimitiveSurface(radius=radius), fixed=fixed)
+
+
+def make_rect(x: float, y: float, width: float, height: float) -> PhysicEntity:
+    return PhysicEntity(position=Vector(x, y), surface=RectPrimitiveSurface(width=width, height=height), fixed=True)
+
+
+def pair_ids(pairs: list[tuple[PhysicEntity, PhysicEntity]]) -> set[tuple[int, int]]:
+    return {tuple(sorted((a.id, b.id))) for a, b in pairs}
+
+
+@pytest.fixture(params=[Primitive2DPhysicsSystem, Numpy2DPhysicsSystem])
+def manager(request) -> PhysicSystemManager:
+    return PhysicSystemManager(request.param(SpatialHashBroadphase(cell_size=50)))
+
+
+class TestSpatialHashBroadphase:
+    def test_add_entity_assigns_ids(self, manager: PhysicSystemManager):
+        a, b = make_circle(10, 10), make_circle(12, 10)
+        manager.add_entities([a, b])
+        assert a.id is not None and b.id is not None and a.id != b.id
+
+    def test_close_bodies_are_paired(self, manager: PhysicSystemManager):
+        a, b, far = make_circle(10, 10), make_circle(12, 10), make_circle(400, 400)
+        manager.add_entities([a, b, far])
+        assert pair_ids(manager.physic_system.broadphase.find_potential_pairs()) == {tuple(sorted((a.id, b.id)))}
+
+    def test_fixed_pairs_are_skipped(self, manager: PhysicSystemManager):
+        manager.add_entities([make_rect(0, 0, 100, 10), make_rect(0, 0, 10, 100)])
+        assert manager.physic_system.broadphase.find_potential_pairs() == []
+
+    def test_body_is_rebucketed_only_when_its_cells_change(self, manager: PhysicSystemManager):
+        broadphase = manager.physic_system.broadphase
+        a = make_circle(10, 10)
+        manager.add_entity(a)
+        cells_before = broadphase.cell_ranges[a.id]
+
+        a.position = Vector(11, 11)
+        broadphase.update()
+        assert broadphase.cell_ranges[a.id] == cells_before
+
+        a.position = Vector(210, 10)
+        broadphase.update()
+        assert broadphase.cell_ranges[a.id] != cells_before
+        assert all(a.id not in broadphase.cells.get((cx, cy), ()) for cx in range(0, 1) for cy in range(0, 1))
+
+    def test_remove_entity_clears_cells(self, manager: PhysicSystemManager):
+        a = make_circle(10, 10)
+        manager.add_entity(a)
+        manager.remove_entity(a)
+        assert manager.physic_system.broadphase.cells == {}
+
+
+def brute_force_pairs(bodies: list[PhysicEntity]) -> set[tuple[int, int]]:
+    pairs = set()
+    for i, a in enumerate(bodies):
+        for b in bodies[i + 1:]:
+            if a.fixed and b.fixed:
+                continue
+            ax0, ay0, ax1, ay1 = compute_aabb(a.position, a.surface)
+            bx0, by0, bx1, by1 = compute_aabb(b.position, b.surface)
+            if ax0 <= bx1 and bx0 <= ax1 and ay0 <= by1 and by0 <= ay1:
+                pairs.add(tuple(sorted((a.id, b.id))))
+    return pairs
+
+
+@pytest.fixture(params=[lambda: SpatialHashBroadphase(cell_size=50), SweepAndPruneBroadphase])
+def broadphase_manager(request) -> PhysicSystemManager:
+    return PhysicSystemManager(Primitive2DPhysicsSystem(request.param()))
+
+
+class TestBroadphase:
+    def test_pairs_follow_moving_bodies(self, broadphase_manager: PhysicSystemManager):
+        rng = random.Random(3)
+        broadphase = broadphase_manager.physic_system.broadphase
+        bodies = [make_circle(rng.uniform(0, 200), rng.uniform(0, 200), rng.uniform(2, 8)) for _ in range(60)]
+        walls = [make_rect(100, -10, 240, 20), make_rect(-10, 100, 20, 240)]
+        broadphase_manager.add_entities(walls + bodies)
+
+        for _ in range(10):
+            for body in bodies:
+                body.position += Vector(rng.uniform(-6, 6), rng.uniform(-6, 6))
+            broadphase.update()
+            found = pair_ids(broadphase.find_potential_pairs())
+            # the grid is conservative, sweep and prune is exact
+            assert brute_force_pairs(walls + bodies) <= found
+            if isinstance(broadphase, SweepAndPruneBroadphase):
+                assert found == brute_force_pairs(walls + bodies)
+
+    def test_removed_body_leaves_no_pair(self, broadphase_manager: PhysicSystemManager):
+        broadphase = broadphase_manager.physic_system.broadphase
+        a, b = make_circle(10, 10), make_circle(12, 10)
+        broadphase_manager.add_entities([a, b])
+        broadphase.update()
+        broadphase_manager.remove_entity(b)
+        broadphase.update()
+        assert broadphase.find_potential_pairs() == []
+
+    def test_remove_a_large_batch(self, broadphase_manager: PhysicSystemManager):
+        rng = random.Random(4)
+        broadphase = broadphase_manager.physic_system.broadphase
+        bodies = [make_circle(rng.uniform(0, 400), rng.uniform(0, 400), rng.uniform(2, 8)) for _ in range(2000)]
+        broadphase_manager.add_entities(bodies)
+        broadphase.update()
+
+        removed, kept = bodies[:1500], bodies[1500:]
+        for body in removed:
+            broadphase_manager.remove_entity(body)
+        broadphase_manager.add_entity(removed[0])
+        kept.append(removed[0])
+        broadphase.update()
+
+        assert pair_ids(broadphase.find_potential_pairs()) >= brute_force_pairs(kept)
+        if isinstance(broadphase, SweepAndPruneBroadphase):
+            assert pair_ids(broadphase.find_potential_pairs()) == brute_force_pairs(kept)
+            assert len(broadphase.axis_x) == len(broadphase.axis_y) == 2 * len(kept)
+        assert {body.id for body in broadphase.query_aabb(-10, -10, 410, 410)} == {body.id for body in kept}
+
+
+@pytest.fixture(params=[None, lambda: SpatialHashBroadphase(cell_size=50), SweepAndPruneBroadphase])
+def query_manager(request) -> PhysicSystemManager:
+    if request.param is None:
+        return PhysicSystemManager(Numpy2DPhysicsSystem())
+    return PhysicSystemManager(Primitive2DPhysicsSystem(request.param()))
+
+
+class TestSpatialQueries:
+    @pytest.fixture
+    def bodies(self, query_manager: PhysicSystemManager) -> list[PhysicEntity]:
+        rng = random.Random(5)
+        bodies = [make_circle(rng.uniform(0, 500), rng.uniform(0, 500), rng.uniform(2, 6)) for _ in range(150)]
+        walls = [make_rect(250, -10, 520, 20), make_rect(250, 250, 30, 30)]
+        query_manager.add_entities(walls + bodies)
+        return walls + bodies
+
+    def test_aabb_matches_brute_force(self, query_manager: PhysicSystemManager, bodies: list[PhysicEntity]):
+        rng = random.Random(6)
+        for _ in range(30):
+            x, y = rng.uniform(-50, 500), rng.uniform(-50, 500)
+            box = (x, y, x + rng.uniform(0, 150), y + rng.uniform(0, 150))
+            expected = set()
+            for body in bodies:
+                bx0, by0, bx1, by1 = compute_aabb(body.position, body.surface)
+                if bx0 <= box[2] and box[0] <= bx1 and by0 <= box[3] and box[1] <= by1:
+                    expected.add(body.id)
+            assert {body.id for body in query_manager.query_aabb(*box)} == expected
+
+    def test_radius_matches_brute_force(self, query_manager: PhysicSystemManager, bodies: list[PhysicEntity]):
+        center = Vector(200, 300)
+        expected = {body.id for body in bodies if (body.position - center).length <= 80}
+        assert {body.id for body in query_manager.query_radius(center, 80)} == expected
+
+    def test_queries_follow_simulation(self, query_manager: PhysicSystemManager, bodies: list[PhysicEntity]):
+        body = bodies[-1]
+        body.acc = Vector(3000, 0)
+        for _ in range(30):
+            query_manager.step(1 / 60)
+        assert body in query_manager.query_radius(body.position, 1)
+
+    def test_nearest(self, query_manager: PhysicSystemManager, bodies: list[PhysicEntity]):
+        point = Vector(120, 40)
+        expected = sorted(bodies, key=lambda body: ((body.position - point).length_squared, body.id))
+        assert query_manager.query_nearest(point, 5) == expected[:5]
+        assert query_manager.query_nearest(Vector(5000, 5000), 3) == sorted(
+            bodies, key=lambda body: ((body.position - Vector(5000, 5000)).length_squared, body.id)
+        )[:3]
+        assert len(query_manager.query_nearest(point, 1000)) == len(bodies)
+
+    def test_nearest_with_predicate(self, query_manager: PhysicSystemManager, bodies: list[PhysicEntity]):
+        nearest = query_manager.query_nearest(Vector(250, 250), 1, predicate=lambda body: not body.fixed)
+        assert len(nearest) == 1 and not nearest[0].fixed
+
+    def test_raycast_returns_first_hit(self, query_manager: PhysicSystemManager):
+        near, far = make_circle(100, 0, radius=5), make_circle(300, 0, radius=5)
+        wall = make_rect(500, 0, 10, 100)
+        query_manager.add_entities([far, wall, near])
+
+        hit = query_manager.raycast(Vector(0, 0), Vector(2, 0), 1000)
+        assert hit.entity is near
+        assert hit.distance == pytest.approx(95)
+        assert hit.point == Vector(95, 0)
+        assert query_manager.raycast(Vector(0, 0), Vector(1, 0), 1000, ignore=near).entity is far
+        assert query_manager.raycast(Vector(0, 0), Vector(1, 0), 1000, mask=CollisionLayer.SOLID) is None
+        assert query_manager.raycast(Vector(0, 0), Vector(1, 0), 50) is None
+        assert query_manager.raycast(Vector(0, 0), Vector(-1, 0), 1000) is None
+
+    def test_raycast_skips_sensors(self, query_manager: PhysicSystemManager):
+        sensor = PhysicEntity(position=Vector(50, 0), surface=CirclePrimitiveSurface(radius=10), sensor=True)
+        body = make_circle(100, 0)
+        query_manager.add_entities([sensor, body])
+        assert query_manager.raycast(Vector(0, 0), Vector(1, 0), 200).entity is body
+        assert query_manager.raycast(Vector(0, 0), Vector(1, 0), 200, include_sensors=True).entity is sensor
+
+
+class TestRegistration:
+    def test_bulk_add_matches_sequential_add(self):
+        rng = random.Random(8)
+        bodies = [make_circle(0, 0, fixed=rng.random() < 0.3) for _ in range(50)]
+        for body in bodies:
+            body.mass = rng.choice([1, 2, 40])
+        walls = [make_rect(0, 0, 10, 10) for _ in range(5)]
+        bulk = PhysicSystemManager(Primitive2DPhysicsSystem())
+        bulk.add_entities(bodies[:20])
+        bulk.add_entities(walls + bodies[20:])
+
+        sequential = PhysicSystemManager(Primitive2DPhysicsSystem())
+        for body in bodies[:20] + walls + bodies[20:]:
+            body.id = None
+            sequential.add_entity(body)
+        assert list(bulk.entities) == list(sequential.entities)
+
+    def test_removed_bodies_leave_every_structure(self, manager: PhysicSystemManager):
+        bodies = [make_circle(4 * i, 0) for i in range(20)]
+        manager.add_entities(bodies)
+        for body in bodies[::2]:
+            manager.remove_entity(body)
+        assert list(manager.entities) == bodies[1::2]
+        manager.step(1 / 60)
+        assert manager.query_aabb(-10, -10, 100, 10) and all(
+            body in bodies[1::2] for body in manager.query_aabb(-10, -10, 100, 10)
+        )
+
+
+class TestPrimitive2DPhysicsSystem:
+    def test_overlapping_circles_are_separated(self, manager: PhysicSystemManager):
+        a, b = make_circle(10, 10), make_circle(12, 10)
+        manager.add_entities([a, b])
+        manager.step(0)
+        assert (a.position - b.position).length == pytest.approx(6)
+
+    def test_circle_is_pushed_out_of_wall(self, manager: PhysicSystemManager):
+        wall = make_rect(0, 0, 200, 50)
+        a = make_circle(10, 26)
+        manager.add_entities([wall, a])
+        manager.step(0)
+        assert wall.position == Vector(0, 0)
+        assert a.position.y == pytest.approx(28)
+
+    def test_moving_body_is_integrated(self, manager: PhysicSystemManager):
+        a = make_circle(100, 100)
+        a.acc = Vector(1000, 0)
+        manager.add_entity(a)
+        manager.step(0.1)
+        assert a.vel == Vector(50, 0)
+        assert a.position == Vector(105, 100)
+
+    def test_speed_is_clamped(self, manager: PhysicSystemManager):
+        a = make_circle(100, 100)
+        a.acc = Vector(0, 1e6)
+        manager.add_entity(a)
+        manager.step(0.1)
+        assert a.vel.length == pytest.approx(settings.ENTITY_MAX_SPEED)
+
+    def test_fixed_body_does_not_move(self, manager: PhysicSystemManager):
+        wall = make_rect(0, 0, 10, 10)
+        wall.acc = Vector(1000, 0)
+        manager.add_entity(wall)
+        manager.step(0.1)
+        assert wall.position == Vector(0, 0)
+
+
+class TestPhysicBodyStore:
+    def test_entity_becomes_a_view_on_the_store(self):
+        system = Numpy2DPhysicsSystem()
+        manager = PhysicSystemManager(system)
+        a = make_circle(1, 2)
+        manager.add_entity(a)
+        a.position = Vector(5, 6)
+        assert system.store.position[a.slot].tolist() == [5, 6]
+
+    def test_swap_remove_keeps_handles_valid(self):
+        system = Numpy2DPhysicsSystem()
+        manager = PhysicSystemManager(system)
+        bodies = [make_circle(i * 100, 0) for i in range(3)]
+        manager.add_entities(bodies)
+        manager.remove_entity(bodies[0])
+        assert system.store.count == 2
+        assert bodies[1].position == Vector(100, 0)
+        assert bodies[2].position == Vector(200, 0)
+        assert bodies[0].store is None and bodies[0].position == Vector(0, 0)
+
+    def test_store_grows(self):
+        system = Numpy2DPhysicsSystem()
+        manager = PhysicSystemManager(system)
+        bodies = [make_circle(i * 10, 0) for i in range(200)]
+        manager.add_entities(bodies)
+        assert system.store.count == 200
+        assert bodies[150].position == Vector(1500, 0)
+
+
+class TestNumpy2DPhysicsSystem:
+    def test_collisions_match_primitive_system(self):
+        rng = random.Random(7)
+        layout = [(rng.uniform(0, 60), rng.uniform(0, 60), rng.uniform(1, 5)) for _ in range(40)]
+        results = []
+        for system_cls in (Primitive2DPhysicsSystem, Numpy2DPhysicsSystem):
+            manager = PhysicSystemManager(system_cls(SpatialHashBroadphase(cell_size=50)))
+            bodies = [make_circle(x, y, radius) for x, y, radius in layout]
+            manager.add_entities([make_rect(30, 70, 100, 20), *bodies])
+            manager.step(1 / 60)
+            results.append([body.position.to_tuple() for body in bodies])
+
+        for reference, batched in zip(*results):
+            assert batched == pytest.approx(reference)
+
+
+class TestFixedTimestep:
+    @pytest.fixture
+    def manager(self) -> PhysicSystemManager:
+        return PhysicSystemManager(Primitive2DPhysicsSystem(), timestep=0.1, max_steps_per_frame=3)
+
+    def test_short_frame_does_not_step(self, manager: PhysicSystemManager):
+        a = make_circle(100, 100)
+        a.vel = Vector(10, 0)
+        manager.add_entity(a)
+        manager.update_all(0.05)
+        assert a.position == Vector(100, 100)
+        assert manager.alpha == pytest.approx(0.5)
+
+    def test_accumulated_frames_step_once(self, manager: PhysicSystemManager):
+        a = make_circle(100, 100)
+        a.acc = Vector(1000, 0)
+        manager.add_entity(a)
+        manager.update_all(0.06)
+        manager.update_all(0.06)
+        assert a.position == Vector(105, 100)
+        assert manager.accumulator == pytest.approx(0.02)
+
+    def test_steps_are_clamped(self, manager: PhysicSystemManager):
+        steps = []
+        manager.step = steps.append
+        manager.update_all(1.0)
+        assert steps == [0.1, 0.1, 0.1]
+        assert manager.accumulator < manager.timestep
+
+    def test_interpolated_position(self, manager: PhysicSystemManager):
+        a = make_circle(100, 100)
+        a.acc = Vector(1000, 0)
+        manager.add_entity(a)
+        manager.update_all(0.125)
+        assert manager.interpolated_position(a).x == pytest.approx(100 + 5 * 0.25)
+
+
+class TestSleep:
+    def test_resting_body_falls_asleep(self, manager: PhysicSystemManager):
+        a = make_circle(100, 100)
+        manager.add_entity(a)
+        for _ in range(int(settings.SLEEP_TIME * 60) + 2):
+            manager.step(1 / 60)
+        assert a.sleeping
+
+    def test_acceleration_wakes_body(self, manager: PhysicSystemManager):
+        a = make_circle(100, 100)
+        manager.add_entity(a)
+        for _ in range(int(settings.SLEEP_TIME * 60) + 2):
+            manager.step(1 / 60)
+        a.acc = Vector(1000, 0)
+        manager.step(1 / 60)
+        assert not a.sleeping
+        assert a.position.x > 100
+
+    def test_sleeping_pairs_are_not_generated(self, manager: PhysicSystemManager):
+        a, b = make_circle(10, 10), make_circle(20, 10)
+        manager.add_entities([a, b])
+        a.sleeping = b.sleeping = True
+        broadphase = manager.physic_system.broadphase
+        broadphase.update()
+        assert broadphase.find_potential_pairs() == []
+
+    def test_moving_body_wakes_the_island_it_hits(self, manager: PhysicSystemManager):
+        resting = [make_circle(100 + 6 * i, 100) for i in range(3)]
+        manager.add_entities(resting)
+        for _ in range(int(settings.SLEEP_TIME * 60) + 2):
+            manager.step(1 / 60)
+        assert all(body.sleeping for body in resting)
+
+        bullet = make_circle(95, 100)
+        bullet.acc = Vector(3000, 0)
+        manager.add_entity(bullet)
+        manager.step(1 / 60)
+        assert not resting[0].sleeping
+
+
+class TestCollisionLayers:
+    def test_masked_out_pair_is_not_resolved(self, manager: PhysicSystemManager):
+        a = PhysicEntity(position=Vector(10, 10), surface=CirclePrimitiveSurface(radius=3), category=CollisionLayer.ALIVE, mask=CollisionLayer.SOLID)
+        b = PhysicEntity(position=Vector(12, 10), surface=CirclePrimitiveSurface(radius=3), category=CollisionLayer.ALIVE)
+        manager.add_entities([a, b])
+        manager.step(0)
+        assert a.position == Vector(10, 10) and b.position == Vector(12, 10)
+
+    def test_sensor_reports_overlap_without_correction(self, manager: PhysicSystemManager):
+        EventBus.active().poll(ChannelEvent.PHYSICS)
+        sensor = PhysicEntity(position=Vector(10, 10), surface=CirclePrimitiveSurface(radius=5), fixed=True, category=CollisionLayer.ITEM, mask=CollisionLayer.ALIVE, sensor=True)
+        body = PhysicEntity(position=Vector(12, 10), surface=CirclePrimitiveSurface(radius=3), category=CollisionLayer.ALIVE)
+        manager.add_entities([sensor, body])
+        manager.step(0)
+        assert body.position == Vector(12, 10)
+        assert manager.get_overlaps(sensor) == [body]
+        events = EventBus.active().poll(ChannelEvent.PHYSICS)
+        assert [type(event) for event in events] == [SensorEnterEvent]
+        assert events[0].sensor is sensor and events[0].other is body
+
+        body.position = Vector(100, 10)
+        manager.step(0)
+        assert manager.get_overlaps(sensor) == []
+        assert [type(event) for event in EventBus.active().poll(ChannelEvent.PHYSICS)] == [SensorExitEvent]
+
+    def test_removed_body_leaves_the_sensor_overlaps(self, manager: PhysicSystemManager):
+        sensor = PhysicEntity(position=Vector(10, 10), surface=CirclePrimitiveSurface(radius=5), fixed=True, category=CollisionLayer.ITEM, mask=CollisionLayer.ALIVE, sensor=True)
+        bodies = [
+            PhysicEntity(position=Vector(x, 10), surface=CirclePrimitiveSurface(radius=3), category=CollisionLayer.ALIVE)
+            for x in (8, 12)
+        ]
+        manager.add_entities([sensor] + bodies)
+        manager.step(0)
+        assert sorted(body.id for body in manager.get_overlaps(sensor)) == sorted(body.id for body in bodies)
+
+        manager.remove_entity(bodies[0])
+        assert manager.get_overlaps(sensor) == [bodies[1]]
+        assert manager.get_overlaps(bodies[0]) == []
+        manager.remove_entity(sensor)
+        assert manager.physic_system.sensor_overlaps == set()
+        assert manager.physic_system.sensor_partners == {}
+
+
+class TestThreadedPhysicSystemManager:
+    @pytest.fixture
+    def manager(self):
+        manager = ThreadedPhysicSystemManager(Primitive2DPhysicsSystem(), timestep=0.1)
+        yield manager
+        manager.stop()
+
+    def test_matches_synchronous_manager(self, manager: ThreadedPhysicSystemManager):
+        reference = PhysicSystemManager(Primitive2DPhysicsSystem(), timestep=0.1)
+        bodies, reference_bodies = [], []
+        for target, collection in ((manager, bodies), (reference, reference_bodies)):
+            for i in range(5):
+                body = make_circle(10 + 4 * i, 10)
+                body.acc = Vector(100, 50 * i)
+                collection.append(body)
+                target.add_entity(body)
+
+        for dt in (0.05, 0.1, 0.15, 0.1):
+            manager.update_all(dt)
+            manager.wait()
+            reference.update_all(dt)
+
+        for body, reference_body in zip(bodies, reference_bodies):
+            assert manager.position_of(body) == reference_body.position
+            assert manager.interpolated_position(body) == reference.interpolated_position(reference_body)
+
+    def test_snapshot_is_published_after_frame(self, manager: ThreadedPhysicSystemManager):
+        body = make_circle(10, 10)
+        manager.add_entity(body)
+        assert manager.snapshot.position(body) is None
+        assert manager.position_of(body) == Vector(10, 10)
+
+        manager.update_all(0.1)
+        manager.wait()
+        assert manager.snapshot.frame == 1
+        assert manager.snapshot.position(body) == body.position
+
+    def test_removal_is_applied_by_worker(self, manager: ThreadedPhysicSystemManager):
+        body = make_circle(10, 10)
+        manager.add_entity(body)
+        manager.remove_entity(body)
+        manager.update_all(0.1)
+        manager.wait()
+        assert manager.entities == []
+        assert manager.snapshot.position(body) is None
+
+    def test_queries_see_simulated_bodies(self, manager: ThreadedPhysicSystemManager):
+        body = make_circle(10, 10)
+        manager.add_entity(body)
+        manager.update_all(0.1)
+        manager.wait()
+        assert manager.query_radius(Vector(10, 10), 5) == [body]
+
+    def test_sensor_events_are_emitted_on_the_main_thread(self, manager: ThreadedPhysicSystemManager):
+        emitted_from = []
+
+        class RecordingEventBus(EventBus):
+            def emit(self, event):
+                emitted_from.append(threading.current_thread())
+                super().emit(event)
+
+        previous = EventBus.set_active(RecordingEventBus())
+        try:
+            sensor = PhysicEntity(position=Vector(10, 10), surface=CirclePrimitiveSurface(radius=5), fixed=True, category=CollisionLayer.ITEM, mask=CollisionLayer.ALIVE, sensor=True)
+            body = PhysicEntity(position=Vector(12, 10), surface=CirclePrimitiveSurface(radius=3), category=CollisionLayer.ALIVE)
+            manager.add_entities([sensor, body])
+            manager.update_all(0.1)
+            manager.wait()
+            events = EventBus.active().poll(ChannelEvent.PHYSICS)
+        finally:
+            EventBus.set_active(previous)
+        assert [type(event) for event in events] == [SensorEnterEvent]
+        assert emitted_from == [threading.main_thread()]
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from systems.actions.controller.ia import BatchAIActionController
+from systems.ia_components.process_pool_ia import (
+    ANGLE, COLUMNS, DEAD, ORDER, TYPE, TYPE_CODES, X, Y, ProcessPoolSlimeIA, decide_rows,
+)
+from systems.ia_components.slime_batch_ia import find_nearest_targets
+from entities.entity_type import EntityType
+from tests.systems.helpers import RADIUS, make_entity_manager, spawn_slimes
+
+
+def make_snapshot(seed: int, count: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    snapshot = np.zeros((count, COLUMNS))
+    snapshot[:, X:Y + 1] = rng.uniform(0, 600, (count, 2))
+    snapshot[:, TYPE] = TYPE_CODES[EntityType.SLIME]
+    snapshot[:, DEAD] = rng.random(count) < 0.2
+    snapshot[:, ORDER] = np.arange(count)
+    snapshot[:, ANGLE] = rng.uniform(0, 2 * np.pi, count)
+    return snapshot
+
+
+def actions_of(slimes) -> list[tuple]:
+    return [
+        (action.move.to_tuple(), action.target and action.target.id, action.attack)
+        for action in (slime.action_entity.controller.get_action() for slime in slimes)
+    ]
+
+
+def run(workers: int, frames: int) -> list[list[tuple]]:
+    batch = ProcessPoolSlimeIA(RADIUS, seed=42, workers=workers)
+    entity_manager = make_entity_manager(lambda: BatchAIActionController(batch))
+    slimes = spawn_slimes(entity_manager, 8, 60, 500)
+    history = []
+    try:
+        for _ in range(frames):
+            entity_manager.update_all(0)
+            history.append(actions_of(slimes))
+    finally:
+        batch.stop()
+    return history
+
+
+class TestDecideRows:
+    def test_split_does_not_change_the_result(self):
+        snapshot = make_snapshot(0, 90)
+        whole = decide_rows(snapshot, 0, 90, seed=3, frame=5, radius=RADIUS)
+        parts = [decide_rows(snapshot, start, stop, seed=3, frame=5, radius=RADIUS) for start, stop in ((0, 13), (13, 50), (50, 90))]
+        for index in (1, 2, 3):
+            assert np.array_equal(whole[index], np.concatenate([part[index] for part in parts]))
+
+    def test_targets_match_the_batch_search(self):
+        snapshot = make_snapshot(1, 90)
+        _, targets, moves, _ = decide_rows(snapshot, 0, 90, seed=0, frame=0, radius=RADIUS)
+        expected = find_nearest_targets(snapshot[:, X:Y + 1], snapshot[:, DEAD] == 0, snapshot[:, ORDER], RADIUS)
+        assert targets.tolist() == expected.tolist()
+        chasing = expected >= 0
+        assert np.array_equal(moves[chasing], snapshot[expected[chasing], X:Y + 1] - snapshot[chasing, X:Y + 1])
+
+
+class TestProcessPoolSlimeIA:
+    def test_deterministic_whatever_the_worker_count(self):
+        single = run(workers=1, frames=3)
+        assert run(workers=3, frames=3) == single
+        # actions only arrive one frame after the first evaluation
+        assert all(move == (0, 0) and target is None for move, target, _ in single[0])
+        assert single[1] != single[0]
+
+    def test_recycled_slime_skips_its_pending_result(self):
+        batch = ProcessPoolSlimeIA(RADIUS, seed=42, workers=1)
+        entity_manager = make_entity_manager(lambda: BatchAIActionController(batch))
+        slimes = spawn_slimes(entity_manager, 8, 60, 200, dead_every=1000)
+        try:
+            entity_manager.update_all(0)
+            recycled = slimes[0]
+            entity_manager.remove_entity(recycled)
+            recycled.action_entity.controller.reset()
+            entity_manager.add_entity(recycled)
+            angle = batch.angle[batch.slots[id(recycled)]]
+            batch._collect()
+        finally:
+            batch.stop()
+        assert batch.angle[batch.slots[id(recycled)]] == angle
+        assert recycled.action_entity.controller.get_action().move.to_tuple() == (0, 0)
+        assert all(slime.action_entity.controller.get_action().target is not recycled for slime in slimes[1:])
+        assert any(slime.action_entity.controller.get_action().target is not None for slime in slimes[1:])
+
+    def test_needs_a_worker(self):
+        with pytest.raises(ValueError):
+            ProcessPoolSlimeIA(RADIUS, workers=0)
@@ -0,0 +1,99 @@
+import math
+
+import pygame
+import pytest
+
+from benchmarks.replay import replay
+from systems.inputs.raw_input import RawInput
+from systems.inputs.recording import InputRecorder, InputRecording, SCANCODE_COUNT
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pygame_initialized():
+    # key codes only map to scancodes once SDL is initialized
+    pygame.init()
+    yield
+
+
+def make_raw_input(scancodes: tuple[int, ...] = (), events: list = (), mouse_position=(0, 0), buttons=(False, False, False)) -> RawInput:
+    keys = [False] * SCANCODE_COUNT
+    for scancode in scancodes:
+        keys[scancode] = True
+    return RawInput(
+        keys=pygame.key.ScancodeWrapper(keys),
+        events=list(events),
+        mouse_position=mouse_position,
+        pressed_keys=buttons,
+    )
+
+
+# (frames, held scancodes): idle frames before and between the key presses
+SESSION = (
+    (10, ()),
+    (25, (pygame.KSCAN_LEFT, pygame.KSCAN_UP)),
+    (10, ()),
+    (30, (pygame.KSCAN_RIGHT,)),
+    (15, ()),
+)
+
+
+def record_session(path, seed: int = 7) -> None:
+    with InputRecorder(str(path), seed) as recorder:
+        for frames, scancodes in SESSION:
+            for _ in range(frames):
+                recorder.record(make_raw_input(scancodes), 1 / 60)
+
+
+class TestInputRecording:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "session.rec"
+        frames = [
+            (make_raw_input((pygame.KSCAN_LEFT,), [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT)], (640, 360), (True, False, True)), 1 / 60),
+            (make_raw_input((), [pygame.event.Event(pygame.QUIT)], (-5, 12)), 0.02),
+        ]
+        with InputRecorder(str(path), seed=123) as recorder:
+            for raw_input, dt in frames:
+                recorder.record(raw_input, dt)
+
+        recording = InputRecording(str(path))
+        assert recording.seed == 123
+        replayed = list(recording)
+        assert [frame.dt for frame in replayed] == [dt for _, dt in frames]
+        for frame, (raw_input, _) in zip(replayed, frames):
+            assert tuple(frame.raw_input.keys) == tuple(raw_input.keys)
+            assert frame.raw_input.mouse_position == raw_input.mouse_position
+            assert frame.raw_input.pressed_keys == tuple(raw_input.pressed_keys)
+            assert [event.type for event in frame.raw_input.events] == [event.type for event in raw_input.events]
+        assert replayed[0].raw_input.keys[pygame.K_LEFT]
+        assert replayed[0].raw_input.events[0].key == pygame.K_LEFT
+
+    def test_rejects_a_negative_seed(self, tmp_path):
+        with pytest.raises(ValueError):
+            InputRecorder(str(tmp_path / "session.rec"), seed=-1)
+        assert not (tmp_path / "session.rec").exists()
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.rec"
+        path.write_bytes(b"not a recording at all")
+        with pytest.raises(ValueError):
+            InputRecording(str(path))
+
+
+class TestReplay:
+    def test_replay_is_deterministic(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("settings.AUDIO_OUTPUT", False)
+        monkeypatch.setattr("settings.PHYSICS_THREADED", False)
+        monkeypatch.setattr("settings.AI_FRAME_BUDGET_MS", math.inf)
+        path = tmp_path / "session.rec"
+        record_session(path)
+        recording = InputRecording(str(path))
+
+        runs = []
+        for _ in range(2):
+            scene_manager, frame_times = replay(recording)
+            assert len(frame_times) == sum(frames for frames, _ in SESSION)
+            entities = scene_manager.active_scene.entity_manager.entities
+            runs.append([entity.physics_entity.position.to_tuple() for entity in entities if entity.physics_entity])
+        assert runs[0] == runs[1]
+        player = scene_manager.active_scene.player.physics_entity.position
+        assert player.to_tuple() != (800, 600)
@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from entities.entity_factory import EntityFactory
+from entities.entity_type import EntityType
+from systems.actions.controller.ia import AIActionController, BatchAIActionController
+from systems.ia_components.slime_ia import SlimeIA
+from systems.ia_components.slime_batch_ia import SlimeBatchIA, find_nearest_targets
+from tests.systems.helpers import RADIUS, make_entity_manager, spawn_slimes
+
+
+def brute_force(positions, targetable, order, radius):
+    nearest = []
+    for i, position in enumerate(positions):
+        best = None
+        for j, other in enumerate(positions):
+            if i == j or not targetable[j]:
+                continue
+            dx, dy = other[0] - position[0], other[1] - position[1]
+            distance_squared = dx * dx + dy * dy
+            if distance_squared < radius * radius and (best is None or (distance_squared, order[j]) < best[0]):
+                best = ((distance_squared, order[j]), j)
+        nearest.append(-1 if best is None else best[1])
+    return nearest
+
+
+class TestFindNearestTargets:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_brute_force(self, seed):
+        rng = np.random.default_rng(seed)
+        positions = rng.uniform(-300, 300, (150, 2))
+        # duplicated points exercise the tie break
+        positions[10] = positions[11] = positions[12]
+        targetable = rng.random(150) > 0.2
+        order = rng.permutation(150)
+        assert find_nearest_targets(positions, targetable, order, RADIUS).tolist() == brute_force(positions, targetable, order, RADIUS)
+
+    def test_boundary_is_exclusive(self):
+        positions = np.array([[0.0, 0.0], [RADIUS, 0.0]])
+        assert find_nearest_targets(positions, np.ones(2, dtype=bool), np.arange(2), RADIUS).tolist() == [-1, -1]
+
+    def test_nothing_targetable(self):
+        positions = np.zeros((3, 2))
+        assert find_nearest_targets(positions, np.zeros(3, dtype=bool), np.arange(3), RADIUS).tolist() == [-1, -1, -1]
+
+
+class TestSlimeBatchIA:
+    def test_chase_matches_slime_ia(self):
+        scalar_manager = make_entity_manager(lambda: AIActionController(
+            SlimeIA(), perception_radius=RADIUS, perception_types=(EntityType.SLIME,)
+        ))
+        batch = SlimeBatchIA(RADIUS, rng=np.random.default_rng(0))
+        batch_manager = make_entity_manager(lambda: BatchAIActionController(batch))
+        scalar_slimes = spawn_slimes(scalar_manager, 3, 120, 800)
+        batch_slimes = spawn_slimes(batch_manager, 3, 120, 800)
+        scalar_manager.update_all(0)
+        batch_manager.update_all(0)
+
+        index = {id(slime): i for i, slime in enumerate(batch_slimes)}
+        chasing = 0
+        for scalar_slime, batch_slime in zip(scalar_slimes, batch_slimes):
+            expected = scalar_slime.action_entity.controller.get_action()
+            action = batch_slime.action_entity.controller.get_action()
+            assert action.attack == expected.attack
+            if expected.target is None:
+                assert action.target is None
+                assert action.move.length == pytest.approx(1)
+            else:
+                chasing += 1
+                assert index[id(action.target)] == scalar_slimes.index(expected.target)
+                assert action.move == expected.move
+        assert chasing > 0
+
+    def test_random_walk_update(self):
+        batch = SlimeBatchIA(RADIUS, rng=np.random.default_rng(4))
+        entity_manager = make_entity_manager(lambda: BatchAIActionController(batch))
+        # far apart, nobody is chasing
+        slimes = [EntityFactory.create_slime(x * 1000, 0) for x in range(5)]
+        entity_manager.add_entities(slimes)
+        angle = batch.angle[:5].copy()
+        rotation_acc = batch.rotation_acc[:5].copy()
+        rotation_speed = batch.rotation_speed[:5].copy()
+        draws = np.random.default_rng()
+        draws.bit_generator.state = batch.rng.bit_generator.state
+
+        for _ in range(3):
+            entity_manager.update_all(0)
+            rotation_acc = np.clip(rotation_acc + draws.uniform(-0.05, 0.05, 5), -0.1, 0.1)
+            rotation_speed = np.clip(rotation_speed + rotation_acc, -0.3, 0.3)
+            angle = angle + rotation_speed * draws.uniform(-1, 1, 5)
+            for slime, expected in zip(slimes, angle):
+                move = slime.action_entity.controller.get_action().move
+                assert (move.x, move.y) == pytest.approx((np.cos(expected), np.sin(expected)))
+
+    def test_remove_keeps_the_state_of_the_moved_slime(self):
+        batch = SlimeBatchIA(RADIUS, rng=np.random.default_rng(1))
+        entity_manager = make_entity_manager(lambda: BatchAIActionController(batch))
+        slimes = [EntityFactory.create_slime(x * 1000, 0) for x in range(3)]
+        entity_manager.add_entities(slimes)
+        last_angle = batch.angle[2]
+
+        entity_manager.remove_entity(slimes[0])
+
+        assert batch.entities == [slimes[2], slimes[1]]
+        assert batch.angle[0] == last_angle
+        assert list(entity_manager.ia_batches.values()) == [batch]
+
+    def test_grows_past_its_capacity(self):
+        batch = SlimeBatchIA(RADIUS, rng=np.random.default_rng(2), capacity=2)
+        entity_manager = make_entity_manager(lambda: BatchAIActionController(batch))
+        spawn_slimes(entity_manager, 5, 9, 300)
+        entity_manager.update_all(0)
+        assert len(batch.entities) == 9
+        assert len(batch.angle) >= 9
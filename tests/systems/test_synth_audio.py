@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from systems.audio.play_policy import PlayPolicy
+from systems.audio.source import MixAudioSource
+from systems.audio.synth.sound import SynthSound
+from systems.audio.synth.source import SynthAudioSource
+from systems.audio.synth.wave_type import WaveType
+
+FREQ_ECH = 44100
+BLOCK = 256
+TIME = SimpleNamespace(currentTime=0)
+
+
+def make_sound(play_policy: PlayPolicy = PlayPolicy.OVERLAP, duration: float = 1.0, wave_type: WaveType = WaveType.SIN) -> SynthSound:
+    return SynthSound(freq=440, amp=0.5, wave_type=wave_type, duration=duration, play_policy=play_policy)
+
+
+@pytest.fixture
+def source() -> SynthAudioSource:
+    return SynthAudioSource(FREQ_ECH, max_voices=4, ring_size=8, block_size=BLOCK)
+
+
+class TestSynthAudioSource:
+    def test_sounds_start_on_the_next_block(self, source: SynthAudioSource):
+        source.set_sound(make_sound())
+        assert source.active == 0
+        source.play(BLOCK, TIME, None)
+        assert source.active == 1
+
+    def test_sine_block(self, source: SynthAudioSource):
+        sound = make_sound()
+        source.set_sound(sound)
+        first = source.play(BLOCK, TIME, None).copy()
+        second = source.play(BLOCK, TIME, None)
+
+        step = 2 * np.pi * sound.freq / FREQ_ECH
+        expected = np.sin(np.arange(1, 2 * BLOCK + 1) * step) * sound.amp
+        assert first[:, 0] == pytest.approx(expected[:BLOCK], abs=1e-5)
+        assert second[:, 1] == pytest.approx(expected[BLOCK:], abs=1e-5)
+
+    def test_play_reuses_its_buffer(self, source: SynthAudioSource):
+        source.set_sound(make_sound())
+        first = source.play(BLOCK, TIME, None)
+        assert source.play(BLOCK, TIME, None) is not None
+        assert np.shares_memory(first, source.play(BLOCK, TIME, None))
+
+    @pytest.mark.parametrize("wave_type", list(WaveType))
+    def test_wave_types_stay_in_range(self, source: SynthAudioSource, wave_type: WaveType):
+        source.set_sound(make_sound(wave_type=wave_type))
+        mix = source.play(BLOCK, TIME, None)
+        assert np.abs(mix).max() <= 0.5 + 1e-6
+
+    def test_play_policies(self, source: SynthAudioSource):
+        ignored = make_sound(PlayPolicy.IGNORE)
+        restarted = make_sound(PlayPolicy.RESTART)
+        for sound in (ignored, ignored, restarted):
+            source.set_sound(sound)
+        source.play(BLOCK, TIME, None)
+        assert source.active == 2
+
+        source.set_sound(restarted)
+        source.play(BLOCK, TIME, None)
+        source.set_sound(make_sound(PlayPolicy.OVERLAP))
+        source.set_sound(make_sound(PlayPolicy.OVERLAP))
+        source.play(BLOCK, TIME, None)
+        assert source.active == 4
+        assert [voice.sound.id for voice in source.voices].count(restarted.id) == 1
+
+    def test_finished_voices_are_freed(self, source: SynthAudioSource):
+        source.set_sound(make_sound(duration=BLOCK / FREQ_ECH))
+        source.play(BLOCK, TIME, None)
+        assert source.active == 0
+        assert not source.play(BLOCK, TIME, None).any()
+
+    def test_overflow_is_dropped(self, source: SynthAudioSource):
+        for _ in range(10):
+            source.set_sound(make_sound())
+        assert source.dropped_commands == 2
+        source.play(BLOCK, TIME, None)
+        assert source.active == 4
+        assert source.dropped_voices == 4
+        assert source.dropped == 6
+
+
+class TestMixAudioSource:
+    def test_mix_is_clipped(self, source: SynthAudioSource):
+        mix = MixAudioSource([source])
+        for _ in range(4):
+            source.set_sound(make_sound())
+        assert np.abs(mix.play(BLOCK, TIME, None)).max() == pytest.approx(1)
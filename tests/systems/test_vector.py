@@ -2,7 +2,8 @@ import math
 
 import pytest
 
-from utils.math.vector import Vector
+from benchmarks.vector import accumulate_mutable_vector, accumulate_vector
+from utils.math.vector import Vector, MutableVector
 
 
 @pytest.fixture
@@ -134,4 +135,84 @@ class TestVector:
     
     def test_truediv_rejects_invalid_type(self, vec_a: Vector):
         with pytest.raises(TypeError):
-            _ = "invalid" / vec_a
\ No newline at end of file
+            _ = "invalid" / vec_a
+
+    def test_length_squared(self, vec_a: Vector):
+        assert vec_a.length_squared == 25
+
+
+class TestMutableVector:
+    def test_inplace_addition_keeps_identity(self, vec_b: Vector):
+        vec = MutableVector(3, 4)
+        same = vec
+        vec += vec_b
+        assert vec is same
+        assert vec == Vector(4, 2)
+
+    def test_inplace_operations(self):
+        vec = MutableVector(3, 4)
+        vec -= 1
+        assert vec == MutableVector(2, 3)
+        vec *= Vector(2, 2)
+        assert vec == MutableVector(4, 6)
+        vec /= 2
+        assert vec == MutableVector(2, 3)
+
+    def test_add_scaled(self, vec_b: Vector):
+        assert MutableVector(3, 4).add_scaled(vec_b, 2) == Vector(5, 0)
+        assert MutableVector(3, 4).sub_scaled(vec_b, 2) == Vector(1, 8)
+
+    def test_length(self):
+        vec = MutableVector(3, 4)
+        assert vec.length == 5
+        assert vec.length_squared == 25
+
+    def test_clamp_length(self):
+        assert MutableVector(3, 4).clamp_length(10) == Vector(3, 4)
+        clamped = MutableVector(3, 4).clamp_length(1)
+        assert clamped.x == pytest.approx(3 / 5)
+        assert clamped.y == pytest.approx(4 / 5)
+
+    def test_normalize_zero_vector_is_safe(self):
+        assert MutableVector().normalize() == Vector.zero()
+
+    def test_round_trip(self, vec_a: Vector):
+        assert MutableVector.from_vector(vec_a).to_vector() == vec_a
+
+    def test_inplace_rejects_invalid_type(self):
+        vec = MutableVector(3, 4)
+        with pytest.raises(TypeError):
+            vec += "invalid"
+
+    def test_is_not_hashable(self):
+        with pytest.raises(TypeError):
+            hash(MutableVector())
+
+
+class TestVectorAllocations:
+    """The `position += vel * dt` pattern, timed in benchmarks.vector."""
+
+    def test_same_result(self):
+        expected = accumulate_vector(100)
+        result = accumulate_mutable_vector(100)
+        assert result.x == pytest.approx(expected.x)
+        assert result.y == pytest.approx(expected.y)
+
+    def test_allocations(self, monkeypatch: pytest.MonkeyPatch):
+        created = []
+        vector_init = Vector.__init__
+
+        def counting_init(self, *args, **kwargs):
+            created.append(None)
+            vector_init(self, *args, **kwargs)
+
+        monkeypatch.setattr(Vector, "__init__", counting_init)
+        accumulate_vector(100)
+        vector_allocations = len(created)
+        created.clear()
+        accumulate_mutable_vector(100)
+        mutable_allocations = len(created)
+
+        assert vector_allocations >= 2 * 100
+        # only the constant velocity
+        assert mutable_allocations == 1
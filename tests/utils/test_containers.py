@@ -0,0 +1,116 @@
+import random
+import threading
+import time
+
+import pytest
+
+from utils.containers import DenseList, SortedList, SPSCRing
+
+
+class Item:
+    def __init__(self, key: int, name: str):
+        self.key = key
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Item({self.key}, {self.name!r})"
+
+
+def key_of(item: Item) -> int:
+    return item.key
+
+
+class TestDenseList:
+    def test_remove_swaps_last_item_in(self):
+        items = [Item(i, str(i)) for i in range(4)]
+        dense = DenseList(items)
+        dense.remove(items[1])
+        assert dense == [items[0], items[3], items[2]]
+        assert items[1] not in dense and items[3] in dense
+        dense.remove(items[2])
+        assert dense == [items[0], items[3]]
+
+    def test_missing_or_duplicate_item_raises(self):
+        item = Item(0, "a")
+        dense = DenseList([item])
+        with pytest.raises(ValueError):
+            dense.append(item)
+        dense.remove(item)
+        with pytest.raises(ValueError):
+            dense.remove(item)
+
+
+class TestSortedList:
+    def test_matches_sequential_insertion(self):
+        rng = random.Random(1)
+        items = [Item(rng.randint(0, 5), str(i)) for i in range(200)]
+        bulk = SortedList(key_of, items[:50])
+        bulk.extend(items[50:])
+        one_by_one = SortedList(key_of)
+        for item in items:
+            one_by_one.add(item)
+        # stable: equal keys keep their insertion order
+        assert bulk == one_by_one == sorted(items, key=key_of)
+
+    def test_removal_is_compacted_on_read(self):
+        items = [Item(i % 3, str(i)) for i in range(9)]
+        sorted_list = SortedList(key_of, items)
+        for item in items[::2]:
+            sorted_list.remove(item)
+        assert len(sorted_list) == 4
+        assert list(sorted_list) == sorted(items[1::2], key=key_of)
+
+    def test_item_can_be_added_back_before_compaction(self):
+        a, b = Item(1, "a"), Item(0, "b")
+        sorted_list = SortedList(key_of, [a, b])
+        sorted_list.remove(a)
+        sorted_list.add(a)
+        assert sorted_list == [b, a]
+        with pytest.raises(ValueError):
+            sorted_list.add(a)
+
+    def test_without_key_keeps_insertion_order(self):
+        items = [Item(3, "a"), Item(1, "b")]
+        assert SortedList(None, items) == items
+
+
+class TestSPSCRing:
+    def test_fifo_with_wraparound(self):
+        ring = SPSCRing(3)
+        popped = []
+        for value in range(10):
+            assert ring.push(value)
+            popped.append(ring.pop())
+        assert popped == list(range(10))
+        assert ring.pop() is None
+
+    def test_full_ring_drops(self):
+        ring = SPSCRing(2)
+        assert ring.push("a") and ring.push("b")
+        assert not ring.push("c")
+        assert len(ring) == 2
+        assert [ring.pop(), ring.pop(), ring.pop()] == ["a", "b", None]
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            SPSCRing(0)
+
+    def test_producer_and_consumer_threads(self):
+        ring = SPSCRing(8)
+        received = []
+
+        def consume():
+            while len(received) < 5000:
+                item = ring.pop()
+                if item is not None:
+                    received.append(item)
+                else:
+                    time.sleep(0)
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for value in range(5000):
+            while not ring.push(value):
+                time.sleep(0)
+        consumer.join(timeout=10)
+        assert received == list(range(5000))
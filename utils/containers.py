@@ -0,0 +1,174 @@
+from bisect import insort
+from typing import Callable, Generic, Iterable, Iterator, TypeVar
+
+
+T = TypeVar("T")
+
+
+class DenseList(Generic[T]):
+    """Unordered list with O(1) append and remove (the last item fills the hole)."""
+
+    def __init__(self, items: Iterable[T] = ()):
+        self._items: list[T] = []
+        self._index: dict[int, int] = {}
+        self.extend(items)
+
+    def append(self, item: T) -> None:
+        if id(item) in self._index:
+            raise ValueError(f"{item!r} is already in the list")
+        self._index[id(item)] = len(self._items)
+        self._items.append(item)
+
+    def extend(self, items: Iterable[T]) -> None:
+        for item in items:
+            self.append(item)
+
+    def remove(self, item: T) -> None:
+        index = self._index.pop(id(item), None)
+        if index is None:
+            raise ValueError(f"{item!r} is not in the list")
+        last = self._items.pop()
+        if last is not item:
+            self._items[index] = last
+            self._index[id(last)] = index
+
+    def __contains__(self, item: T) -> bool:
+        return id(item) in self._index
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: int) -> T:
+        return self._items[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, DenseList):
+            return self._items == other._items
+        return self._items == other
+
+    def __repr__(self) -> str:
+        return f"DenseList({self._items!r})"
+
+
+class SortedList(Generic[T]):
+    """List kept ordered by key, equal keys stay in insertion order.
+
+    Items are inserted with bisect, a bulk extend sorts once. Removal only marks
+    the item, the list is compacted in one pass on the next read.
+    """
+
+    def __init__(self, key: Callable[[T], object] = None, items: Iterable[T] = ()):
+        self.key = key
+        self._items: list[T] = []
+        self._members: set[int] = set()
+        self._removed: set[int] = set()
+        self.extend(items)
+
+    def add(self, item: T) -> None:
+        self._check_new(item)
+        if self.key is None:
+            self._items.append(item)
+        else:
+            insort(self._items, item, key=self.key)
+
+    def extend(self, items: Iterable[T]) -> None:
+        added = False
+        for item in items:
+            self._check_new(item)
+            self._items.append(item)
+            added = True
+        if added and self.key is not None:
+            self._compact()
+            self._items.sort(key=self.key)
+
+    def remove(self, item: T) -> None:
+        if id(item) not in self._members:
+            raise ValueError(f"{item!r} is not in the list")
+        self._members.remove(id(item))
+        self._removed.add(id(item))
+
+    def __contains__(self, item: T) -> bool:
+        return id(item) in self._members
+
+    def __iter__(self) -> Iterator[T]:
+        self._compact()
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __getitem__(self, index: int) -> T:
+        self._compact()
+        return self._items[index]
+
+    def __eq__(self, other) -> bool:
+        self._compact()
+        if isinstance(other, SortedList):
+            other._compact()
+            return self._items == other._items
+        return self._items == other
+
+    def __repr__(self) -> str:
+        self._compact()
+        return f"SortedList({self._items!r})"
+
+    def _check_new(self, item: T) -> None:
+        if id(item) in self._members:
+            raise ValueError(f"{item!r} is already in the list")
+        if id(item) in self._removed:
+            # removed then added back before the list was compacted
+            self._compact()
+        self._members.add(id(item))
+
+    def _compact(self) -> None:
+        if self._removed:
+            removed = self._removed
+            self._items = [item for item in self._items if id(item) not in removed]
+            removed.clear()
+
+
+class SPSCRing(Generic[T]):
+    """Bounded queue for one producer thread and one consumer thread, without locks.
+
+    The slots are allocated once. Only the producer moves tail and only the
+    consumer moves head, each after touching its slot, so the two never write
+    the same field.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("SPSCRing capacity must be at least 1")
+        # one slot stays empty to tell a full ring from an empty one
+        self._slots: list[T | None] = [None] * (capacity + 1)
+        self._head = 0
+        self._tail = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._slots) - 1
+
+    def push(self, item: T) -> bool:
+        """Producer side, returns False and drops the item when the ring is full."""
+        tail = self._tail
+        next_tail = tail + 1 if tail + 1 < len(self._slots) else 0
+        if next_tail == self._head:
+            return False
+        self._slots[tail] = item
+        self._tail = next_tail
+        return True
+
+    def pop(self) -> T | None:
+        """Consumer side, None when the ring is empty."""
+        head = self._head
+        if head == self._tail:
+            return None
+        item = self._slots[head]
+        self._slots[head] = None
+        self._head = head + 1 if head + 1 < len(self._slots) else 0
+        return item
+
+    def __len__(self) -> int:
+        return (self._tail - self._head) % len(self._slots)
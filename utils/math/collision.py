@@ -1,5 +1,7 @@
 import math
-from typing import Tuple
+from typing import Callable, Tuple
+
+import numpy as np
 
 from utils.math.vector import Vector
 from utils.math.primitive_surface import (
@@ -15,62 +17,23 @@ CollisionResult = Tuple[bool, Vector, Vector]
 
 def compute_aabb(pos: Vector, surface: PrimitiveSurface) -> tuple[float, float, float, float]:
     """Axis-aligned bounding box for a primitive surface at a given position."""
-    if isinstance(surface, RectPrimitiveSurface):
-        hw = surface.width / 2
-        hh = surface.height / 2
-        return (
-            pos.x - hw,
-            pos.y - hh,
-            pos.x + hw,
-            pos.y + hh,
-        )
-    if isinstance(surface, CirclePrimitiveSurface):
-        r = surface.radius
-        return (
-            pos.x - r,
-            pos.y - r,
-            pos.x + r,
-            pos.y + r,
-        )
-    if isinstance(surface, RotatedRectPrimitiveSurface):
-        hw = surface.width / 2
-        hh = surface.height / 2
-        cos_a = abs(math.cos(surface.rotation))
-        sin_a = abs(math.sin(surface.rotation))
-        ext_x = hw * cos_a + hh * sin_a
-        ext_y = hw * sin_a + hh * cos_a
-        return (
-            pos.x - ext_x,
-            pos.y - ext_y,
-            pos.x + ext_x,
-            pos.y + ext_y,
-        )
-    raise ValueError(f"Unsupported surface type for AABB: {type(surface)}")
+    try:
+        extent_x, extent_y = surface.extent_x, surface.extent_y
+    except AttributeError:
+        raise ValueError(f"Unsupported surface type for AABB: {type(surface)}") from None
+    return (
+        pos.x - extent_x,
+        pos.y - extent_y,
+        pos.x + extent_x,
+        pos.y + extent_y,
+    )
 
 
 def detect_collision(
     pos_a: Vector, surface_a: PrimitiveSurface, pos_b: Vector, surface_b: PrimitiveSurface
 ) -> bool:
     """Dispatch collision detection based on primitive surface types."""
-    if isinstance(surface_a, CirclePrimitiveSurface) and isinstance(surface_b, CirclePrimitiveSurface):
-        return detect_circle_vs_circle(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, CirclePrimitiveSurface) and isinstance(surface_b, RectPrimitiveSurface):
-        return detect_circle_vs_rect(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, RectPrimitiveSurface) and isinstance(surface_b, CirclePrimitiveSurface):
-        return detect_rect_vs_circle(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, RectPrimitiveSurface) and isinstance(surface_b, RectPrimitiveSurface):
-        return detect_rect_vs_rect(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, RectPrimitiveSurface) and isinstance(surface_b, RotatedRectPrimitiveSurface):
-        return detect_rect_vs_rotated_rect(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, RotatedRectPrimitiveSurface) and isinstance(surface_b, RectPrimitiveSurface):
-        return detect_rotated_rect_vs_rect(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, RotatedRectPrimitiveSurface) and isinstance(surface_b, RotatedRectPrimitiveSurface):
-        return detect_rotated_rect_vs_rotated_rect(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, CirclePrimitiveSurface) and isinstance(surface_b, RotatedRectPrimitiveSurface):
-        return detect_circle_vs_rotated_rect(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, RotatedRectPrimitiveSurface) and isinstance(surface_b, CirclePrimitiveSurface):
-        return detect_rotated_rect_vs_circle(pos_a, surface_a, pos_b, surface_b)
-    raise ValueError(f"Unsupported primitive surfaces: {type(surface_a)} and {type(surface_b)}")
+    return _dispatch(_DETECTORS, type(surface_a), type(surface_b))(pos_a, surface_a, pos_b, surface_b)
 
 
 def resolve_collision(
@@ -82,25 +45,25 @@ def resolve_collision(
         (detected, correction_pos_a, correction_pos_b)
         correction vectors separate A from B; if no collision both vectors are zero.
     """
-    if isinstance(surface_a, CirclePrimitiveSurface) and isinstance(surface_b, CirclePrimitiveSurface):
-        return resolve_circle_vs_circle(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, CirclePrimitiveSurface) and isinstance(surface_b, RectPrimitiveSurface):
-        return resolve_circle_vs_rect(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, RectPrimitiveSurface) and isinstance(surface_b, CirclePrimitiveSurface):
-        return resolve_rect_vs_circle(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, RectPrimitiveSurface) and isinstance(surface_b, RectPrimitiveSurface):
-        return resolve_rect_vs_rect(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, RectPrimitiveSurface) and isinstance(surface_b, RotatedRectPrimitiveSurface):
-        return resolve_rect_vs_rotated_rect(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, RotatedRectPrimitiveSurface) and isinstance(surface_b, RectPrimitiveSurface):
-        return resolve_rotated_rect_vs_rect(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, RotatedRectPrimitiveSurface) and isinstance(surface_b, RotatedRectPrimitiveSurface):
-        return resolve_rotated_rect_vs_rotated_rect(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, CirclePrimitiveSurface) and isinstance(surface_b, RotatedRectPrimitiveSurface):
-        return resolve_circle_vs_rotated_rect(pos_a, surface_a, pos_b, surface_b)
-    if isinstance(surface_a, RotatedRectPrimitiveSurface) and isinstance(surface_b, CirclePrimitiveSurface):
-        return resolve_rotated_rect_vs_circle(pos_a, surface_a, pos_b, surface_b)
-    raise ValueError(f"Unsupported primitive surfaces: {type(surface_a)} and {type(surface_b)}")
+    return _dispatch(_RESOLVERS, type(surface_a), type(surface_b))(pos_a, surface_a, pos_b, surface_b)
+
+
+def _dispatch(table: dict[tuple[type, type], Callable], type_a: type, type_b: type) -> Callable:
+    """Look up the function for a pair of surface types.
+
+    Subclasses (e.g. graphic surfaces) are resolved once through their MRO and
+    cached in the table.
+    """
+    function = table.get((type_a, type_b))
+    if function is not None:
+        return function
+    for base_a in type_a.__mro__:
+        for base_b in type_b.__mro__:
+            function = table.get((base_a, base_b))
+            if function is not None:
+                table[(type_a, type_b)] = function
+                return function
+    raise ValueError(f"Unsupported primitive surfaces: {type_a} and {type_b}")
 
 
 def detect_circle_vs_circle(pos_a: Vector, circle_a: CirclePrimitiveSurface, pos_b: Vector, circle_b: CirclePrimitiveSurface) -> bool:
@@ -119,15 +82,51 @@ def resolve_circle_vs_circle(
     if dist_sq > combined_radius * combined_radius:
         return _no_collision()
 
-    distance = math.sqrt(dist_sq) if dist_sq != 0 else 0
-    if distance == 0:
+    if dist_sq == 0:
         normal = Vector.random_unit_vector()
+        mtv = Vector(normal.x * combined_radius, normal.y * combined_radius)
     else:
-        normal = Vector(dx / distance, dy / distance)
+        distance = math.sqrt(dist_sq)
+        scale = (combined_radius - distance) / distance
+        mtv = Vector(dx * scale, dy * scale)
+    return True, mtv, Vector(-mtv.x, -mtv.y)
 
-    penetration_depth = combined_radius - distance
-    mtv = normal * penetration_depth
-    return True, mtv, -mtv
+
+def detect_circle_vs_circle_batch(
+    index_a: np.ndarray, index_b: np.ndarray, positions: np.ndarray, radii: np.ndarray
+) -> np.ndarray:
+    delta = positions[index_a] - positions[index_b]
+    combined_radius = radii[index_a] + radii[index_b]
+    return np.einsum("ij,ij->i", delta, delta) <= combined_radius * combined_radius
+
+
+def resolve_circle_vs_circle_batch(
+    index_a: np.ndarray, index_b: np.ndarray, positions: np.ndarray, radii: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized resolve_circle_vs_circle over many pairs.
+
+    Pair k is the circle at positions[index_a[k]] against the one at positions[index_b[k]].
+
+    Returns:
+        (detected, mtv) where mtv[k] is the correction of A for pair k (B gets -mtv[k]);
+        rows without collision are zero.
+    """
+    delta = positions[index_a] - positions[index_b]
+    combined_radius = radii[index_a] + radii[index_b]
+    dist_sq = np.einsum("ij,ij->i", delta, delta)
+    detected = dist_sq <= combined_radius * combined_radius
+
+    mtv = np.zeros_like(delta)
+    distance = np.sqrt(dist_sq)
+    separated = detected & (distance != 0)
+    scale = (combined_radius[separated] - distance[separated]) / distance[separated]
+    mtv[separated] = delta[separated] * scale[:, np.newaxis]
+
+    # concentric circles: same random normal as the reference implementation
+    for k in np.flatnonzero(detected & (distance == 0)):
+        mtv[k] = (Vector.random_unit_vector() * combined_radius[k]).to_tuple()
+
+    return detected, mtv
 
 
 def detect_rect_vs_rect(pos_a: Vector, rect_a: RectPrimitiveSurface, pos_b: Vector, rect_b: RectPrimitiveSurface) -> bool:
@@ -140,8 +139,8 @@ def resolve_rect_vs_rect(
 ) -> CollisionResult:
     dx = pos_b.x - pos_a.x
     dy = pos_b.y - pos_a.y
-    px = (rect_a.width / 2 + rect_b.width / 2) - abs(dx)
-    py = (rect_a.height / 2 + rect_b.height / 2) - abs(dy)
+    px = (rect_a.half_width + rect_b.half_width) - abs(dx)
+    py = (rect_a.half_height + rect_b.half_height) - abs(dy)
 
     if px <= 0 or py <= 0:
         return _no_collision()
@@ -169,8 +168,8 @@ def resolve_circle_vs_rect(
 ) -> CollisionResult:
     cx, cy = pos_circle.x, pos_circle.y
 
-    half_w = rect.width / 2
-    half_h = rect.height / 2
+    half_w = rect.half_width
+    half_h = rect.half_height
 
     left = pos_rect.x - half_w
     right = pos_rect.x + half_w
@@ -232,10 +231,7 @@ def detect_rect_vs_rotated_rect(
 def resolve_rect_vs_rotated_rect(
     pos_rect: Vector, rect: RectPrimitiveSurface, pos_rot: Vector, rot_rect: RotatedRectPrimitiveSurface
 ) -> CollisionResult:
-    detected, mtv = _sat_penetration_rotated_rects(
-        pos_rect, rect.width, rect.height, 0.0,
-        pos_rot, rot_rect.width, rot_rect.height, rot_rect.rotation
-    )
+    detected, mtv = _sat_penetration(pos_rect, rect, pos_rot, rot_rect)
     if not detected:
         return _no_collision()
     return True, mtv, -mtv
@@ -251,10 +247,7 @@ def detect_rotated_rect_vs_rect(
 def resolve_rotated_rect_vs_rect(
     pos_rot: Vector, rot_rect: RotatedRectPrimitiveSurface, pos_rect: Vector, rect: RectPrimitiveSurface
 ) -> CollisionResult:
-    detected, mtv = _sat_penetration_rotated_rects(
-        pos_rot, rot_rect.width, rot_rect.height, rot_rect.rotation,
-        pos_rect, rect.width, rect.height, 0.0
-    )
+    detected, mtv = _sat_penetration(pos_rot, rot_rect, pos_rect, rect)
     if not detected:
         return _no_collision()
     return True, mtv, -mtv
@@ -270,10 +263,7 @@ def detect_rotated_rect_vs_rotated_rect(
 def resolve_rotated_rect_vs_rotated_rect(
     pos_a: Vector, rect_a: RotatedRectPrimitiveSurface, pos_b: Vector, rect_b: RotatedRectPrimitiveSurface
 ) -> CollisionResult:
-    detected, mtv = _sat_penetration_rotated_rects(
-        pos_a, rect_a.width, rect_a.height, rect_a.rotation,
-        pos_b, rect_b.width, rect_b.height, rect_b.rotation
-    )
+    detected, mtv = _sat_penetration(pos_a, rect_a, pos_b, rect_b)
     if not detected:
         return _no_collision()
     return True, mtv, -mtv
@@ -289,16 +279,15 @@ def detect_circle_vs_rotated_rect(
 def resolve_circle_vs_rotated_rect(
     pos_circle: Vector, circle: CirclePrimitiveSurface, pos_rect: Vector, rect: RotatedRectPrimitiveSurface
 ) -> CollisionResult:
-    angle = rect.rotation
-    cos_a = math.cos(angle)
-    sin_a = math.sin(angle)
+    cos_a = rect.cos_rotation
+    sin_a = rect.sin_rotation
 
     rel_x = pos_circle.x - pos_rect.x
     rel_y = pos_circle.y - pos_rect.y
     local_x = rel_x * cos_a + rel_y * sin_a
     local_y = -rel_x * sin_a + rel_y * cos_a
 
-    hw, hh = rect.width / 2, rect.height / 2
+    hw, hh = rect.half_width, rect.half_height
     clamped_x = max(-hw, min(local_x, hw))
     clamped_y = max(-hh, min(local_y, hh))
 
@@ -348,49 +337,134 @@ def resolve_rotated_rect_vs_circle(
     return True, mtv_rect, mtv_circle
 
 
-def _sat_penetration_rotated_rects(
-    pos_a: Vector, width_a: float, height_a: float, rotation_a: float,
-    pos_b: Vector, width_b: float, height_b: float, rotation_b: float
+def raycast(origin: Vector, direction: Vector, pos: Vector, surface: PrimitiveSurface) -> float | None:
+    """Distance along a unit direction to the first hit with the surface, None on a miss.
+
+    A ray starting inside the surface hits at distance 0.
+    """
+    function = _RAYCASTERS.get(type(surface))
+    if function is None:
+        for base in type(surface).__mro__:
+            function = _RAYCASTERS.get(base)
+            if function is not None:
+                _RAYCASTERS[type(surface)] = function
+                break
+        else:
+            raise ValueError(f"Unsupported surface type for raycast: {type(surface)}")
+    return function(origin.x - pos.x, origin.y - pos.y, direction.x, direction.y, surface)
+
+
+def raycast_circle(ox: float, oy: float, dx: float, dy: float, circle: CirclePrimitiveSurface) -> float | None:
+    b = ox * dx + oy * dy
+    c = ox * ox + oy * oy - circle.radius * circle.radius
+    if c <= 0:
+        return 0.0
+    if b > 0:
+        return None
+    discriminant = b * b - c
+    if discriminant < 0:
+        return None
+    return -b - math.sqrt(discriminant)
+
+
+def raycast_rect(ox: float, oy: float, dx: float, dy: float, rect: RectPrimitiveSurface) -> float | None:
+    return _raycast_slabs(ox, oy, dx, dy, rect.half_width, rect.half_height)
+
+
+def raycast_rotated_rect(
+    ox: float, oy: float, dx: float, dy: float, rect: RotatedRectPrimitiveSurface
+) -> float | None:
+    cos_a, sin_a = rect.cos_rotation, rect.sin_rotation
+    return _raycast_slabs(
+        ox * cos_a + oy * sin_a, -ox * sin_a + oy * cos_a,
+        dx * cos_a + dy * sin_a, -dx * sin_a + dy * cos_a,
+        rect.half_width, rect.half_height,
+    )
+
+
+def _raycast_slabs(ox: float, oy: float, dx: float, dy: float, half_width: float, half_height: float) -> float | None:
+    """Slab test of a ray in the local frame of a box centered on the origin."""
+    t_near, t_far = 0.0, math.inf
+    for origin, direction, half in ((ox, dx, half_width), (oy, dy, half_height)):
+        if direction == 0:
+            if abs(origin) > half:
+                return None
+            continue
+        t1 = (-half - origin) / direction
+        t2 = (half - origin) / direction
+        if t1 > t2:
+            t1, t2 = t2, t1
+        t_near = max(t_near, t1)
+        t_far = min(t_far, t2)
+        if t_near > t_far:
+            return None
+    return t_near
+
+
+def _sat_penetration(
+    pos_a: Vector, rect_a: RectPrimitiveSurface | RotatedRectPrimitiveSurface,
+    pos_b: Vector, rect_b: RectPrimitiveSurface | RotatedRectPrimitiveSurface,
 ) -> tuple[bool, Vector]:
-    """Separating Axis Test between two oriented rectangles."""
-    axes_a = _get_axes(rotation_a)
-    axes_b = _get_axes(rotation_b)
-    axes = axes_a + axes_b
-    delta = pos_b - pos_a
+    """Separating Axis Test between two oriented rectangles, using their cached axes."""
+    (a1x, a1y), (a2x, a2y) = rect_a.axes
+    (b1x, b1y), (b2x, b2y) = rect_b.axes
+    hw_a, hh_a = rect_a.half_width, rect_a.half_height
+    hw_b, hh_b = rect_b.half_width, rect_b.half_height
+    dx = pos_b.x - pos_a.x
+    dy = pos_b.y - pos_a.y
 
     min_overlap = float("inf")
-    min_axis: Vector | None = None
+    min_axis: tuple[float, float] | None = None
 
-    for axis in axes:
-        distance = abs(delta.dot(axis))
-        overlap = _get_extent(axis, width_a, height_a, rotation_a) + _get_extent(axis, width_b, height_b, rotation_b) - distance
+    for axis_x, axis_y in ((a1x, a1y), (a2x, a2y), (b1x, b1y), (b2x, b2y)):
+        projection = dx * axis_x + dy * axis_y
+        extent_a = hw_a * abs(axis_x * a1x + axis_y * a1y) + hh_a * abs(axis_x * a2x + axis_y * a2y)
+        extent_b = hw_b * abs(axis_x * b1x + axis_y * b1y) + hh_b * abs(axis_x * b2x + axis_y * b2y)
+        overlap = extent_a + extent_b - abs(projection)
         if overlap <= 0:
             return False, Vector.zero()
         if overlap < min_overlap:
             min_overlap = overlap
-            direction = 1 if delta.dot(axis) < 0 else -1
-            min_axis = Vector(axis.x * direction, axis.y * direction)
+            direction = 1 if projection < 0 else -1
+            min_axis = (axis_x * direction, axis_y * direction)
 
     if min_axis is None:
         return False, Vector.zero()
 
-    penetration = min_axis * min_overlap
-    return True, penetration
-
-
-def _get_axes(rotation: float) -> tuple[Vector, Vector]:
-    cos_a = math.cos(rotation)
-    sin_a = math.sin(rotation)
-    return Vector(cos_a, sin_a), Vector(-sin_a, cos_a)
-
-
-def _get_extent(axis: Vector, width: float, height: float, rotation: float) -> float:
-    hw = width / 2
-    hh = height / 2
-    ax1, ax2 = _get_axes(rotation)
-    return hw * abs(axis.dot(ax1)) + hh * abs(axis.dot(ax2))
+    return True, Vector(min_axis[0] * min_overlap, min_axis[1] * min_overlap)
 
 
 def _no_collision() -> CollisionResult:
     zero = Vector.zero()
     return False, zero, zero
+
+
+_DETECTORS: dict[tuple[type, type], Callable[..., bool]] = {
+    (CirclePrimitiveSurface, CirclePrimitiveSurface): detect_circle_vs_circle,
+    (CirclePrimitiveSurface, RectPrimitiveSurface): detect_circle_vs_rect,
+    (RectPrimitiveSurface, CirclePrimitiveSurface): detect_rect_vs_circle,
+    (RectPrimitiveSurface, RectPrimitiveSurface): detect_rect_vs_rect,
+    (RectPrimitiveSurface, RotatedRectPrimitiveSurface): detect_rect_vs_rotated_rect,
+    (RotatedRectPrimitiveSurface, RectPrimitiveSurface): detect_rotated_rect_vs_rect,
+    (RotatedRectPrimitiveSurface, RotatedRectPrimitiveSurface): detect_rotated_rect_vs_rotated_rect,
+    (CirclePrimitiveSurface, RotatedRectPrimitiveSurface): detect_circle_vs_rotated_rect,
+    (RotatedRectPrimitiveSurface, CirclePrimitiveSurface): detect_rotated_rect_vs_circle,
+}
+
+_RESOLVERS: dict[tuple[type, type], Callable[..., CollisionResult]] = {
+    (CirclePrimitiveSurface, CirclePrimitiveSurface): resolve_circle_vs_circle,
+    (CirclePrimitiveSurface, RectPrimitiveSurface): resolve_circle_vs_rect,
+    (RectPrimitiveSurface, CirclePrimitiveSurface): resolve_rect_vs_circle,
+    (RectPrimitiveSurface, RectPrimitiveSurface): resolve_rect_vs_rect,
+    (RectPrimitiveSurface, RotatedRectPrimitiveSurface): resolve_rect_vs_rotated_rect,
+    (RotatedRectPrimitiveSurface, RectPrimitiveSurface): resolve_rotated_rect_vs_rect,
+    (RotatedRectPrimitiveSurface, RotatedRectPrimitiveSurface): resolve_rotated_rect_vs_rotated_rect,
+    (CirclePrimitiveSurface, RotatedRectPrimitiveSurface): resolve_circle_vs_rotated_rect,
+    (RotatedRectPrimitiveSurface, CirclePrimitiveSurface): resolve_rotated_rect_vs_circle,
+}
+
+_RAYCASTERS: dict[type, Callable[..., float | None]] = {
+    CirclePrimitiveSurface: raycast_circle,
+    RectPrimitiveSurface: raycast_rect,
+    RotatedRectPrimitiveSurface: raycast_rotated_rect,
+}
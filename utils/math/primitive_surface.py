@@ -1,19 +1,49 @@
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
+
+
+Axis = tuple[float, float]
+
+_IDENTITY_AXES: tuple[Axis, Axis] = ((1.0, 0.0), (0.0, 1.0))
 
 
 class PrimitiveSurface:
     pass
 
 
+# Derived geometry (half sizes, SAT axes, local AABB extents) is computed once in
+# __post_init__ and stored on the frozen instance, it is not part of init/eq/repr.
+def _derived():
+    return field(init=False, repr=False, compare=False)
+
+
 @dataclass(frozen=True, slots=True)
 class RectPrimitiveSurface(PrimitiveSurface):
     width: float
     height: float
+    half_width: float = _derived()
+    half_height: float = _derived()
+    axes: tuple[Axis, Axis] = _derived()
+    extent_x: float = _derived()
+    extent_y: float = _derived()
+
+    def __post_init__(self):
+        object.__setattr__(self, "half_width", self.width / 2)
+        object.__setattr__(self, "half_height", self.height / 2)
+        object.__setattr__(self, "axes", _IDENTITY_AXES)
+        object.__setattr__(self, "extent_x", self.width / 2)
+        object.__setattr__(self, "extent_y", self.height / 2)
 
 
 @dataclass(frozen=True, slots=True)
 class CirclePrimitiveSurface(PrimitiveSurface):
     radius: float
+    extent_x: float = _derived()
+    extent_y: float = _derived()
+
+    def __post_init__(self):
+        object.__setattr__(self, "extent_x", self.radius)
+        object.__setattr__(self, "extent_y", self.radius)
 
 
 @dataclass(frozen=True, slots=True)
@@ -21,3 +51,21 @@ class RotatedRectPrimitiveSurface(PrimitiveSurface):
     width: float
     height: float
     rotation: float
+    half_width: float = _derived()
+    half_height: float = _derived()
+    cos_rotation: float = _derived()
+    sin_rotation: float = _derived()
+    axes: tuple[Axis, Axis] = _derived()
+    extent_x: float = _derived()
+    extent_y: float = _derived()
+
+    def __post_init__(self):
+        half_width, half_height = self.width / 2, self.height / 2
+        cos_a, sin_a = math.cos(self.rotation), math.sin(self.rotation)
+        object.__setattr__(self, "half_width", half_width)
+        object.__setattr__(self, "half_height", half_height)
+        object.__setattr__(self, "cos_rotation", cos_a)
+        object.__setattr__(self, "sin_rotation", sin_a)
+        object.__setattr__(self, "axes", ((cos_a, sin_a), (-sin_a, cos_a)))
+        object.__setattr__(self, "extent_x", half_width * abs(cos_a) + half_height * abs(sin_a))
+        object.__setattr__(self, "extent_y", half_width * abs(sin_a) + half_height * abs(cos_a))
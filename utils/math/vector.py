@@ -51,6 +51,10 @@ class Vector:
     def length(self) -> float:
         return math.sqrt(self.x**2 + self.y**2)
 
+    @property
+    def length_squared(self) -> float:
+        return self.x * self.x + self.y * self.y
+
     @property
     def arg(self) -> float:
         return math.atan2(self.y, self.x)
@@ -108,4 +112,134 @@ class Vector:
         return f"Vector({self.x}, {self.y})"
 
     def __repr__(self) -> str:
-        return f"Vector({self.x}, {self.y})"
\ No newline at end of file
+        return f"Vector({self.x}, {self.y})"
+
+
+class MutableVector:
+    """Slot-based mutable 2D vector for hot loops.
+
+    In-place operators update the instance instead of allocating, and the fused
+    helpers (add_scaled, sub_scaled) accept Vector or MutableVector operands.
+    Use to_vector() to hand the result back to code expecting a Vector.
+    """
+
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: float = 0.0, y: float = 0.0):
+        self.x = x
+        self.y = y
+
+    @staticmethod
+    def from_vector(vector: Union[Vector, "MutableVector"]) -> "MutableVector":
+        return MutableVector(vector.x, vector.y)
+
+    def to_vector(self) -> Vector:
+        return Vector(self.x, self.y)
+
+    def to_tuple(self) -> tuple[float, float]:
+        return self.x, self.y
+
+    def set(self, x: float, y: float) -> "MutableVector":
+        self.x = x
+        self.y = y
+        return self
+
+    def set_zero(self) -> "MutableVector":
+        self.x = 0.0
+        self.y = 0.0
+        return self
+
+    def add_scaled(self, other: Union[Vector, "MutableVector"], scale: float) -> "MutableVector":
+        self.x += other.x * scale
+        self.y += other.y * scale
+        return self
+
+    def sub_scaled(self, other: Union[Vector, "MutableVector"], scale: float) -> "MutableVector":
+        self.x -= other.x * scale
+        self.y -= other.y * scale
+        return self
+
+    def scale(self, factor: float) -> "MutableVector":
+        self.x *= factor
+        self.y *= factor
+        return self
+
+    def normalize(self) -> "MutableVector":
+        length = math.sqrt(self.x * self.x + self.y * self.y)
+        if length != 0:
+            self.x /= length
+            self.y /= length
+        return self
+
+    def clamp_length(self, max_length: float) -> "MutableVector":
+        length_squared = self.x * self.x + self.y * self.y
+        if length_squared > max_length * max_length:
+            factor = max_length / math.sqrt(length_squared)
+            self.x *= factor
+            self.y *= factor
+        return self
+
+    def dot(self, other: Union[Vector, "MutableVector"]) -> float:
+        return self.x * other.x + self.y * other.y
+
+    @property
+    def length(self) -> float:
+        return math.sqrt(self.x * self.x + self.y * self.y)
+
+    @property
+    def length_squared(self) -> float:
+        return self.x * self.x + self.y * self.y
+
+    def __iadd__(self, other: Union[Vector, "MutableVector", int, float]) -> "MutableVector":
+        if isinstance(other, (int, float)):
+            self.x += other
+            self.y += other
+        elif isinstance(other, (Vector, MutableVector)):
+            self.x += other.x
+            self.y += other.y
+        else:
+            raise TypeError(f"Unsupported operand type for +=: {type(other)}")
+        return self
+
+    def __isub__(self, other: Union[Vector, "MutableVector", int, float]) -> "MutableVector":
+        if isinstance(other, (int, float)):
+            self.x -= other
+            self.y -= other
+        elif isinstance(other, (Vector, MutableVector)):
+            self.x -= other.x
+            self.y -= other.y
+        else:
+            raise TypeError(f"Unsupported operand type for -=: {type(other)}")
+        return self
+
+    def __imul__(self, other: Union[Vector, "MutableVector", int, float]) -> "MutableVector":
+        if isinstance(other, (int, float)):
+            self.x *= other
+            self.y *= other
+        elif isinstance(other, (Vector, MutableVector)):
+            self.x *= other.x
+            self.y *= other.y
+        else:
+            raise TypeError(f"Unsupported operand type for *=: {type(other)}")
+        return self
+
+    def __itruediv__(self, other: Union[Vector, "MutableVector", int, float]) -> "MutableVector":
+        if isinstance(other, (int, float)):
+            self.x /= other
+            self.y /= other
+        elif isinstance(other, (Vector, MutableVector)):
+            self.x /= other.x
+            self.y /= other.y
+        else:
+            raise TypeError(f"Unsupported operand type for /=: {type(other)}")
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Vector, MutableVector)):
+            return self.x == other.x and self.y == other.y
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"MutableVector({self.x}, {self.y})"
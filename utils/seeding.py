@@ -0,0 +1,9 @@
+import random
+
+import numpy as np
+
+
+def seed_all(seed: int) -> None:
+    """Seed the random module and numpy's global generator."""
+    random.seed(seed)
+    np.random.seed(seed % 2 ** 32)